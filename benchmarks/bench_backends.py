@@ -0,0 +1,50 @@
+"""
+Compare the float and the integer cents backend of the batch amortization and
+the base cost arrays.
+
+    python benchmarks/bench_backends.py [n_loans]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+from eploan import loan
+from eploan.immo import costs
+
+
+def main(n_loans: int = 10_000, repeat: int = 5) -> None:
+    rng = np.random.default_rng(42)
+    prices = np.round(rng.uniform(100_000, 1_000_000, n_loans), 2)
+    rates = np.round(rng.uniform(0.01, 0.06, n_loans), 4)
+    amounts = costs.base_cost_arrays(prices)["loan"]
+    annuities = np.round(amounts * (rates + 0.02), 2)
+    periods = np.full(n_loans, 30)
+
+    for backend in ("float", "cents"):
+        schedule_time = min(
+            timeit.repeat(
+                lambda: loan.batch.amortize(amounts, rates, annuities, periods, backend=backend),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        cost_time = min(
+            timeit.repeat(
+                lambda: costs.base_cost_arrays(prices, backend=backend),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(
+            f"{backend:>5}: amortize {schedule_time * 1e3:8.2f} ms, "
+            f"base cost {cost_time * 1e3:8.2f} ms ({n_loans} loans, 30 periods)"
+        )
+
+    float_rest = loan.batch.rest_dept(amounts, rates, periods, annuities)
+    cents_rest = loan.batch.rest_dept(amounts, rates, periods, annuities, backend="cents")
+    print(f"max rest debt difference: {np.abs(float_rest - cents_rest).max():.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -1,4 +1,16 @@
+__version__ = "0.1.0"
+
 from . import calculators
 from . import loan
 from . import immo
+from . import portfolio
+from . import ingest
+from . import cache
+from . import optimize
+from . import screening
+from . import export
+from . import opportunity
+from . import backtest
+from . import parallel
+from . import report
 from .start_immo import start_immo
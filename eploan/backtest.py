@@ -0,0 +1,139 @@
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from . import loan
+
+
+def read_rate_series(
+    path: str | Path,
+    date_column: str = "date",
+    rate_column: str = "rate",
+    percent: bool = True,
+    **read_csv_kwargs,
+) -> pd.Series:
+    """
+    Read a local csv of mortgage rates into a monthly series (month start
+    index). Gaps are filled with the last known rate, percent values are
+    converted to rates.
+    """
+    df = pd.read_csv(path, usecols=[date_column, rate_column], **read_csv_kwargs)
+    rates = pd.Series(
+        df[rate_column].to_numpy(dtype=float),
+        index=pd.to_datetime(df[date_column]),
+        name="Rate",
+    ).sort_index()
+    rates = rates.resample("MS").last().ffill()
+    if percent:
+        rates = rates / 100
+    return rates
+
+
+def backtest_arrays(
+    rates,
+    loan_amount: float,
+    repayment_rate: float,
+    fixed_years: int,
+    horizon_years: int,
+) -> dict[str, np.ndarray]:
+    """
+    Amortize the loan for every start month of a monthly rate series. The rate
+    is fixed for fixed_years, then the rest debt is refinanced at the rate of
+    that month. The annuity is kept unless it falls below the interest plus the
+    initial repayment rate on the rest debt, then it is raised. The windows are
+    strided views of the series, the loop only runs over the fixed rate
+    segments and handles all start months at once.
+    """
+    if fixed_years < 1 or horizon_years < 1:
+        raise ValueError("The fixed rate and the horizon must be at least one year")
+    rates = np.asarray(rates, dtype=float)
+    horizon_months = 12 * horizon_years
+    if len(rates) < horizon_months:
+        raise ValueError("The rate series is shorter than the horizon")
+
+    windows = sliding_window_view(rates, horizon_months)
+    segment_rates = windows[:, :: 12 * fixed_years]
+    n_starts, n_segments = segment_rates.shape
+
+    rest = np.full(n_starts, float(loan_amount))
+    interest = np.zeros(n_starts)
+    annuities = np.zeros((n_starts, n_segments))
+    paid_off = np.full(n_starts, np.nan)
+    for segment in range(n_segments):
+        years = min(fixed_years, horizon_years - segment * fixed_years)
+        rate = segment_rates[:, segment]
+        annuity = np.where(
+            rest > 0,
+            np.fmax(
+                annuities[:, segment - 1] if segment else 0,
+                loan.batch.annuity_from_repayment_rate(rest, rate, repayment_rate),
+            ),
+            0,
+        )
+        # stop at the year the loan is paid off
+        payoff = np.ceil(loan.batch.loan_period(rest, annuity, rate))
+        periods = np.where(rest > 0, np.fmin(payoff, years), 0)
+        schedules = loan.batch.amortize(rest, rate, annuity, periods.astype(np.int64))
+
+        interest += schedules.interest.sum(axis=-1)
+        annuities[:, segment] = annuity
+        done = np.isnan(paid_off) & (rest > 0) & (payoff <= years)
+        paid_off = np.where(done, segment * fixed_years + payoff, paid_off)
+        rest = np.clip(schedules.rest_dept, 0, None)
+
+    return {
+        "segment_rates": segment_rates,
+        "annuities": annuities,
+        "interest": interest,
+        "rest_dept": rest,
+        "paid_off": paid_off,
+    }
+
+
+def backtest(
+    rates: pd.Series,
+    loan_amount: float,
+    repayment_rate: float,
+    fixed_years: int = 10,
+    horizon_years: int = 30,
+) -> pd.DataFrame:
+    """backtest_arrays as a frame indexed by the start month"""
+    result = backtest_arrays(
+        rates.to_numpy(), loan_amount, repayment_rate, fixed_years, horizon_years
+    )
+    annuities = result["annuities"]
+    return pd.DataFrame(
+        {
+            "Initial Rate": result["segment_rates"][:, 0],
+            "Initial Annuity": annuities[:, 0],
+            "Max Annuity": annuities.max(axis=1),
+            "Interest": result["interest"],
+            "Rest Dept": result["rest_dept"],
+            "Paid Off": result["paid_off"],
+        },
+        index=pd.Index(rates.index[: len(annuities)], name="Start"),
+    )
+
+
+def backtest_mortgage(
+    mortgage: loan.Mortgage,
+    rates: pd.Series,
+    fixed_years: Optional[int] = None,
+    horizon_years: int = 30,
+) -> pd.DataFrame:
+    """
+    backtest with the amount and annuity of a mortgage, fixed for its period.
+    The repayment rate is derived from the annuity, the stored one is only set
+    by the update methods.
+    """
+    return backtest(
+        rates,
+        mortgage.amount,
+        loan.repayment_rate_from_annuity(
+            mortgage.amount, mortgage.interest_rate, mortgage.annuity),
+        fixed_years=mortgage.period if fixed_years is None else fixed_years,
+        horizon_years=horizon_years,
+    )
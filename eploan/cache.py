@@ -0,0 +1,246 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from . import __version__
+from . import calculators
+
+
+def _canonical(value):
+    """numbers as floats so that equal ints and floats give the same key"""
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def cache_key(
+    prop_data: dict,
+    interest_rate: float,
+    annuity: Optional[float] = None,
+    repayment_rate: Optional[float] = None,
+    period: Optional[float] = None,
+) -> str:
+    """canonical hash of the inputs of a calc_property_by_* call"""
+    payload = json.dumps(
+        _canonical(
+            {
+                "prop_data": prop_data,
+                "interest_rate": interest_rate,
+                "annuity": annuity,
+                "repayment_rate": repayment_rate,
+                "period": period,
+                "version": __version__,
+            }
+        ),
+        sort_keys=True,
+        separators=(",", ":"),
+        default=float,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Disk cache of the calculator results (eval_dict and mortgage summary) in a
+    sqlite file. The entries are evicted least recently used first once there
+    are more than max_entries. Several processes can share the same file.
+    Lookups only read, the access times and hit counters are kept in memory
+    and written with the next put, stats, close or every flush_every lookups.
+    """
+
+    flush_every = 256
+
+    def __init__(self, path: str | Path, max_entries: int = 100_000, timeout: float = 30):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._touched: dict[str, float] = {}
+        self._counts = {"hits": 0, "misses": 0}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared with forked processes
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            if self._pid is not None:
+                # pending writes of the parent are written by the parent
+                self._discard_pending()
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None and self._pid == os.getpid():
+            self.flush()
+            self._connection.close()
+        self._connection = None
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        return {
+            **self.__dict__,
+            "_connection": None,
+            "_pid": None,
+            "_touched": {},
+            "_counts": {"hits": 0, "misses": 0},
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _discard_pending(self) -> None:
+        self._touched = {}
+        self._counts = {"hits": 0, "misses": 0}
+
+    def _write_pending(self, connection: sqlite3.Connection) -> None:
+        connection.executemany(
+            "UPDATE results SET last_access = MAX(last_access, ?) WHERE key = ?",
+            [(last_access, key) for key, last_access in self._touched.items()],
+        )
+        for name, count in self._counts.items():
+            if count:
+                connection.execute(
+                    "INSERT INTO counters (name, value) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                    (name, count),
+                )
+
+    def flush(self) -> None:
+        """write the pending access times and hit counters"""
+        if not self._touched and not any(self._counts.values()):
+            return
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._write_pending(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._discard_pending()
+
+    def get(self, key: str) -> Optional[dict]:
+        row = self.connection.execute(
+            "SELECT value FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            self._counts["misses"] += 1
+        else:
+            self.hits += 1
+            self._counts["hits"] += 1
+            self._touched[key] = time.time()
+        if sum(self._counts.values()) >= self.flush_every:
+            self.flush()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, key: str, value: dict) -> None:
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # the eviction must see the access times of the last lookups
+            self._write_pending(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, last_access) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=float), time.time()),
+            )
+            (count,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+            if count > self.max_entries:
+                connection.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY last_access ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._discard_pending()
+
+    def calc_property(
+        self,
+        prop_data: dict,
+        interest_rate: float,
+        annuity: Optional[float] = None,
+        repayment_rate: Optional[float] = None,
+        period: Optional[float] = None,
+    ) -> dict:
+        """
+        Cached result of calc_property_by_annuity/_repayment_rate/_period with
+        the keys "eval" (eval_dict) and "mortgage" (summary_dict).
+        """
+        given = {
+            "annuity": annuity,
+            "repayment_rate": repayment_rate,
+            "period": period,
+        }
+        given = {name: value for name, value in given.items() if value is not None}
+        if len(given) != 1:
+            raise ValueError("Specify exactly one of annuity, repayment_rate or period")
+
+        key = cache_key(prop_data, interest_rate, annuity, repayment_rate, period)
+        result = self.get(key)
+        if result is not None:
+            return result
+
+        ((name, value),) = given.items()
+        calculator = getattr(calculators, f"calc_property_by_{name}")
+        cur_immo = calculator(prop_data, interest_rate, value)
+        result = {
+            "eval": cur_immo.eval_dict(),
+            "mortgage": cur_immo.mortgage.summary_dict(),
+        }
+        self.put(key, result)
+        return result
+
+    def stats(self) -> dict:
+        """hit statistics of this instance and of all processes using the file"""
+        self.flush()
+        counters = dict(self.connection.execute("SELECT name, value FROM counters").fetchall())
+        (entries,) = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        total_hits = counters.get("hits", 0)
+        total_lookups = total_hits + counters.get("misses", 0)
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "total_hits": total_hits,
+            "total_misses": counters.get("misses", 0),
+            "total_hit_rate": total_hits / total_lookups if total_lookups else 0.0,
+            "entries": entries,
+        }
+
+    def clear(self) -> None:
+        self._discard_pending()
+        self.connection.execute("DELETE FROM results")
+        self.connection.execute("DELETE FROM counters")
+        self.hits = 0
+        self.misses = 0
@@ -5,20 +5,40 @@ from . import loan
 from . import immo
 
 
+def _get_base_cost(base_cost_data: dict, details: immo.Details) -> immo.BaseCost:
+    """
+    Create the base cost, the property buy tax rate defaults to the rate of the
+    federal state of the postal code if it is not given.
+    """
+    if "property_buy_tax_rate" not in base_cost_data and details.postal_code:
+        base_cost_data = {
+            **base_cost_data,
+            "property_buy_tax_rate": immo.property_buy_tax.rate_from_postal_code(
+                details.postal_code
+            ),
+        }
+    return immo.BaseCost(**base_cost_data)
+
+
+def parse_property(
+    prop_data: dict,
+) -> tuple[immo.Details, immo.BaseCost, immo.CashFlow]:
+    """
+    Parse the property data into details, base cost and cash flow.
+    """
+    details = immo.Details(**prop_data["details"])
+    base_cost = _get_base_cost(prop_data["base_cost"], details)
+    cash_flow = immo.get_cashflow(**prop_data["cash_flow"])
+    return details, base_cost, cash_flow
+
+
 def calc_property_by_repayment_rate(
     prop_data: dict, interest_rate: float, repayment_rate: float
 ) -> immo.Immo:
     """
     Calculate the property object from the property data and the credit and repay rates.
     """
-    # get the details
-    details = immo.Details(**prop_data["details"])
-
-    # get the base cost
-    base_cost = immo.BaseCost(**prop_data["base_cost"])
-
-    # get the cash flow
-    cash_flow = immo.get_cashflow(**prop_data["cash_flow"])
+    details, base_cost, cash_flow = parse_property(prop_data)
 
     # get the annuity
     annuity = loan.annuity_from_repayment_rate(
@@ -56,14 +76,7 @@ def calc_property_by_annuity(
     """
     Calculate the property object from the property data and the credit and repay rates.
     """
-    # get the details
-    details = immo.Details(**prop_data["details"])
-
-    # get the base cost
-    base_cost = immo.BaseCost(**prop_data["base_cost"])
-
-    # get the cash flow
-    cash_flow = immo.get_cashflow(**prop_data["cash_flow"])
+    details, base_cost, cash_flow = parse_property(prop_data)
 
     # get the repay rate
     repayment_rate = loan.repayment_rate_from_annuity(
@@ -99,15 +112,7 @@ def calc_property_by_period(
     """
     Calculate the property object from the property data and the credit and repay rates.
     """
-    # get the details
-    details = immo.Details(**prop_data["details"])
-
-    # get the base cost
-    base_cost = immo.BaseCost(**prop_data["base_cost"])
-
-    # get the cash flow
-    # prop_data["cash_flow"]["monthly_maintenance_net"] = running_cost.monthly_maintenance_net
-    cash_flow = immo.get_cashflow(**prop_data["cash_flow"])
+    details, base_cost, cash_flow = parse_property(prop_data)
 
     # get the annuity
     annuity = loan.annuity_from_period(
@@ -135,3 +140,53 @@ def calc_property_by_period(
     )
 
     return temp_immo
+
+
+def compare_financing(prop_data: dict, offers: list[dict]) -> pd.DataFrame:
+    """
+    Compare financing offers for one property. The property data is parsed once
+    and all offers are evaluated together. Each offer holds the interest_rate
+    and exactly one of annuity, repayment_rate or period, an optional name is
+    used as index of the comparison table.
+    """
+    _, base_cost, cash_flow = parse_property(prop_data)
+
+    kinds = ("annuity", "repayment_rate", "period")
+    specs = {kind: np.full(len(offers), np.nan) for kind in kinds}
+    for i, offer in enumerate(offers):
+        given = [kind for kind in kinds if offer.get(kind) is not None]
+        if len(given) != 1:
+            raise ValueError(
+                f"Offer {i} must specify exactly one of annuity, repayment_rate or period"
+            )
+        specs[given[0]][i] = offer[given[0]]
+    interest_rates = np.array([offer["interest_rate"] for offer in offers], dtype=float)
+
+    base_cost_amounts = immo.batch.base_cost_arrays(base_cost)
+    mortgages = loan.batch.financing(
+        base_cost_amounts["loan"],
+        interest_rates,
+        annuities=specs["annuity"],
+        repayment_rates=specs["repayment_rate"],
+        periods=specs["period"],
+    )
+    kpis = immo.batch.kpis(
+        base_cost_amounts,
+        cash_flow.net_cold_rent,
+        cash_flow.operating_expenses,
+        cash_flow.operating_income,
+        interest_rates,
+        mortgages["annuity"],
+        mortgages["period"],
+    )
+
+    return pd.DataFrame(
+        {
+            "Interest Rate": interest_rates,
+            "Initial Repayment Rate": mortgages["repayment_rate"],
+            "Annuity": mortgages["annuity"],
+            "Repay Time Total": mortgages["repay_time_total"],
+            **immo.batch.eval_dict(kpis),
+        },
+        index=[offer.get("name", i) for i, offer in enumerate(offers)],
+    )
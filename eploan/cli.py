@@ -0,0 +1,224 @@
+import argparse
+import csv
+import itertools
+import json
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional, TextIO
+
+from . import calculators
+
+
+def iter_properties(paths: list[str]) -> Iterator[tuple[str, Optional[dict], Optional[str]]]:
+    """
+    Yield (name, property data, error) of json files holding one property or a
+    list, jsonl files with one property per line and directories of both. A
+    file or line that cannot be read yields its error instead of the data.
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            files = sorted(
+                file for file in path.iterdir() if file.suffix in (".json", ".jsonl")
+            )
+            yield from iter_properties([str(file) for file in files])
+        elif path.suffix == ".jsonl":
+            try:
+                jsonl_file = open(path)
+            except OSError as error:
+                yield str(path), None, f"{type(error).__name__}: {error}"
+                continue
+            with jsonl_file:
+                for line_number, line in enumerate(jsonl_file, start=1):
+                    if not line.strip():
+                        continue
+                    name = f"{path}:{line_number}"
+                    try:
+                        yield name, json.loads(line), None
+                    except json.JSONDecodeError as error:
+                        yield name, None, f"{type(error).__name__}: {error}"
+        else:
+            try:
+                with open(path) as json_file:
+                    prop_data = json.load(json_file)
+            except (OSError, json.JSONDecodeError) as error:
+                yield str(path), None, f"{type(error).__name__}: {error}"
+                continue
+            if isinstance(prop_data, list):
+                for idx, item in enumerate(prop_data):
+                    yield f"{path}[{idx}]", item, None
+            else:
+                yield str(path), prop_data, None
+
+
+def evaluate(
+    name: str, prop_data: dict, interest_rate: float, financing: tuple[str, float]
+) -> tuple[str, Optional[dict], Optional[str], dict[str, float]]:
+    """evaluate one property, returns name, result row, error and timings"""
+    by, value = financing
+    calc = {
+        "annuity": calculators.calc_property_by_annuity,
+        "repayment_rate": calculators.calc_property_by_repayment_rate,
+        "period": calculators.calc_property_by_period,
+    }[by]
+    timings = {}
+    try:
+        start = time.perf_counter()
+        cur_immo = calc(prop_data, interest_rate, value)
+        timings["calc_property"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        row = {
+            "Name": name,
+            "Loan": cur_immo.mortgage.amount,
+            "Annuity": cur_immo.mortgage.annuity,
+            "Initial Repayment Rate": cur_immo.mortgage.repayment_rate,
+            "Repay Time Total": cur_immo.mortgage.repay_time_total,
+            **cur_immo.eval_dict(),
+        }
+        timings["eval_dict"] = time.perf_counter() - start
+    except (KeyError, TypeError, ValueError, ZeroDivisionError) as error:
+        return name, None, f"{type(error).__name__}: {error}", timings
+    return name, row, None, timings
+
+
+def _evaluate_chunk(tasks: list[tuple]) -> list[tuple]:
+    return [evaluate(*task) for task in tasks]
+
+
+def _results(
+    properties: Iterator[tuple[str, Optional[dict], Optional[str]]],
+    args: argparse.Namespace,
+    financing: tuple[str, float],
+    executor: Optional[ProcessPoolExecutor],
+) -> Iterator[tuple]:
+    """
+    Evaluation results in input order. With an executor the properties are
+    sent in chunks and at most workers chunks are read and in flight at a
+    time, the window is refilled as the oldest chunk completes.
+    """
+    if executor is None:
+        for name, prop_data, error in properties:
+            if error is not None:
+                yield name, None, error, {}
+            else:
+                yield evaluate(name, prop_data, args.interest_rate, financing)
+        return
+
+    def collect(items: list[tuple], future: Future) -> Iterator[tuple]:
+        evaluated = iter(future.result())
+        for name, _, error in items:
+            yield (name, None, error, {}) if error is not None else next(evaluated)
+
+    pending: deque[tuple[list[tuple], Future]] = deque()
+    while items := list(itertools.islice(properties, args.chunksize)):
+        tasks = [
+            (name, prop_data, args.interest_rate, financing)
+            for name, prop_data, error in items
+            if error is None
+        ]
+        pending.append((items, executor.submit(_evaluate_chunk, tasks)))
+        if len(pending) >= args.workers:
+            yield from collect(*pending.popleft())
+    while pending:
+        yield from collect(*pending.popleft())
+
+
+class _Writer:
+    def __init__(self, out: TextIO, output_format: str):
+        self.out = out
+        self.output_format = output_format
+        self._csv_writer = None
+
+    def write(self, row: dict) -> None:
+        if self.output_format == "jsonl":
+            self.out.write(json.dumps(row) + "\n")
+            return
+        if self._csv_writer is None:
+            self._csv_writer = csv.DictWriter(self.out, fieldnames=list(row))
+            self._csv_writer.writeheader()
+        self._csv_writer.writerow(row)
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="eploan", description="Evaluate real estate properties and their financing."
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="json or jsonl files or directories of properties"
+    )
+    parser.add_argument("--interest-rate", type=float, required=True)
+    financing = parser.add_mutually_exclusive_group(required=True)
+    financing.add_argument("--annuity", type=float, help="yearly annuity")
+    financing.add_argument("--repayment-rate", type=float, help="initial repayment rate")
+    financing.add_argument("--period", type=float, help="repay time in years")
+    parser.add_argument(
+        "--workers", type=positive_int, default=1, help="number of worker processes"
+    )
+    parser.add_argument("--chunksize", type=positive_int, default=64, help="properties per task")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--output", "-o", help="output file, stdout by default")
+    parser.add_argument(
+        "--profile", action="store_true", help="print timings of the hot paths to stderr"
+    )
+    return parser
+
+
+def _print_profile(timings: dict[str, list[float]], err: TextIO) -> None:
+    err.write(f"{'step':<16}{'calls':>8}{'total s':>12}{'mean ms':>12}\n")
+    for name, values in timings.items():
+        total = sum(values)
+        err.write(
+            f"{name:<16}{len(values):>8}{total:>12.4f}{total / len(values) * 1000:>12.4f}\n"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    financing = next(
+        (by, value)
+        for by, value in (
+            ("annuity", args.annuity),
+            ("repayment_rate", args.repayment_rate),
+            ("period", args.period),
+        )
+        if value is not None
+    )
+    timings: dict[str, list[float]] = defaultdict(list)
+    failed = 0
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    start = time.perf_counter()
+    try:
+        writer = _Writer(out, args.format)
+        for name, row, error, cur_timings in _results(
+            iter_properties(args.inputs), args, financing, executor
+        ):
+            for step, seconds in cur_timings.items():
+                timings[step].append(seconds)
+            if error is not None:
+                failed += 1
+                sys.stderr.write(f"{name}: {error}\n")
+                continue
+            write_start = time.perf_counter()
+            writer.write(row)
+            timings["write"].append(time.perf_counter() - write_start)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if args.output:
+            out.close()
+
+    if args.profile:
+        timings["total"].append(time.perf_counter() - start)
+        _print_profile(timings, sys.stderr)
+    return 1 if failed else 0
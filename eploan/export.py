@@ -0,0 +1,158 @@
+import gzip
+import itertools
+from pathlib import Path
+from typing import Callable, Iterable, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import loan
+
+Progress = Callable[[int, Optional[int]], None]
+
+columns: tuple[str, ...] = ("Loan", "Period", "Credit Pre", "Interest", "Repay", "Credit Post")
+
+
+def schedule_frame(schedules: loan.batch.ScheduleArrays, first_loan: int = 0) -> pd.DataFrame:
+    """long frame of the active periods of batch schedules"""
+    return pd.DataFrame(loan.Schedule.batch_columns(schedules, first_loan))
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, compression: Optional[str]):
+        if compression not in (None, "gzip"):
+            raise ValueError(f"Unsupported csv compression {compression}")
+        if compression == "gzip":
+            self.file = gzip.open(path, "wt", newline="")
+        else:
+            self.file = open(path, "w", newline="")
+        self.header = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self.file, index=False, header=self.header)
+        self.header = False
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, compression: Optional[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError("Writing parquet files requires pyarrow") from error
+        self.pa = pa
+        self.writer = pq.ParquetWriter(
+            path,
+            pa.schema(
+                [("Loan", pa.int64()), ("Period", pa.int64())]
+                + [(name, pa.float64()) for name in columns[2:]]
+            ),
+            compression=compression or "none",
+        )
+
+    def write(self, df: pd.DataFrame) -> None:
+        self.writer.write_table(self.pa.Table.from_pandas(df, preserve_index=False))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def _writer(path: Path, file_format: Literal["csv", "parquet"], compression: Optional[str]):
+    if file_format == "csv":
+        return _CsvWriter(path, compression)
+    if file_format == "parquet":
+        return _ParquetWriter(path, compression)
+    raise ValueError(f"Unknown export format {file_format}")
+
+
+def export_schedules(
+    path: str | Path,
+    loan_amounts,
+    interest_rates,
+    annuities,
+    periods,
+    file_format: Literal["csv", "parquet"] = "csv",
+    compression: Optional[str] = None,
+    chunk_size: int = 10_000,
+    progress: Optional[Progress] = None,
+    backend: loan.batch.Backend = "float",
+) -> int:
+    """
+    Write the schedules of many loans chunk by chunk. Only the schedules of one
+    chunk of loans are held in memory. Returns the number of written rows.
+    """
+    loan_amounts, interest_rates, annuities, periods = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(loan_amounts, dtype=float)),
+        np.atleast_1d(np.asarray(interest_rates, dtype=float)),
+        np.atleast_1d(np.asarray(annuities, dtype=float)),
+        np.atleast_1d(np.asarray(periods, dtype=np.int64)),
+    )
+
+    def chunks():
+        for start in range(0, len(loan_amounts), chunk_size):
+            stop = start + chunk_size
+            yield (
+                loan_amounts[start:stop],
+                interest_rates[start:stop],
+                annuities[start:stop],
+                periods[start:stop],
+            )
+
+    return _export(Path(path), chunks(), len(loan_amounts), file_format, compression, progress, backend)
+
+
+def export_mortgages(
+    path: str | Path,
+    mortgages: Iterable[loan.Mortgage],
+    file_format: Literal["csv", "parquet"] = "csv",
+    compression: Optional[str] = None,
+    chunk_size: int = 10_000,
+    progress: Optional[Progress] = None,
+    total: Optional[int] = None,
+    backend: loan.batch.Backend = "float",
+) -> int:
+    """
+    Write the outlook schedules of the mortgages chunk by chunk. The mortgages
+    may be a generator, it is consumed one chunk at a time.
+    """
+    mortgages = iter(mortgages)
+
+    def chunks():
+        while chunk := list(itertools.islice(mortgages, chunk_size)):
+            yield (
+                [mortgage.amount for mortgage in chunk],
+                [mortgage.interest_rate for mortgage in chunk],
+                [mortgage.annuity for mortgage in chunk],
+                [mortgage.repay_time_total for mortgage in chunk],
+            )
+
+    return _export(Path(path), chunks(), total, file_format, compression, progress, backend)
+
+
+def _export(
+    path: Path,
+    chunks,
+    total: Optional[int],
+    file_format: Literal["csv", "parquet"],
+    compression: Optional[str],
+    progress: Optional[Progress],
+    backend: loan.batch.Backend,
+) -> int:
+    writer = _writer(path, file_format, compression)
+    rows = 0
+    done = 0
+    try:
+        for amounts, rates, annuities, periods in chunks:
+            schedules = loan.batch.amortize(amounts, rates, annuities, periods, backend=backend)
+            df = schedule_frame(schedules, first_loan=done)
+            writer.write(df)
+            rows += len(df)
+            done += schedules.active.shape[0]
+            if progress is not None:
+                progress(done, total)
+    finally:
+        writer.close()
+    return rows
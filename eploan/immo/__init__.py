@@ -2,3 +2,9 @@ from .costs import BaseCost
 from .immo import TaxRates, Immo, depickle
 from .cash_flow import CashFlow, get_cashflow
 from .details import Details
+from . import property_buy_tax
+from .scenario import Scenario, compare_scenarios
+from . import batch
+from .simulation import RiskAssumptions, SimulationResult, simulate
+from .frozen import FrozenBaseCost, FrozenCashFlow, FrozenDetails, FrozenImmo, FrozenTaxRates, freeze
+from . import sensitivity
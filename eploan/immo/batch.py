@@ -0,0 +1,101 @@
+import numpy as np
+
+from .. import loan
+from . import costs
+
+
+def base_cost_arrays(base_cost: costs.BaseCost) -> dict[str, np.ndarray]:
+    return costs.base_cost_arrays(
+        base_cost.price,
+        base_cost.modernisation,
+        base_cost.property_buy_tax_rate,
+        base_cost.agent_rate,
+        base_cost.notary_rate,
+        base_cost.land_registry_rate,
+        base_cost.proprietary_capital_rate,
+        base_cost.loan_rate,
+    )
+
+
+def kpis(
+    base_cost: dict[str, np.ndarray],
+    net_cold_rent,
+    operating_expenses,
+    operating_income,
+    interest_rate,
+    annuity,
+    period,
+    loan_amount=None,
+) -> dict[str, np.ndarray]:
+    """
+    The kpis of Immo for arrays of properties and financings. base_cost holds
+    the amounts of costs.base_cost_arrays, period is the mortgage period and
+    loan_amount defaults to the loan of the base cost. Undefined values are NaN.
+    """
+    price = base_cost["price"]
+    total = base_cost["total"]
+    proprietary_capital = base_cost["proprietary_capital"]
+    if loan_amount is None:
+        loan_amount = base_cost["loan"]
+
+    net_cold_rent = np.asarray(net_cold_rent, dtype=float)
+    net_annually = 12 * (
+        net_cold_rent
+        - (
+            np.asarray(operating_expenses, dtype=float)
+            - np.asarray(operating_income, dtype=float)
+        )
+    )
+    annuity = np.asarray(annuity, dtype=float)
+    period = np.asarray(period, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gross_rental_yield = net_cold_rent * 12 / total
+        net_rental_yield = (net_annually - annuity) / total
+        multiplication_factor = np.floor(total / net_annually)
+        return_on_equity = np.where(
+            proprietary_capital == 0, 0, net_annually / proprietary_capital
+        )
+
+        gain_period = np.where(period >= 10, 10, period)
+        valid = np.isfinite(gain_period)
+        rest = loan.batch.rest_dept(
+            loan_amount,
+            interest_rate,
+            np.where(valid, gain_period, 0).astype(np.int64),
+            np.where(np.isfinite(annuity), annuity, 0),
+        )
+        rest = np.where(valid, rest, np.nan)
+        ten_year_net_capital_gain = np.round(
+            price + base_cost["modernisation"] - proprietary_capital - rest, 2
+        ) + gain_period * (net_annually - annuity)
+        ten_year_roe = np.where(
+            proprietary_capital == 0,
+            0,
+            (ten_year_net_capital_gain + proprietary_capital) / proprietary_capital - 1,
+        )
+
+    return {
+        "gross_rental_yield": gross_rental_yield,
+        "net_rental_yield": net_rental_yield,
+        "multiplication_factor": multiplication_factor,
+        "return_on_equity": return_on_equity,
+        "ten_year_net_capital_gain": ten_year_net_capital_gain,
+        "ten_year_roe": ten_year_roe,
+        "annual_cash_flow": net_annually - annuity,
+        "gain_period": gain_period,
+    }
+
+
+def eval_dict(kpi_arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """the kpis rounded and labelled like Immo.eval_dict"""
+    return {
+        "Gross Rental Yield": np.round(kpi_arrays["gross_rental_yield"] * 100, 2),
+        "Net Rental Yield": np.round(kpi_arrays["net_rental_yield"] * 100, 2),
+        "Multiplication Factor": np.round(kpi_arrays["multiplication_factor"], 2),
+        "Return on Equity": np.round(kpi_arrays["return_on_equity"] * 100, 2),
+        "10 Year Net Capital Gain": np.round(
+            kpi_arrays["ten_year_net_capital_gain"], 2
+        ),
+        "10 Year RoE": np.round(kpi_arrays["ten_year_roe"] * 100, 2),
+    }
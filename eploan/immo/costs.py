@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 
 from . import property_buy_tax
+from ..loan import cents
 
 log = logging.getLogger(__name__)
 
@@ -209,3 +210,60 @@ class BaseCost:
                 "Loan",
             ],
         )
+
+
+def base_cost_arrays(
+    price,
+    modernisation=0,
+    property_buy_tax_rate=None,
+    agent_rate=0.0357,
+    notary_rate=0.015,
+    land_registry_rate=0.005,
+    proprietary_capital_rate=0.2,
+    loan_rate=0.8,
+    backend: Literal["float", "cents"] = "float",
+) -> dict[str, np.ndarray]:
+    """
+    The amounts of BaseCost for arrays of properties. The float backend rounds
+    like the BaseCost properties, the cents backend computes in integer cents.
+    """
+    if property_buy_tax_rate is None:
+        property_buy_tax_rate = property_buy_tax.median()
+
+    if backend == "cents":
+        amounts = cents.base_cost(
+            price,
+            modernisation,
+            property_buy_tax_rate,
+            agent_rate,
+            notary_rate,
+            land_registry_rate,
+            proprietary_capital_rate,
+            loan_rate,
+        )
+        return {name: cents.from_cents(value) for name, value in amounts.items()}
+    if backend != "float":
+        raise ValueError(f"Unknown backend {backend}")
+
+    price = np.asarray(price, dtype=float)
+    modernisation = np.asarray(modernisation, dtype=float)
+    extras_rate = (
+        np.asarray(notary_rate)
+        + np.asarray(property_buy_tax_rate)
+        + np.asarray(land_registry_rate)
+        + np.asarray(agent_rate)
+    )
+    extras = np.round(price * extras_rate, 2)
+    total = np.round(price + modernisation + extras, 2)
+    return {
+        "price": price,
+        "modernisation": modernisation,
+        "notary": np.round(price * notary_rate, 2),
+        "property_buy_tax": np.round(price * property_buy_tax_rate, 2),
+        "land_registry": np.round(price * land_registry_rate, 2),
+        "agent": np.round(price * agent_rate, 2),
+        "extras": extras,
+        "total": total,
+        "proprietary_capital": np.round(total * proprietary_capital_rate, 2),
+        "loan": np.round(total * loan_rate, 2),
+    }
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, asdict
 from typing import Optional
 
+from . import property_buy_tax
+
 
 @dataclass
 class Details:
@@ -15,6 +17,12 @@ class Details:
     floor: Optional[int] = None
     rooms: Optional[int] = None
 
+    @property
+    def federal_state(self) -> Optional[str]:
+        if self.postal_code is None:
+            return None
+        return property_buy_tax.state_from_postal_code(self.postal_code)
+
     def to_dict(self) -> dict:
         return asdict(
             self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None}
@@ -0,0 +1,177 @@
+from dataclasses import asdict, dataclass, field, fields
+from functools import cached_property
+from typing import Iterable, Optional, Self
+
+from . import property_buy_tax
+from ..loan.frozen import FrozenMortgage, add_with_methods
+from .cash_flow import CashFlow
+from .costs import BaseCost
+from .details import Details
+from .immo import Immo, TaxRates
+
+
+def _field_values(obj) -> dict:
+    return {field.name: getattr(obj, field.name) for field in fields(obj)}
+
+
+@dataclass(frozen=True)
+class FrozenDetails:
+    living_space: float
+    year_built: Optional[int] = None
+    year_renovated: Optional[int] = None
+    postal_code: Optional[str] = None
+    city: Optional[str] = None
+    district: Optional[str] = None
+    street: Optional[str] = None
+    street_number: Optional[str] = None
+    floor: Optional[int] = None
+    rooms: Optional[int] = None
+
+    federal_state = cached_property(Details.federal_state.fget)
+
+    @classmethod
+    def freeze(cls, details: Details) -> Self:
+        return cls(**_field_values(details))
+
+    def thaw(self) -> Details:
+        return Details(**_field_values(self))
+
+    to_dict = Details.to_dict
+
+
+@dataclass(frozen=True)
+class FrozenBaseCost:
+    price: float
+    modernisation: float = 0
+    property_buy_tax_rate: float = field(default_factory=property_buy_tax.median)
+    agent_rate: float = 0.0357
+
+    notary_rate: float = 0.015
+    land_registry_rate: float = 0.005
+
+    proprietary_capital_rate: float = 0.2
+    loan_rate: float = 0.8
+
+    notary = cached_property(BaseCost.notary.fget)
+    property_buy_tax = cached_property(BaseCost.property_buy_tax.fget)
+    land_registry = cached_property(BaseCost.land_registry.fget)
+    agent = cached_property(BaseCost.agent.fget)
+    extras_rate = cached_property(BaseCost.extras_rate.fget)
+    extras = cached_property(BaseCost.extras.fget)
+    total = cached_property(BaseCost.total.fget)
+    proprietary_capital = cached_property(BaseCost.proprietary_capital.fget)
+    loan = cached_property(BaseCost.loan.fget)
+
+    @classmethod
+    def freeze(cls, base_cost: BaseCost) -> Self:
+        return cls(**_field_values(base_cost))
+
+    def thaw(self) -> BaseCost:
+        return BaseCost(**_field_values(self))
+
+    summary = BaseCost.summary
+
+
+@dataclass(frozen=True)
+class FrozenCashFlow:
+    net_cold_rent: float
+    operating_expenses: float
+    operating_income: float
+
+    net_operating_cost = cached_property(CashFlow.net_operating_cost.fget)
+    total_annually = cached_property(CashFlow.total_annually.fget)
+    net = cached_property(CashFlow.net.fget)
+    net_annually = cached_property(CashFlow.net_annually.fget)
+
+    @classmethod
+    def freeze(cls, cash_flow: CashFlow) -> Self:
+        return cls(**_field_values(cash_flow))
+
+    def thaw(self) -> CashFlow:
+        return CashFlow(**_field_values(self))
+
+    summary = CashFlow.summary
+
+
+@dataclass(frozen=True)
+class FrozenTaxRates:
+    personal: float = 0.35
+    depreciation: float = 0.02
+
+    @classmethod
+    def freeze(cls, tax_rates: TaxRates) -> Self:
+        return cls(**_field_values(tax_rates))
+
+    def thaw(self) -> TaxRates:
+        return TaxRates(**_field_values(self))
+
+
+add_with_methods(FrozenBaseCost, BaseCost)
+add_with_methods(FrozenCashFlow, CashFlow)
+
+
+@dataclass(frozen=True)
+class FrozenImmo:
+    """
+    Immutable, hashable Immo to share between threads and to use as a cache
+    key. The kpis are computed once per object, the updates return new objects
+    with the loan and the mortgage amount kept in sync like Immo.update.
+    """
+
+    details: FrozenDetails
+    base_cost: FrozenBaseCost
+    cash_flow: FrozenCashFlow
+    mortgage: FrozenMortgage
+    tax_rates: FrozenTaxRates = FrozenTaxRates()
+
+    return_on_equity = cached_property(Immo.return_on_equity.fget)
+    gross_rental_yield = cached_property(Immo.gross_rental_yield.fget)
+    net_rental_yield = cached_property(Immo.net_rental_yield.fget)
+    multiplication_factor = cached_property(Immo.multiplication_factor.fget)
+    price_per_sqm = cached_property(Immo.price_per_sqm.fget)
+    rent_per_sqm = cached_property(Immo.rent_per_sqm.fget)
+    _ten_year_net_capital_gain = cached_property(Immo.ten_year_net_capital_gain)
+    _eval_dict = cached_property(Immo.eval_dict)
+
+    @classmethod
+    def freeze(cls, cur_immo: Immo) -> Self:
+        return cls(
+            details=FrozenDetails.freeze(cur_immo.details),
+            base_cost=FrozenBaseCost.freeze(cur_immo.base_cost),
+            cash_flow=FrozenCashFlow.freeze(cur_immo.cash_flow),
+            mortgage=FrozenMortgage.freeze(cur_immo.mortgage),
+            tax_rates=FrozenTaxRates.freeze(cur_immo.tax_rates),
+        )
+
+    def thaw(self) -> Immo:
+        return Immo(
+            details=self.details.thaw(),
+            base_cost=self.base_cost.thaw(),
+            cash_flow=self.cash_flow.thaw(),
+            mortgage=self.mortgage.thaw(),
+            tax_rates=self.tax_rates.thaw(),
+        )
+
+    def ten_year_net_capital_gain(self) -> float:
+        return self._ten_year_net_capital_gain
+
+    ten_year_roe = Immo.ten_year_roe
+    cost_effectiveness = Immo.cost_effectiveness
+
+    def eval_dict(self) -> dict:
+        return dict(self._eval_dict)
+
+    def with_update(self, card: str, field: str, attribute: str, value: float) -> Self:
+        return self.freeze(self.thaw().update(card, field, attribute, value))
+
+    def with_updates(self, edits: Iterable[tuple[str, str, str, float]]) -> Self:
+        cur_immo = self.thaw()
+        cur_immo.update_many(edits)
+        return self.freeze(cur_immo)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def freeze(cur_immo: Immo) -> FrozenImmo:
+    return FrozenImmo.freeze(cur_immo)
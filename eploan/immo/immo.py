@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Self
+from typing import Callable, ClassVar, Iterable, Self
 import pandas as pd
 import pickle
 
@@ -9,6 +9,13 @@ from .. import loan
 from . import details
 
 
+def _base_cost_setter(name: str) -> Callable[["Immo", float], None]:
+    def setter(immo: "Immo", value: float) -> None:
+        getattr(immo.base_cost, name)(value)
+
+    return setter
+
+
 @dataclass
 class TaxRates:
     personal: float = 0.35
@@ -231,65 +238,121 @@ class Immo:
         self.set_net_cold_rent_monthly(value * self.details.living_space)
 
     def update(self, card: str, field: str, attribute: str, value: float) -> Self:
-        attr_map = {
-            ("base_cost", "price", "total"): "set_price",
-            ("base_cost", "modernisation", "total"): "set_modernisation",
-            ("base_cost", "agent", "total"): "set_agent",
-            ("base_cost", "agent", "rate"): "set_agent_rate",
-            ("base_cost", "property buy tax", "total"): "set_property_buy_tax",
-            ("base_cost", "property buy tax", "rate"): "set_property_buy_tax_rate",
-            ("base_cost", "notary", "total"): "set_notary",
-            ("base_cost", "notary", "rate"): "set_notary_rate",
-            ("base_cost", "land registry", "total"): "set_land_registry",
-            ("base_cost", "land registry", "rate"): "set_land_registry_rate",
-            ("base_cost", "proprietary capital", "total"): "set_proprietary_capital",
-            (
-                "base_cost",
-                "proprietary capital",
-                "rate",
-            ): "set_proprietary_capital_rate",
-            ("base_cost", "loan", "total"): "set_loan",
-            ("base_cost", "loan", "rate"): "set_loan_rate",
-            ("cash_flow", "net cold rent", "monthly"): "set_net_cold_rent_monthly",
-            ("cash_flow", "net cold rent", "annually"): "set_net_cold_rent_annually",
-            (
-                "cash_flow",
-                "operating income",
-                "monthly",
-            ): "set_operating_income_monthly",
-            (
-                "cash_flow",
-                "operating income",
-                "annually",
-            ): "set_operating_income_annually",
-            (
-                "cash_flow",
-                "operating expenses",
-                "monthly",
-            ): "set_operating_expenses_monthly",
-            (
-                "cash_flow",
-                "operating expenses",
-                "annually",
-            ): "set_operating_expenses_annually",
-            ("cash_flow", "annuity", "monthly"): "set_annuity_monthly",
-            ("cash_flow", "annuity", "annually"): "set_annuity_annually",
-            ("mortgage", "interest rate", "-"): "set_interest_rate",
-            ("mortgage", "annuity", "-"): "set_annuity_annually",
-            ("mortgage", "repay time total", "-"): "set_repay_time_total",
-            ("mortgage", "initial repayment rate", "-"): "set_repayment_rate",
-            ("cost_effectiveness", "living space", "-"): "set_living_space",
-            ("cost_effectiveness", "price/sqm", "-"): "set_price_per_sqm",
-            ("cost_effectiveness", "net cold rent/sqm", "-"): "set_rent_per_sqm",
-        }
-
         key = (card, field, attribute)
-        if key in attr_map:
-            getattr(self, attr_map[key])(value)
+        if key in self._update_map:
+            getattr(self, self._update_map[key])(value)
         else:
             raise ValueError(f"Cannot update {field} {attribute}")
         return self
 
+    def update_many(self, edits: Iterable[tuple[str, str, str, float]]) -> dict:
+        """
+        Apply several (card, field, attribute, value) edits and return the kpis.
+        The mortgage amount is synced with the loan once after the base cost edits
+        instead of after every single edit.
+        """
+        edits = list(edits)
+        for card, field, attribute, _ in edits:
+            if (card, field, attribute) not in self._update_map:
+                raise ValueError(f"Cannot update {field} {attribute}")
+
+        loan_outdated = False
+        for card, field, attribute, value in edits:
+            setter = self._update_map[(card, field, attribute)]
+            if setter in self._loan_setters:
+                self._loan_setters[setter](self, value)
+                loan_outdated = True
+                continue
+            # the mortgage setters depend on the current loan amount
+            if loan_outdated:
+                self._sync_loan()
+                loan_outdated = False
+            getattr(self, setter)(value)
+
+        if loan_outdated:
+            self._sync_loan()
+        return self.eval_dict()
+
+    def _sync_loan(self) -> None:
+        self.mortgage.amount = self.base_cost.loan
+
+    _update_map: ClassVar[dict[tuple[str, str, str], str]] = {
+        ("base_cost", "price", "total"): "set_price",
+        ("base_cost", "modernisation", "total"): "set_modernisation",
+        ("base_cost", "agent", "total"): "set_agent",
+        ("base_cost", "agent", "rate"): "set_agent_rate",
+        ("base_cost", "property buy tax", "total"): "set_property_buy_tax",
+        ("base_cost", "property buy tax", "rate"): "set_property_buy_tax_rate",
+        ("base_cost", "notary", "total"): "set_notary",
+        ("base_cost", "notary", "rate"): "set_notary_rate",
+        ("base_cost", "land registry", "total"): "set_land_registry",
+        ("base_cost", "land registry", "rate"): "set_land_registry_rate",
+        ("base_cost", "proprietary capital", "total"): "set_proprietary_capital",
+        (
+            "base_cost",
+            "proprietary capital",
+            "rate",
+        ): "set_proprietary_capital_rate",
+        ("base_cost", "loan", "total"): "set_loan",
+        ("base_cost", "loan", "rate"): "set_loan_rate",
+        ("cash_flow", "net cold rent", "monthly"): "set_net_cold_rent_monthly",
+        ("cash_flow", "net cold rent", "annually"): "set_net_cold_rent_annually",
+        (
+            "cash_flow",
+            "operating income",
+            "monthly",
+        ): "set_operating_income_monthly",
+        (
+            "cash_flow",
+            "operating income",
+            "annually",
+        ): "set_operating_income_annually",
+        (
+            "cash_flow",
+            "operating expenses",
+            "monthly",
+        ): "set_operating_expenses_monthly",
+        (
+            "cash_flow",
+            "operating expenses",
+            "annually",
+        ): "set_operating_expenses_annually",
+        ("cash_flow", "annuity", "monthly"): "set_annuity_monthly",
+        ("cash_flow", "annuity", "annually"): "set_annuity_annually",
+        ("mortgage", "interest rate", "-"): "set_interest_rate",
+        ("mortgage", "annuity", "-"): "set_annuity_annually",
+        ("mortgage", "repay time total", "-"): "set_repay_time_total",
+        ("mortgage", "initial repayment rate", "-"): "set_repayment_rate",
+        ("cost_effectiveness", "living space", "-"): "set_living_space",
+        ("cost_effectiveness", "price/sqm", "-"): "set_price_per_sqm",
+        ("cost_effectiveness", "net cold rent/sqm", "-"): "set_rent_per_sqm",
+    }
+
+    # setters which change the loan, applied without syncing the mortgage amount
+    _loan_setters: ClassVar[dict[str, Callable[["Immo", float], None]]] = {
+        **{
+            name: _base_cost_setter(name)
+            for name in (
+                "set_price",
+                "set_agent",
+                "set_agent_rate",
+                "set_property_buy_tax",
+                "set_property_buy_tax_rate",
+                "set_notary",
+                "set_notary_rate",
+                "set_land_registry",
+                "set_land_registry_rate",
+                "set_proprietary_capital",
+                "set_proprietary_capital_rate",
+                "set_loan",
+                "set_loan_rate",
+            )
+        },
+        "set_price_per_sqm": lambda immo, value: immo.base_cost.set_price(
+            value * immo.details.living_space
+        ),
+    }
+
 
 def depickle(b_immo: str) -> Immo:
     cur_immo = pickle.loads(b_immo.encode("ascii"))
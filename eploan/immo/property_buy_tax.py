@@ -39,13 +39,110 @@ summary: dict[str, float] = {
 }
 
 
+# postal code ranges (first, last) of the federal states, sorted by first code.
+# The ranges follow the postal regions, so a few codes close to a state border
+# resolve to the state that holds most of the region.
+postal_code_ranges: list[tuple[int, int, str]] = [
+    (1000, 2999, "Sachsen"),
+    (3000, 3999, "Brandenburg"),
+    (4000, 4999, "Sachsen"),
+    (6000, 6999, "Sachsen-Anhalt"),
+    (7000, 7999, "Thüringen"),
+    (8000, 9999, "Sachsen"),
+    (10000, 14199, "Berlin"),
+    (14200, 16999, "Brandenburg"),
+    (17000, 19999, "Mecklenburg-Vorpommern"),
+    (20000, 21149, "Hamburg"),
+    (21150, 21999, "Niedersachsen"),
+    (22000, 22799, "Hamburg"),
+    (22800, 25999, "Schleswig-Holstein"),
+    (26000, 27499, "Niedersachsen"),
+    (27500, 27580, "Bremen"),
+    (27581, 28099, "Niedersachsen"),
+    (28100, 28779, "Bremen"),
+    (28780, 31999, "Niedersachsen"),
+    (32000, 33999, "Nordrhein-Westfalen"),
+    (34000, 36399, "Hessen"),
+    (36400, 36999, "Thüringen"),
+    (37000, 38999, "Niedersachsen"),
+    (39000, 39999, "Sachsen-Anhalt"),
+    (40000, 53999, "Nordrhein-Westfalen"),
+    (54000, 56999, "Rheinland-Pfalz"),
+    (57000, 59999, "Nordrhein-Westfalen"),
+    (60000, 63699, "Hessen"),
+    (63700, 63999, "Bayern"),
+    (64000, 65999, "Hessen"),
+    (66000, 66799, "Saarland"),
+    (66800, 67999, "Rheinland-Pfalz"),
+    (68000, 79999, "Baden-Württemberg"),
+    (80000, 87999, "Bayern"),
+    (88000, 89999, "Baden-Württemberg"),
+    (90000, 97999, "Bayern"),
+    (98000, 99999, "Thüringen"),
+]
+
+# precomputed index for the vectorized lookups
+_range_starts = np.array([start for start, _, _ in postal_code_ranges], dtype=np.int64)
+_range_ends = np.array([end for _, end, _ in postal_code_ranges], dtype=np.int64)
+_range_states = np.array([state for _, _, state in postal_code_ranges], dtype=object)
+_range_rates = np.array([summary[state] for state in _range_states], dtype=float)
+
+_average = float(np.array(list(summary.values())).mean())
+_median = float(np.median(np.array(list(summary.values()))))
+
+
 def default() -> float:
     return NI
 
 
 def average() -> float:
-    return np.array(list(summary.values())).mean()
+    return _average
 
 
 def median() -> float:
-    return np.median(np.array(list(summary.values())))
+    return _median
+
+
+def _postal_code_numbers(postal_codes) -> np.ndarray:
+    """convert postal codes (str or int) to integers, invalid codes become -1"""
+    codes = np.asarray(postal_codes)
+    if codes.dtype.kind in "iu":
+        return codes.astype(np.int64)
+    if codes.dtype.kind == "f":
+        return np.where(np.isfinite(codes), codes, -1).astype(np.int64)
+
+    codes = np.char.strip(codes.astype(str))
+    valid = np.char.isdigit(codes) & (np.char.str_len(codes) <= 5)
+    return np.where(valid, codes, "-1").astype(np.int64)
+
+
+def _range_index(postal_codes) -> tuple[np.ndarray, np.ndarray]:
+    """index of the matching postal code range and a mask of the codes found"""
+    numbers = _postal_code_numbers(postal_codes)
+    idx = np.searchsorted(_range_starts, numbers, side="right") - 1
+    idx_clipped = np.clip(idx, 0, None)
+    found = (idx >= 0) & (numbers <= _range_ends[idx_clipped])
+    return idx_clipped, found
+
+
+def states_from_postal_codes(postal_codes) -> np.ndarray:
+    """federal states of the postal codes, None where the code is unknown"""
+    idx, found = _range_index(postal_codes)
+    return np.where(found, _range_states[idx], None)
+
+
+def rates_from_postal_codes(postal_codes, fallback: float = np.nan) -> np.ndarray:
+    """property buy tax rates of the postal codes, fallback where the code is unknown"""
+    idx, found = _range_index(postal_codes)
+    return np.where(found, _range_rates[idx], fallback)
+
+
+def state_from_postal_code(postal_code: str | int) -> str | None:
+    return states_from_postal_codes([postal_code])[0]
+
+
+def rate_from_postal_code(postal_code: str | int | None) -> float:
+    """property buy tax rate of the postal code, median if the code is unknown"""
+    if postal_code is None:
+        return median()
+    return float(rates_from_postal_codes([postal_code], fallback=median())[0])
@@ -0,0 +1,139 @@
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Optional, Self
+import copy
+
+import pandas as pd
+
+from .immo import Immo
+
+
+UpdateKey = tuple[str, str, str]
+
+
+@dataclass
+class Scenario:
+    """
+    What-if branch of a shared base property. A branch only stores the edits
+    it overrides, the kpis are evaluated on a temporary copy of the base.
+    """
+
+    base: Immo
+    overrides: dict[UpdateKey, float] = field(default_factory=dict)
+    name: Optional[str] = None
+    parent: Optional[Self] = None
+
+    def branch(
+        self,
+        edits: Iterable[tuple[str, str, str, float]] = (),
+        name: Optional[str] = None,
+    ) -> Self:
+        """new scenario layering the edits on top of this one"""
+        return _layered(self.base, edits, name, parent=self)
+
+    def with_update(
+        self, card: str, field: str, attribute: str, value: float
+    ) -> Self:
+        return self.branch([(card, field, attribute, value)], name=self.name)
+
+    def edits(self) -> list[tuple[str, str, str, float]]:
+        """
+        All edits from the base to this scenario in the order they were made.
+        Setters like the agent amount depend on the current price, so only
+        consecutive edits of the same field are collapsed to the latest value.
+        """
+        layers = []
+        scenario = self
+        while scenario is not None:
+            layers.append(scenario.overrides)
+            scenario = scenario.parent
+
+        edits: list[tuple[str, str, str, float]] = []
+        for overrides in reversed(layers):
+            for key, value in overrides.items():
+                if edits and edits[-1][:3] == key:
+                    edits[-1] = (*key, value)
+                else:
+                    edits.append((*key, value))
+        return edits
+
+    def materialize(self) -> Immo:
+        """independent property with all edits applied"""
+        cur_immo = replace(
+            self.base,
+            **{
+                name: copy.copy(getattr(self.base, name))
+                for name in ("details", "base_cost", "cash_flow", "mortgage", "tax_rates")
+            },
+        )
+        cur_immo.update_many(self.edits())
+        return cur_immo
+
+    def eval_dict(self) -> dict:
+        if not self.overrides and self.parent is None:
+            return self.base.eval_dict()
+        return self.materialize().eval_dict()
+
+    def flatten(self) -> Self:
+        """scenario with the same edits but without the parent chain"""
+        return _layered(self.base, self.edits(), self.name, parent=None)
+
+
+def _layered(
+    base: Immo,
+    edits: Iterable[tuple[str, str, str, float]],
+    name: Optional[str],
+    parent: Optional[Scenario],
+) -> Scenario:
+    """
+    Scenario holding the edits on top of parent. An edit of a field that was
+    already edited earlier in the layer (not directly before) starts a new
+    layer, so the order of the edits is kept.
+    """
+    layers: list[dict[UpdateKey, float]] = [{}]
+    last_key: Optional[UpdateKey] = None
+    for card, field_name, attribute, value in edits:
+        key = (card, field_name, attribute)
+        if key not in Immo._update_map:
+            raise ValueError(f"Cannot update {field_name} {attribute}")
+        if key in layers[-1] and key != last_key:
+            layers.append({})
+        layers[-1][key] = value
+        last_key = key
+
+    scenario = parent
+    for overrides in layers:
+        scenario = Scenario(base=base, overrides=overrides, name=name, parent=scenario)
+    return scenario
+
+
+def compare_scenarios(
+    scenarios: Iterable[Scenario], base: Optional[Immo] = None
+) -> pd.DataFrame:
+    """
+    Compare the kpis of the scenarios, one row per scenario.
+    The differences are taken against the base property of each scenario.
+    """
+    scenarios = list(scenarios)
+    base_kpis: dict[int, dict] = {}
+    if base is not None:
+        base_kpis[id(base)] = base.eval_dict()
+
+    rows = []
+    index = []
+    for i, scenario in enumerate(scenarios):
+        base_id = id(scenario.base)
+        if base_id not in base_kpis:
+            base_kpis[base_id] = scenario.base.eval_dict()
+        kpis = scenario.eval_dict()
+        rows.append(
+            {
+                **kpis,
+                **{
+                    f"{key} Diff": round(value - base_kpis[base_id][key], 2)
+                    for key, value in kpis.items()
+                },
+            }
+        )
+        index.append(scenario.name if scenario.name is not None else i)
+
+    return pd.DataFrame(rows, index=index)
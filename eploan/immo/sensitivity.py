@@ -0,0 +1,223 @@
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .immo import Immo
+
+# inputs the kpis are differentiated by, the loan rate is 1 - proprietary_capital_rate
+inputs: list[str] = [
+    "price",
+    "modernisation",
+    "notary_rate",
+    "property_buy_tax_rate",
+    "land_registry_rate",
+    "agent_rate",
+    "proprietary_capital_rate",
+    "net_cold_rent",
+    "operating_expenses",
+    "operating_income",
+    "interest_rate",
+    "annuity",
+]
+
+
+class Dual:
+    """
+    Forward mode value with its gradient. value has the batch shape (n,),
+    grad has one extra last axis with the derivative by every input.
+    """
+
+    __slots__ = ("value", "grad")
+    # let numpy arrays defer to the reflected operators of Dual
+    __array_ufunc__ = None
+
+    def __init__(self, value: np.ndarray, grad: np.ndarray):
+        self.value = value
+        self.grad = grad
+
+    @classmethod
+    def variables(cls, values: dict[str, np.ndarray]) -> dict[str, "Dual"]:
+        """one dual per input with a unit gradient in its own slot"""
+        arrays = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=float)) for value in values.values())
+        )
+        eye = np.eye(len(values))
+        return {
+            name: cls(value, np.broadcast_to(eye[idx], value.shape + (len(values),)))
+            for idx, (name, value) in enumerate(zip(values, arrays))
+        }
+
+    def __add__(self, other) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.grad + other.grad)
+        return Dual(self.value + other, self.grad)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Dual":
+        return Dual(-self.value, -self.grad)
+
+    def __sub__(self, other) -> "Dual":
+        return self + (-other)
+
+    def __rsub__(self, other) -> "Dual":
+        return -self + other
+
+    def __mul__(self, other) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(
+                self.value * other.value,
+                self.grad * other.value[..., None] + other.grad * self.value[..., None],
+            )
+        other = np.asarray(other, dtype=float)
+        return Dual(self.value * other, self.grad * other[..., None])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> "Dual":
+        if isinstance(other, Dual):
+            value = self.value / other.value
+            return Dual(
+                value,
+                (self.grad - other.grad * value[..., None]) / other.value[..., None],
+            )
+        return self * (1 / np.asarray(other, dtype=float))
+
+    def __rtruediv__(self, other) -> "Dual":
+        other = np.asarray(other, dtype=float)
+        return Dual(
+            other / self.value,
+            -self.grad * (other / self.value**2)[..., None],
+        )
+
+    def __pow__(self, exponent) -> "Dual":
+        exponent = np.asarray(exponent, dtype=float)
+        return Dual(
+            self.value**exponent,
+            self.grad * (exponent * self.value ** (exponent - 1))[..., None],
+        )
+
+
+def where(condition, x: Dual, y: Dual) -> Dual:
+    condition = np.asarray(condition)
+    return Dual(
+        np.where(condition, x.value, y.value),
+        np.where(condition[..., None], x.grad, y.grad),
+    )
+
+
+def closed_form_rest_dept(loan_amount: Dual, interest_rate: Dual, annuity: Dual, period) -> Dual:
+    """rest debt after period years without the rounding to cents of credit.rest_dept"""
+    growth = (1 + interest_rate) ** period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rest = loan_amount * growth - annuity * (growth - 1) / interest_rate
+    return where(interest_rate.value == 0, loan_amount - annuity * period, rest)
+
+
+def kpi_duals(
+    price,
+    modernisation,
+    notary_rate,
+    property_buy_tax_rate,
+    land_registry_rate,
+    agent_rate,
+    proprietary_capital_rate,
+    net_cold_rent,
+    operating_expenses,
+    operating_income,
+    interest_rate,
+    annuity,
+    period,
+) -> dict[str, Dual]:
+    """
+    The kpis of Immo with their gradients by all inputs in one pass, vectorized
+    over the properties. The amounts are not rounded to cents, so the values
+    can differ from Immo by the rounding. The mortgage amount is the loan.
+    """
+    x = Dual.variables(
+        {
+            "price": price,
+            "modernisation": modernisation,
+            "notary_rate": notary_rate,
+            "property_buy_tax_rate": property_buy_tax_rate,
+            "land_registry_rate": land_registry_rate,
+            "agent_rate": agent_rate,
+            "proprietary_capital_rate": proprietary_capital_rate,
+            "net_cold_rent": net_cold_rent,
+            "operating_expenses": operating_expenses,
+            "operating_income": operating_income,
+            "interest_rate": interest_rate,
+            "annuity": annuity,
+        }
+    )
+    period = np.asarray(period, dtype=float)
+    gain_period = np.where(period >= 10, 10, period)
+
+    extras_rate = (
+        x["notary_rate"]
+        + x["property_buy_tax_rate"]
+        + x["land_registry_rate"]
+        + x["agent_rate"]
+    )
+    total = x["price"] + x["modernisation"] + x["price"] * extras_rate
+    proprietary_capital = total * x["proprietary_capital_rate"]
+    loan_amount = total * (1 - x["proprietary_capital_rate"])
+    net_annually = 12 * (
+        x["net_cold_rent"] - x["operating_expenses"] + x["operating_income"]
+    )
+
+    rest = closed_form_rest_dept(loan_amount, x["interest_rate"], x["annuity"], gain_period)
+    ten_year_net_capital_gain = (
+        x["price"]
+        + x["modernisation"]
+        - proprietary_capital
+        - rest
+        + gain_period * (net_annually - x["annuity"])
+    )
+    # like Immo the returns on equity are 0 without proprietary capital
+    no_equity = proprietary_capital.value == 0
+    zero = Dual(np.zeros_like(total.value), np.zeros_like(total.grad))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "gross_rental_yield": 12 * x["net_cold_rent"] / total,
+            "net_rental_yield": (net_annually - x["annuity"]) / total,
+            "return_on_equity": where(
+                no_equity, zero, net_annually / proprietary_capital
+            ),
+            "ten_year_net_capital_gain": ten_year_net_capital_gain,
+            "ten_year_roe": where(
+                no_equity, zero, ten_year_net_capital_gain / proprietary_capital
+            ),
+        }
+
+
+def immo_sensitivities(properties: Iterable[Immo]) -> pd.DataFrame:
+    """
+    Derivatives of the kpis of every property by every input, indexed by
+    (Property, Input) with one column per kpi.
+    """
+    properties = list(properties)
+    duals = kpi_duals(
+        price=[prop.base_cost.price for prop in properties],
+        modernisation=[prop.base_cost.modernisation for prop in properties],
+        notary_rate=[prop.base_cost.notary_rate for prop in properties],
+        property_buy_tax_rate=[prop.base_cost.property_buy_tax_rate for prop in properties],
+        land_registry_rate=[prop.base_cost.land_registry_rate for prop in properties],
+        agent_rate=[prop.base_cost.agent_rate for prop in properties],
+        proprietary_capital_rate=[
+            prop.base_cost.proprietary_capital_rate for prop in properties
+        ],
+        net_cold_rent=[prop.cash_flow.net_cold_rent for prop in properties],
+        operating_expenses=[prop.cash_flow.operating_expenses for prop in properties],
+        operating_income=[prop.cash_flow.operating_income for prop in properties],
+        interest_rate=[prop.mortgage.interest_rate for prop in properties],
+        annuity=[prop.mortgage.annuity for prop in properties],
+        period=[prop.mortgage.period for prop in properties],
+    )
+    index = pd.MultiIndex.from_product(
+        [range(len(properties)), inputs], names=["Property", "Input"]
+    )
+    return pd.DataFrame(
+        {name: dual.grad.reshape(-1) for name, dual in duals.items()}, index=index
+    )
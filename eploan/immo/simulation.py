@@ -0,0 +1,127 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .. import loan
+from .immo import Immo
+
+
+@dataclass
+class RiskAssumptions:
+    vacancy_probability: float = 0.03  # per month
+    default_probability: float = 0.01  # per rented month
+    shock_probability: float = 0.05  # per year
+    shock_mean: float = 5000  # mean of the exponential maintenance shock
+    liquidity_reserve: float = 0
+
+
+@dataclass
+class SimulationResult:
+    yearly_net_cash_flow: np.ndarray  # paths x years, after annuity
+    shortfall_probability: float
+    ten_year_roe: np.ndarray  # paths
+
+    def summary(self, quantiles: tuple[float, ...] = (0.05, 0.5, 0.95)) -> pd.DataFrame:
+        yearly = np.quantile(self.yearly_net_cash_flow, quantiles, axis=0)
+        return pd.DataFrame(
+            yearly.T,
+            index=pd.RangeIndex(1, yearly.shape[1] + 1, name="Year"),
+            columns=[f"Q{round(q * 100)}" for q in quantiles],
+        )
+
+
+def _simulate_chunk(
+    seed: np.random.SeedSequence,
+    n_paths: int,
+    net_cold_rent: float,
+    operating_income: float,
+    net_annually: float,
+    annuities: np.ndarray,
+    assumptions: RiskAssumptions,
+) -> np.ndarray:
+    """yearly net cash flow after annuity of n_paths sampled paths"""
+    rng = np.random.default_rng(seed)
+    shape = (n_paths, len(annuities))
+    vacant = rng.binomial(12, assumptions.vacancy_probability, shape)
+    defaulted = rng.binomial(12 - vacant, assumptions.default_probability)
+    shocks = rng.binomial(1, assumptions.shock_probability, shape) * rng.exponential(
+        assumptions.shock_mean, shape
+    )
+    # without a tenant paying, the rent and the operating income are missing
+    lost = (vacant + defaulted) * (net_cold_rent + operating_income)
+    return net_annually - lost - shocks - annuities
+
+
+def simulate(
+    cur_immo: Immo,
+    n_paths: int = 10_000,
+    years: int = 10,
+    assumptions: Optional[RiskAssumptions] = None,
+    seed: Optional[int] = None,
+    chunk_size: int = 10_000,
+    workers: Optional[int] = None,
+) -> SimulationResult:
+    """
+    Sample vacancy months, rent defaults and maintenance shocks for every path
+    and year and apply them to the cash flow and the mortgage schedule.
+    The paths are split in chunks with their own spawned seeds, so the result
+    only depends on the seed and the chunk size, not on the number of workers.
+    """
+    if assumptions is None:
+        assumptions = RiskAssumptions()
+
+    mortgage = cur_immo.mortgage
+    horizon = max(years, 10)
+    schedules = loan.batch.amortize(
+        mortgage.amount,
+        mortgage.interest_rate,
+        mortgage.annuity,
+        min(mortgage.repay_time_total, horizon),
+        max_period=horizon,
+    )
+    annuities = schedules.annuity[0]
+
+    sizes = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [
+        (
+            chunk_seed,
+            size,
+            cur_immo.cash_flow.net_cold_rent,
+            cur_immo.cash_flow.operating_income,
+            cur_immo.cash_flow.net_annually,
+            annuities,
+            assumptions,
+        )
+        for chunk_seed, size in zip(seeds, sizes)
+    ]
+    if workers is not None and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(_simulate_chunk, *zip(*args)))
+    else:
+        chunks = [_simulate_chunk(*chunk_args) for chunk_args in args]
+    cash_flow = np.concatenate(chunks)
+
+    cumulated = np.cumsum(cash_flow[:, :years], axis=1)
+    shortfall = (cumulated + assumptions.liquidity_reserve < 0).any(axis=1)
+
+    # ten year roe like Immo.ten_year_roe with the sampled cash flows
+    base_cost = cur_immo.base_cost
+    period = 10 if mortgage.period >= 10 else mortgage.period
+    rest = loan.batch.rest_dept(mortgage.amount, mortgage.interest_rate, period, mortgage.annuity)[0]
+    gain = round(
+        base_cost.price + base_cost.modernisation - base_cost.proprietary_capital - rest, 2
+    ) + cash_flow[:, :period].sum(axis=1)
+    if base_cost.proprietary_capital == 0:
+        roe = np.zeros(n_paths)
+    else:
+        roe = gain / base_cost.proprietary_capital
+
+    return SimulationResult(
+        yearly_net_cash_flow=cash_flow[:, :years],
+        shortfall_probability=float(shortfall.mean()),
+        ten_year_roe=roe,
+    )
@@ -0,0 +1,245 @@
+import logging
+from pathlib import Path
+from typing import Iterable, Iterator, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import loan
+from . import immo
+
+log = logging.getLogger(__name__)
+
+
+class InvalidListingError(ValueError):
+    def __init__(self, message):
+        super().__init__(message)
+
+
+# flat listing columns with their dtype and default, grouped like prop_data
+schema: dict[str, dict[str, tuple[str, object]]] = {
+    "details": {
+        "living_space": ("float64", np.nan),
+        "postal_code": ("string", pd.NA),
+    },
+    "base_cost": {
+        "price": ("float64", np.nan),
+        "modernisation": ("float64", 0.0),
+        "property_buy_tax_rate": ("float64", np.nan),
+        "agent_rate": ("float64", 0.0357),
+        "notary_rate": ("float64", 0.015),
+        "land_registry_rate": ("float64", 0.005),
+        "proprietary_capital_rate": ("float64", np.nan),
+        "loan_rate": ("float64", np.nan),
+    },
+    "cash_flow": {
+        "net_cold_rent": ("float64", np.nan),
+        "operating_expanses": ("float64", 0.0),
+        "operating_income": ("float64", 0.0),
+    },
+}
+
+dtypes: dict[str, str] = {
+    name: dtype for fields in schema.values() for name, (dtype, _) in fields.items()
+}
+
+required: tuple[str, ...] = ("living_space", "price", "net_cold_rent")
+
+# rule name -> function returning the mask of violating rows
+rules = {
+    "missing value": lambda df: df[list(required)].isna().any(axis=1),
+    "price not positive": lambda df: df["price"] <= 0,
+    "living space not positive": lambda df: df["living_space"] <= 0,
+    "negative net cold rent": lambda df: df["net_cold_rent"] < 0,
+    "negative operating expenses": lambda df: df["operating_expanses"] < 0,
+    "negative operating income": lambda df: df["operating_income"] < 0,
+    "negative modernisation": lambda df: df["modernisation"] < 0,
+    "negative rate": lambda df: (
+        df[
+            [
+                "property_buy_tax_rate",
+                "agent_rate",
+                "notary_rate",
+                "land_registry_rate",
+                "proprietary_capital_rate",
+                "loan_rate",
+            ]
+        ]
+        < 0
+    ).any(axis=1),
+    "loan rate greater than 1": lambda df: df["loan_rate"] > 1,
+    "proprietary capital rate greater than 1": lambda df: df[
+        "proprietary_capital_rate"
+    ]
+    > 1,
+}
+
+
+def normalize(df: pd.DataFrame, columns: Optional[dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Rename the columns onto the schema, add missing columns with their defaults
+    and complete the loan and proprietary capital rates and the property buy
+    tax rate (from the postal code, else the median).
+    """
+    if columns:
+        df = df.rename(columns=columns)
+
+    result = pd.DataFrame(index=df.index)
+    for fields in schema.values():
+        for name, (dtype, default) in fields.items():
+            if name in df.columns:
+                result[name] = df[name].astype(dtype)
+            else:
+                result[name] = pd.Series(default, index=df.index, dtype=dtype)
+
+    loan_rate = result["loan_rate"]
+    capital_rate = result["proprietary_capital_rate"]
+    result["loan_rate"] = loan_rate.fillna(1 - capital_rate).fillna(0.8)
+    result["proprietary_capital_rate"] = capital_rate.fillna(1 - result["loan_rate"])
+
+    missing_tax_rate = result["property_buy_tax_rate"].isna().to_numpy()
+    if missing_tax_rate.any():
+        postal_codes = result["postal_code"].to_numpy(dtype=object, na_value=None)
+        rates = immo.property_buy_tax.rates_from_postal_codes(
+            postal_codes[missing_tax_rate], fallback=immo.property_buy_tax.median()
+        )
+        result.loc[missing_tax_rate, "property_buy_tax_rate"] = rates
+    return result
+
+
+def validate(df: pd.DataFrame) -> pd.DataFrame:
+    """boolean frame of the rule violations of normalized listings"""
+    return pd.DataFrame({name: rule(df) for name, rule in rules.items()}, index=df.index)
+
+
+def _check(df: pd.DataFrame, errors: Literal["raise", "drop"]) -> pd.DataFrame:
+    violations = validate(df)
+    invalid = violations.any(axis=1)
+    if not invalid.any():
+        return df
+
+    if errors == "raise":
+        first = invalid.idxmax()
+        broken = list(violations.columns[violations.loc[first]])
+        raise InvalidListingError(
+            f"{invalid.sum()} invalid listings, first at row {first}: {', '.join(broken)}"
+        )
+    log.info(f"{invalid.sum()} invalid listings were dropped")
+    return df[~invalid]
+
+
+def read_listings(
+    path: str | Path,
+    chunksize: int = 10_000,
+    columns: Optional[dict[str, str]] = None,
+    errors: Literal["raise", "drop"] = "drop",
+    **read_csv_kwargs,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a listing csv in chunks of normalized and validated listings.
+    columns maps csv column names onto the schema names.
+    """
+    csv_dtypes = dict(dtypes)
+    if columns:
+        csv_dtypes.update({source: dtypes[target] for source, target in columns.items() if target in dtypes})
+    with pd.read_csv(path, chunksize=chunksize, dtype=csv_dtypes, **read_csv_kwargs) as reader:
+        for chunk in reader:
+            yield _check(normalize(chunk, columns), errors)
+
+
+def frame_from_prop_data(prop_datas: Iterable[dict]) -> pd.DataFrame:
+    """flatten property data dicts (like data/house.json) into normalized listings"""
+    rows = []
+    for prop_data in prop_datas:
+        row = {}
+        for group in schema:
+            row.update(prop_data.get(group, {}))
+        if prop_data.get("cash_flow", {}).get("period", "monthly") != "monthly":
+            raise InvalidListingError("only monthly cash flows can be flattened")
+        row.pop("period", None)
+        rows.append(row)
+    return normalize(pd.DataFrame(rows))
+
+
+def listing_financing(
+    df: pd.DataFrame,
+    interest_rate: float,
+    annuity: Optional[float] = None,
+    repayment_rate: Optional[float] = None,
+    period: Optional[float] = None,
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """
+    The base cost amounts of normalized listings and their mortgages with one
+    financing given by exactly one of annuity, repayment rate or period.
+    """
+    if sum(value is not None for value in (annuity, repayment_rate, period)) != 1:
+        raise ValueError("Specify exactly one of annuity, repayment_rate or period")
+
+    base_cost = immo.costs.base_cost_arrays(
+        df["price"].to_numpy(),
+        df["modernisation"].to_numpy(),
+        df["property_buy_tax_rate"].to_numpy(),
+        df["agent_rate"].to_numpy(),
+        df["notary_rate"].to_numpy(),
+        df["land_registry_rate"].to_numpy(),
+        df["proprietary_capital_rate"].to_numpy(),
+        df["loan_rate"].to_numpy(),
+    )
+    mortgages = loan.batch.financing(
+        base_cost["loan"],
+        interest_rate,
+        annuities=np.nan if annuity is None else annuity,
+        repayment_rates=np.nan if repayment_rate is None else repayment_rate,
+        periods=np.nan if period is None else period,
+    )
+    return base_cost, mortgages
+
+
+def evaluate_listings(
+    df: pd.DataFrame,
+    interest_rate: float,
+    annuity: Optional[float] = None,
+    repayment_rate: Optional[float] = None,
+    period: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    Columnar evaluation of normalized listings with one financing given by
+    annuity, repayment rate or period. Returns the mortgage summary and kpis.
+    """
+    base_cost, mortgages = listing_financing(
+        df, interest_rate, annuity, repayment_rate, period
+    )
+    kpis = immo.batch.kpis(
+        base_cost,
+        df["net_cold_rent"].to_numpy(),
+        df["operating_expanses"].to_numpy(),
+        df["operating_income"].to_numpy(),
+        interest_rate,
+        mortgages["annuity"],
+        mortgages["period"],
+    )
+    return pd.DataFrame(
+        {
+            "Loan": base_cost["loan"],
+            "Annuity": mortgages["annuity"],
+            "Initial Repayment Rate": mortgages["repayment_rate"],
+            "Repay Time Total": mortgages["repay_time_total"],
+            **immo.batch.eval_dict(kpis),
+        },
+        index=df.index,
+    )
+
+
+def evaluate_csv(
+    path: str | Path,
+    interest_rate: float,
+    annuity: Optional[float] = None,
+    repayment_rate: Optional[float] = None,
+    period: Optional[float] = None,
+    chunksize: int = 10_000,
+    columns: Optional[dict[str, str]] = None,
+    errors: Literal["raise", "drop"] = "drop",
+) -> Iterator[pd.DataFrame]:
+    """evaluate a listing csv chunk by chunk, only one chunk is held in memory"""
+    for chunk in read_listings(path, chunksize=chunksize, columns=columns, errors=errors):
+        yield evaluate_listings(chunk, interest_rate, annuity, repayment_rate, period)
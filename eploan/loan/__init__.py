@@ -1,5 +1,12 @@
 # This file makes the loan directory a Python package
-from .compound import annualized_interest, compound_interest, compound_interest_detailed, compound_interest_plot
+from .compound import annualized_interest, compound_growth, compound_interest, compound_interest_detailed, compound_interest_plot, compound_interest_table
 from .credit import annuity_from_period, loan_period, annuity_from_repayment_rate, rest_dept, plot_credit_repay_hist, repayment_rate_from_annuity
 from .mortgage import Mortgage
 from .installments import create_installment, custom_installment, dynamic_installment, fixed_installment
+from . import plotting
+from . import batch
+from . import dates
+from . import cents
+from .schedule import Schedule
+from .frozen import FrozenMortgage
+from .segments import SegmentedSchedule
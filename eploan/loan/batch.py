@@ -0,0 +1,258 @@
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+from . import cents
+
+Backend = Literal["float", "cents"]
+
+
+def annuity_from_period(loan_amount, interest_rate, period) -> np.ndarray:
+    """
+    Broadcasting version of credit.annuity_from_period, NaN where the
+    annuity is undefined (e.g. a period of 0).
+    """
+    loan_amount = np.asarray(loan_amount, dtype=float)
+    interest_rate = np.asarray(interest_rate, dtype=float)
+    period = np.trunc(np.asarray(period, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        discount_factor = (1 / (1 + interest_rate)) ** period
+        annuity = loan_amount * interest_rate / (1 - discount_factor)
+        # without interest the loan is split evenly over the periods
+        annuity = np.where(interest_rate == 0, loan_amount / period, annuity)
+    return np.round(np.where(np.isfinite(annuity), annuity, np.nan), 2)
+
+
+def loan_period_valid(loan_amount, annuity, interest_rate) -> np.ndarray:
+    """mask of the combinations where the annuity pays off the loan"""
+    loan_amount = np.asarray(loan_amount, dtype=float)
+    annuity = np.asarray(annuity, dtype=float)
+    interest_rate = np.asarray(interest_rate, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = interest_rate * loan_amount / annuity
+    return (annuity > 0) & (ratio < 1) & (interest_rate > -1)
+
+
+def loan_period(loan_amount, annuity, interest_rate) -> np.ndarray:
+    """
+    Broadcasting version of credit.loan_period, NaN where the annuity does not
+    pay off the loan instead of raising a ValueError.
+    """
+    loan_amount = np.asarray(loan_amount, dtype=float)
+    annuity = np.asarray(annuity, dtype=float)
+    interest_rate = np.asarray(interest_rate, dtype=float)
+    valid = loan_period_valid(loan_amount, annuity, interest_rate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        period = np.log(1 - (interest_rate * loan_amount / annuity)) / np.log(
+            1 / (1 + interest_rate)
+        )
+        period = np.where(interest_rate == 0, loan_amount / annuity, period)
+    return np.where(valid, period, np.nan)
+
+
+def annuity_from_repayment_rate(
+    loan_amount, interest_rate, repayment_rate=0.01
+) -> np.ndarray:
+    """broadcasting version of credit.annuity_from_repayment_rate"""
+    loan_amount = np.asarray(loan_amount, dtype=float)
+    return np.round(
+        loan_amount * np.asarray(repayment_rate, dtype=float)
+        + loan_amount * np.asarray(interest_rate, dtype=float)
+    )
+
+
+def repayment_rate_from_annuity(loan_amount, interest_rate, annuity) -> np.ndarray:
+    """broadcasting version of credit.repayment_rate_from_annuity, NaN for a loan of 0"""
+    loan_amount = np.asarray(loan_amount, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.asarray(annuity, dtype=float) / loan_amount - np.asarray(
+            interest_rate, dtype=float
+        )
+    return np.where(loan_amount == 0, np.nan, rate)
+
+
+def financing(
+    loan_amounts,
+    interest_rates,
+    annuities=np.nan,
+    repayment_rates=np.nan,
+    periods=np.nan,
+) -> dict[str, np.ndarray]:
+    """
+    Mortgage parameters for a mix of financing offers. Each offer is given by
+    its annuity, its repayment rate or its period (the other two are NaN) and
+    is completed the same way as in the calculators.
+    """
+    loan_amounts, interest_rates, annuities, repayment_rates, periods = (
+        np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(values, dtype=float))
+                for values in (
+                    loan_amounts,
+                    interest_rates,
+                    annuities,
+                    repayment_rates,
+                    periods,
+                )
+            )
+        )
+    )
+    by_annuity = ~np.isnan(annuities)
+    by_repayment_rate = ~by_annuity & ~np.isnan(repayment_rates)
+    by_period = ~by_annuity & ~by_repayment_rate & ~np.isnan(periods)
+
+    annuity = np.select(
+        [by_annuity, by_repayment_rate, by_period],
+        [
+            annuities,
+            annuity_from_repayment_rate(loan_amounts, interest_rates, repayment_rates),
+            annuity_from_period(loan_amounts, interest_rates, periods),
+        ],
+        default=np.nan,
+    )
+    repayment_rate = np.where(
+        by_repayment_rate,
+        repayment_rates,
+        repayment_rate_from_annuity(loan_amounts, interest_rates, annuity),
+    )
+    repay_time = loan_period(loan_amounts, annuity, interest_rates)
+    period = np.round(np.where(by_period, periods, repay_time))
+    return {
+        "annuity": annuity,
+        "repayment_rate": repayment_rate,
+        "period": period,
+        "repay_time_total": np.round(repay_time),
+    }
+
+
+@dataclass
+class ScheduleArrays:
+    """
+    Amortization schedules of many loans, the last axis holds the periods.
+    Periods after the end of a loan are 0 and not active.
+    """
+
+    credit_pre: np.ndarray
+    interest: np.ndarray
+    repay: np.ndarray
+    credit_post: np.ndarray
+    active: np.ndarray
+    rest_dept: np.ndarray  # credit after the last active period of each loan
+
+    @property
+    def annuity(self) -> np.ndarray:
+        return self.interest + self.repay
+
+    @property
+    def periods(self) -> np.ndarray:
+        return self.active.sum(axis=-1)
+
+
+def amortize(
+    loan_amounts,
+    interest_rates,
+    annuities,
+    periods,
+    max_period: int | None = None,
+    backend: Backend = "float",
+) -> ScheduleArrays:
+    """
+    Vectorized version of credit.rest_dept for many loans at once. The inputs
+    broadcast to any shape, the schedules get an extra last axis for the periods.
+    The loop runs over the periods, every step handles all loans. With the float
+    backend the credit is rounded to cents after every period like in
+    rest_dept, the cents backend computes in integer cents with the interest
+    rounded like a bank.
+    """
+    loan_amounts, interest_rates, annuities, periods = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(loan_amounts, dtype=float)),
+        np.atleast_1d(np.asarray(interest_rates, dtype=float)),
+        np.atleast_1d(np.asarray(annuities, dtype=float)),
+        np.atleast_1d(np.asarray(periods, dtype=np.int64)),
+    )
+    batch_shape = loan_amounts.shape
+
+    if backend == "cents":
+        result = cents.amortize(
+            cents.to_cents(loan_amounts.ravel()),
+            cents.scale_rates(interest_rates.ravel()),
+            cents.to_cents(annuities.ravel()),
+            periods.ravel(),
+            max_period,
+        )
+        result = {
+            name: values if name == "active" else cents.from_cents(values)
+            for name, values in result.items()
+        }
+    elif backend == "float":
+        result = _amortize(
+            loan_amounts.ravel(),
+            interest_rates.ravel(),
+            annuities.ravel(),
+            periods.ravel(),
+            max_period,
+        )
+    else:
+        raise ValueError(f"Unknown backend {backend}")
+
+    return ScheduleArrays(
+        **{
+            name: values.reshape(batch_shape + values.shape[1:])
+            for name, values in result.items()
+        }
+    )
+
+
+def _amortize(
+    loan_amounts: np.ndarray,
+    interest_rates: np.ndarray,
+    annuities: np.ndarray,
+    periods: np.ndarray,
+    max_period: int | None,
+) -> dict[str, np.ndarray]:
+    if (interest_rates < 0).any():
+        raise ValueError("Negative Interest Rate are not possible for this calculation")
+
+    # a loan of 0 stays 0 in rest_dept
+    periods = np.where(loan_amounts == 0, 0, np.clip(periods, 0, None))
+    if max_period is None:
+        max_period = int(periods.max()) if periods.size else 0
+
+    shape = (len(loan_amounts), max_period)
+    credit_pre = np.zeros(shape)
+    interest = np.zeros(shape)
+    repay = np.zeros(shape)
+    credit_post = np.zeros(shape)
+    active = np.arange(1, max_period + 1) <= periods[:, None]
+
+    credit = loan_amounts.copy()
+    for period in range(max_period):
+        mask = active[:, period]
+        cur_interest = credit * interest_rates
+        cur_repay = annuities - cur_interest
+        cur_post = np.round(credit - cur_repay, 2)
+
+        credit_pre[:, period] = np.where(mask, credit, 0)
+        interest[:, period] = np.where(mask, cur_interest, 0)
+        repay[:, period] = np.where(mask, cur_repay, 0)
+        credit_post[:, period] = np.where(mask, cur_post, 0)
+        credit = np.where(mask, cur_post, credit)
+
+    return {
+        "credit_pre": credit_pre,
+        "interest": interest,
+        "repay": repay,
+        "credit_post": credit_post,
+        "active": active,
+        "rest_dept": credit,
+    }
+
+
+def rest_dept(
+    loan_amounts, interest_rates, periods, annuities, backend: Backend = "float"
+) -> np.ndarray:
+    """vectorized credit.rest_dept without history"""
+    return amortize(
+        loan_amounts, interest_rates, annuities, periods, backend=backend
+    ).rest_dept
@@ -0,0 +1,130 @@
+import numpy as np
+
+
+# rates are stored as integers with 8 decimal places. mul_rate splits the
+# amount so the products stay within int64, the result must fit into int64
+# cents (about 9.2e16 euro at a rate of 100%), larger results raise.
+RATE_SCALE: int = 10**8
+INT64_MAX: int = np.iinfo(np.int64).max
+
+
+def to_cents(amounts) -> np.ndarray:
+    """amounts in euro to integer cents, rounded half away from zero"""
+    amounts = np.asarray(amounts, dtype=float)
+    # the small offset keeps decimal halves like 0.285 from rounding down
+    cents = np.floor(np.abs(amounts) * 100 + 0.5 + 1e-6)
+    return (np.sign(amounts) * cents).astype(np.int64)
+
+
+def from_cents(cents) -> np.ndarray:
+    return np.asarray(cents, dtype=np.int64) / 100
+
+
+def scale_rates(rates) -> np.ndarray:
+    return np.rint(np.asarray(rates, dtype=float) * RATE_SCALE).astype(np.int64)
+
+
+def mul_rate(cents, scaled_rates) -> np.ndarray:
+    """cents times a scaled rate, rounded half away from zero to whole cents"""
+    cents = np.asarray(cents, dtype=np.int64)
+    scaled_rates = np.asarray(scaled_rates, dtype=np.int64)
+    sign = np.sign(cents) * np.sign(scaled_rates)
+    abs_rates = np.abs(scaled_rates)
+    # |cents| * rate / scale = high * rate + low * rate / scale with
+    # low < scale, so low * rate stays far below the int64 maximum
+    high, low = np.divmod(np.abs(cents), RATE_SCALE)
+    if (high > INT64_MAX // np.maximum(abs_rates, 1)).any():
+        raise OverflowError("The amount times the rate exceeds the int64 range of cents")
+    rounded = high * abs_rates + (low * abs_rates + RATE_SCALE // 2) // RATE_SCALE
+    return sign * rounded
+
+
+def amortize(
+    loan_cents, scaled_rates, annuity_cents, periods, max_period: int | None = None
+) -> dict[str, np.ndarray]:
+    """
+    Amortization schedules in integer cents like a bank computes them: the
+    interest of every period is rounded to cents and the repayment is the
+    annuity minus the interest, so no further rounding is needed.
+    """
+    loan_cents, scaled_rates, annuity_cents, periods = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(loan_cents, dtype=np.int64)),
+        np.atleast_1d(np.asarray(scaled_rates, dtype=np.int64)),
+        np.atleast_1d(np.asarray(annuity_cents, dtype=np.int64)),
+        np.atleast_1d(np.asarray(periods, dtype=np.int64)),
+    )
+    if (scaled_rates < 0).any():
+        raise ValueError("Negative Interest Rate are not possible for this calculation")
+
+    periods = np.where(loan_cents == 0, 0, np.clip(periods, 0, None))
+    if max_period is None:
+        max_period = int(periods.max()) if periods.size else 0
+
+    shape = (len(loan_cents), max_period)
+    credit_pre = np.zeros(shape, dtype=np.int64)
+    interest = np.zeros(shape, dtype=np.int64)
+    repay = np.zeros(shape, dtype=np.int64)
+    credit_post = np.zeros(shape, dtype=np.int64)
+    active = np.arange(1, max_period + 1) <= periods[:, None]
+
+    credit = loan_cents.copy()
+    for period in range(max_period):
+        mask = active[:, period]
+        cur_interest = mul_rate(credit, scaled_rates)
+        cur_repay = annuity_cents - cur_interest
+        cur_post = credit - cur_repay
+
+        credit_pre[:, period] = np.where(mask, credit, 0)
+        interest[:, period] = np.where(mask, cur_interest, 0)
+        repay[:, period] = np.where(mask, cur_repay, 0)
+        credit_post[:, period] = np.where(mask, cur_post, 0)
+        credit = np.where(mask, cur_post, credit)
+
+    return {
+        "credit_pre": credit_pre,
+        "interest": interest,
+        "repay": repay,
+        "credit_post": credit_post,
+        "active": active,
+        "rest_dept": credit,
+    }
+
+
+def base_cost(
+    price,
+    modernisation=0,
+    property_buy_tax_rate=None,
+    agent_rate=0.0357,
+    notary_rate=0.015,
+    land_registry_rate=0.005,
+    proprietary_capital_rate=0.2,
+    loan_rate=0.8,
+) -> dict[str, np.ndarray]:
+    """the derived amounts of BaseCost in integer cents for arrays of properties"""
+    if property_buy_tax_rate is None:
+        # imported here, the immo package itself depends on the loan package
+        from ..immo import property_buy_tax
+
+        property_buy_tax_rate = property_buy_tax.median()
+    price = to_cents(price)
+    modernisation = to_cents(modernisation)
+    extras_rate = (
+        np.asarray(notary_rate)
+        + np.asarray(property_buy_tax_rate)
+        + np.asarray(land_registry_rate)
+        + np.asarray(agent_rate)
+    )
+    extras = mul_rate(price, scale_rates(extras_rate))
+    total = price + modernisation + extras
+    return {
+        "price": price,
+        "modernisation": modernisation,
+        "notary": mul_rate(price, scale_rates(notary_rate)),
+        "property_buy_tax": mul_rate(price, scale_rates(property_buy_tax_rate)),
+        "land_registry": mul_rate(price, scale_rates(land_registry_rate)),
+        "agent": mul_rate(price, scale_rates(agent_rate)),
+        "extras": extras,
+        "total": total,
+        "proprietary_capital": mul_rate(total, scale_rates(proprietary_capital_rate)),
+        "loan": mul_rate(total, scale_rates(loan_rate)),
+    }
@@ -1,9 +1,13 @@
-from typing import Iterable, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 from . import installments
 
@@ -34,6 +38,38 @@ def compound_interest(starting_capital: float, # starting capital
     return round(total_net,2), equity
 
 
+def compound_growth(starting_capital,
+                    interest_rates,
+                    installments=0,
+                    years: Optional[int] = None,
+                    compounding: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """growth of savings plans with yearly interest rates and contributions per compounding period.
+    interest_rates: annual rates, scalar or one per year along the last axis (..., years)
+    installments: paid at the start of every compounding period, scalar or (..., years*compounding)
+    compounding: compounding periods per year, the annual rate is split evenly
+    returns: total amount and paid in equity after every compounding period"""
+    interest_rates = np.asarray(interest_rates, dtype=float)
+    if interest_rates.ndim == 0:
+        if years is None:
+            raise ValueError("years must be given for a constant interest rate")
+        interest_rates = np.full(years, interest_rates)
+
+    period_rates = np.repeat(interest_rates / compounding, compounding, axis=-1)
+    growth = np.cumprod(1 + period_rates, axis=-1)
+    # growth at the start of every period, the first period starts at 1
+    growth_before = np.concatenate([np.ones_like(growth[..., :1]), growth[..., :-1]], axis=-1)
+
+    starting_capital = np.asarray(starting_capital, dtype=float)[..., None]
+    installments = np.asarray(installments, dtype=float)
+    shape = np.broadcast_shapes(growth.shape, installments.shape, starting_capital.shape)
+    growth = np.broadcast_to(growth, shape)
+    growth_before = np.broadcast_to(growth_before, shape)
+    installments = np.broadcast_to(installments, shape)
+    total = growth * (starting_capital + np.cumsum(installments / growth_before, axis=-1))
+    equity = starting_capital + np.cumsum(installments, axis=-1)
+    return total, np.broadcast_to(equity, total.shape)
+
+
 def compound_interest_detailed(starting_capital: float, # starting capital
                                interest_rate: float, 
                                period: int, 
@@ -41,26 +77,37 @@ def compound_interest_detailed(starting_capital: float, # starting capital
                                installment_type: str = "fixed",
                                **kwargs) -> pd.DataFrame:
     
-    periods = np.arange(1, period+1,1)
-    
-    column_names= ["Period","Equity", "Interest", "Total"]
-    compound_df = pd.DataFrame(columns=column_names)
-    for period_delta in periods:
-        total_net,equity = compound_interest(starting_capital = starting_capital,
-                                             interest_rate = interest_rate,
-                                             period = period_delta,
-                                             installment = installment,
-                                             installment_type=installment_type,
-                                             **kwargs)
-        cur_df = pd.DataFrame(columns=column_names)
-        cur_df.loc[0] = [period_delta, equity, total_net-equity, total_net]
-        compound_df = pd.concat([
-            compound_df if not compound_df.empty else None,
-            cur_df], axis=0)
-    
-    compound_df.reset_index(inplace=True, drop=True)
-    return compound_df
+    if np.ndim(installment) == 0 and installment == 0:
+        installment_array = np.zeros(period)
+    else:
+        installment_array = installments.create_installment(period, installment, installment_type, **kwargs)
+
+    total, equity = compound_growth(starting_capital, interest_rate, installment_array, years=period)
+    total = np.round(total, 2)
+    return pd.DataFrame({
+        "Period": np.arange(1, period+1),
+        "Equity": equity,
+        "Interest": total - equity,
+        "Total": total,
+    })
+
 
+def compound_interest_table(starting_capital: float,
+                            interest_rates: Union[float, Iterable[float]],
+                            installment: float = 0,
+                            years: Optional[int] = None,
+                            compounding: int = 12) -> pd.DataFrame:
+    """yearly table of a savings plan with yearly rates and contributions every compounding period"""
+    total, equity = compound_growth(starting_capital, interest_rates, installment, years, compounding)
+    year_end = slice(compounding-1, None, compounding)
+    total = np.round(total[..., year_end], 2)
+    equity = equity[..., year_end]
+    return pd.DataFrame({
+        "Period": np.arange(1, total.shape[-1]+1),
+        "Equity": equity,
+        "Interest": total - equity,
+        "Total": total,
+    })
 
 
 def compound_interest_plot(compound_df: pd.DataFrame) -> go.Figure:
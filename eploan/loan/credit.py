@@ -1,7 +1,13 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
 
-import plotly.graph_objects as go
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 
 def annuity_from_period(loan_amount: int, interest_rate:float, period: int) -> float:
     disount_factor = (1/(1+interest_rate))**int(period)
@@ -56,6 +62,7 @@ def rest_dept(loan_amount: float,
 
 def plot_credit_repay_hist(res_df: pd.DataFrame) -> go.Figure:
 
+    import plotly.graph_objects as go
     from plotly.subplots import make_subplots
 
     fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -0,0 +1,159 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from . import batch
+from .schedule import Schedule
+
+
+Frequency = Literal["annually", "semiannually", "quarterly", "monthly"]
+
+payments_per_year: dict[str, int] = {
+    "annually": 1,
+    "semiannually": 2,
+    "quarterly": 4,
+    "monthly": 12,
+}
+
+DAYS_PER_YEAR = 365
+
+
+def _payments_per_year(frequency: Frequency) -> int:
+    if frequency not in payments_per_year:
+        raise ValueError(f"Unknown payment frequency {frequency}")
+    return payments_per_year[frequency]
+
+
+def first_regular_dates(start_dates) -> np.ndarray:
+    """first day of the first full month on or after the start dates"""
+    start_dates = np.asarray(start_dates, dtype="datetime64[D]")
+    month_start = start_dates.astype("datetime64[M]").astype("datetime64[D]")
+    next_month = (start_dates.astype("datetime64[M]") + 1).astype("datetime64[D]")
+    return np.where(start_dates == month_start, start_dates, next_month)
+
+
+def payment_dates(
+    start_dates, n_periods: int, frequency: Frequency = "monthly", month_end: bool = True
+) -> np.ndarray:
+    """
+    Payment dates of the regular periods, one row per start date. The regular
+    periods start on the first of a month, the payment is due on the last day of
+    a period (month_end) or on the first day of the following period.
+    """
+    step = 12 // _payments_per_year(frequency)
+    first_months = np.atleast_1d(first_regular_dates(start_dates)).astype("datetime64[M]")
+    offsets = np.arange(1, n_periods + 1) * step
+    next_period_start = (first_months[:, None] + offsets).astype("datetime64[D]")
+    if month_end:
+        return next_period_start - 1
+    return next_period_start
+
+
+def stub_days(start_dates) -> np.ndarray:
+    """days of the partial first period before the regular periods start"""
+    start_dates = np.atleast_1d(np.asarray(start_dates, dtype="datetime64[D]"))
+    return (first_regular_dates(start_dates) - start_dates).astype(np.int64)
+
+
+def dated_schedules(
+    loan_amounts,
+    interest_rates,
+    annuities,
+    years,
+    start_dates,
+    frequency: Frequency = "monthly",
+    month_end: bool = True,
+) -> pd.DataFrame:
+    """
+    Date indexed schedules of many loans, sorted by payment date. Interest rates
+    and annuities are annual, the payments are split by the frequency. Every
+    loan runs until it is repaid or for at most years (None for no limit). A start
+    date within a month adds an interest only stub period (actual/365) with
+    period number 0 that ends on the last day of the start month.
+    """
+    n_per_year = _payments_per_year(frequency)
+    start_dates = np.atleast_1d(np.asarray(start_dates, dtype="datetime64[D]"))
+    (n_loans,) = np.broadcast_shapes(
+        start_dates.shape,
+        *(np.atleast_1d(values).shape for values in (loan_amounts, interest_rates, annuities, years)),
+    )
+
+    def as_loans(values) -> np.ndarray:
+        return np.broadcast_to(np.asarray(values, dtype=float), (n_loans,))
+
+    loan_amounts = as_loans(loan_amounts)
+    interest_rates = as_loans(interest_rates)
+    start_dates = np.broadcast_to(start_dates, (n_loans,))
+
+    annuities = as_loans(annuities)
+    # periods until the loan is repaid, the last one is a partial payment
+    payoff = np.ceil(
+        batch.loan_period(loan_amounts, annuities / n_per_year, interest_rates / n_per_year)
+    )
+    if years is None:
+        term = np.full(n_loans, np.nan)
+    else:
+        term = np.rint(as_loans(years) * n_per_year)
+    repaid = np.isfinite(payoff) & ~(term < payoff)
+    periods = np.where(repaid, payoff, term)
+    if np.isnan(periods).any():
+        raise ValueError("The annuity must be greater than the interest rate times the credit")
+    periods = periods.astype(np.int64)
+    schedules = batch.amortize(
+        loan_amounts, interest_rates / n_per_year, annuities / n_per_year, periods
+    )
+    # the final payment is the rest of the credit plus its interest
+    settled = np.flatnonzero(repaid & (periods > 0))
+    last = periods[settled] - 1
+    schedules.repay[settled, last] = schedules.credit_pre[settled, last]
+    schedules.credit_post[settled, last] = 0
+    max_period = schedules.active.shape[1]
+    dates = payment_dates(start_dates, max_period, frequency, month_end)
+
+    columns = Schedule.batch_columns(schedules)
+    cell_dates = dates[schedules.active]
+
+    days = stub_days(start_dates)
+    stub = (days > 0) & (loan_amounts != 0)
+    if stub.any():
+        stub_interest = loan_amounts[stub] * interest_rates[stub] * days[stub] / DAYS_PER_YEAR
+        stub_columns = {
+            "Loan": np.flatnonzero(stub),
+            "Period": np.zeros(stub.sum(), dtype=np.int64),
+            "Credit Pre": loan_amounts[stub],
+            "Interest": stub_interest,
+            "Repay": np.zeros(stub.sum()),
+            "Credit Post": loan_amounts[stub],
+        }
+        columns = {
+            name: np.concatenate([stub_columns[name], values])
+            for name, values in columns.items()
+        }
+        cell_dates = np.concatenate([first_regular_dates(start_dates[stub]) - 1, cell_dates])
+
+    order = np.lexsort((columns["Period"], columns["Loan"], cell_dates))
+    return pd.DataFrame(
+        {name: values[order] for name, values in columns.items()},
+        index=pd.DatetimeIndex(cell_dates[order], name="Date"),
+    )
+
+
+def fiscal_years(dates, start_month: int = 1) -> np.ndarray:
+    """fiscal year of the dates, named by the calendar year the fiscal year starts in"""
+    months = np.asarray(dates, dtype="datetime64[M]") - (start_month - 1)
+    return months.astype("datetime64[Y]").astype(np.int64) + 1970
+
+
+def fiscal_year_bounds(year: int, start_month: int = 1) -> tuple[np.datetime64, np.datetime64]:
+    """first day of the fiscal year and first day of the following one"""
+    start = np.datetime64(f"{year:04d}-01", "M") + (start_month - 1)
+    return start.astype("datetime64[D]"), (start + 12).astype("datetime64[D]")
+
+
+def slice_fiscal_year(schedule: pd.DataFrame, year: int, start_month: int = 1) -> pd.DataFrame:
+    """rows of a date sorted schedule that fall into the fiscal year"""
+    first, end = fiscal_year_bounds(year, start_month)
+    dates = schedule.index.values.astype("datetime64[D]")
+    lower, upper = np.searchsorted(dates, [first, end], side="left")
+    return schedule.iloc[lower:upper]
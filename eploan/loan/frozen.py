@@ -0,0 +1,94 @@
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
+from typing import Callable, Self
+
+from . import credit
+from .mortgage import Mortgage
+
+
+@lru_cache(maxsize=4096)
+def _rest_dept(amount: float, interest_rate: float, period: int, annuity: float) -> float:
+    return credit.rest_dept(amount, interest_rate, period, annuity)
+
+
+def add_with_methods(frozen_cls: type, mutable_cls: type) -> type:
+    """
+    Add a with_<name> method for every set_<name> method of the mutable class.
+    It applies the setter (and its clamps) to a thawed copy and freezes it again.
+    """
+
+    def make(setter: str) -> Callable:
+        def with_value(self, value):
+            mutable = self.thaw()
+            getattr(mutable, setter)(value)
+            return type(self).freeze(mutable)
+
+        with_value.__name__ = "with_" + setter.removeprefix("set_")
+        with_value.__doc__ = f"copy with {mutable_cls.__name__}.{setter} applied"
+        return with_value
+
+    for setter in vars(mutable_cls):
+        if setter.startswith("set_"):
+            setattr(frozen_cls, "with_" + setter.removeprefix("set_"), make(setter))
+    return frozen_cls
+
+
+@dataclass(frozen=True)
+class FrozenMortgage:
+    """
+    Immutable, hashable Mortgage. The derived values are computed once and the
+    update methods return new objects.
+    """
+
+    amount: float
+    interest_rate: float
+    annuity: float
+    period: int = 10
+    repayment_rate: float = 1.5
+
+    repay_time_total = cached_property(Mortgage.repay_time_total.fget)
+
+    @classmethod
+    def freeze(cls, mortgage: Mortgage) -> Self:
+        return cls(
+            amount=mortgage.amount,
+            interest_rate=mortgage.interest_rate,
+            annuity=mortgage.annuity,
+            period=mortgage.period,
+            repayment_rate=mortgage.repayment_rate,
+        )
+
+    def thaw(self) -> Mortgage:
+        return Mortgage(
+            self.amount,
+            self.interest_rate,
+            self.annuity,
+            _period=self.period,
+            _repayment_rate=self.repayment_rate,
+        )
+
+    def rest_dept_by_period(self, period: float) -> float:
+        return _rest_dept(self.amount, self.interest_rate, period, self.annuity)
+
+    def with_amount(self, amount: float) -> Self:
+        return replace(self, amount=amount)
+
+    def with_annuity(self, annuity: float) -> Self:
+        mortgage = self.thaw()
+        mortgage.update_annuity(annuity)
+        return self.freeze(mortgage)
+
+    def with_repayment_rate(self, repayment_rate: float) -> Self:
+        mortgage = self.thaw()
+        mortgage.update_repayment_rate(repayment_rate)
+        return self.freeze(mortgage)
+
+    def with_interest_rate(self, interest_rate: float) -> Self:
+        return replace(self, interest_rate=interest_rate)
+
+    def with_repay_time(self, repay_time: float) -> Self:
+        mortgage = self.thaw()
+        mortgage.update_repay_time(repay_time)
+        return self.freeze(mortgage)
+
+    summary_dict = Mortgage.summary_dict
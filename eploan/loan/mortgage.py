@@ -5,6 +5,9 @@ import pandas as pd
 
 
 from . import credit
+from . import dates
+from . import schedule as schedule_module
+from . import segments
 
 
 @dataclass
@@ -40,6 +43,36 @@ class Mortgage:
     def outlook(self) -> float:
         return credit.rest_dept(self.amount, self.interest_rate, self.repay_time_total, self.annuity, hist=True)
 
+    def dated_outlook(
+        self,
+        start_date: str | np.datetime64,
+        frequency: dates.Frequency = "annually",
+        month_end: bool = True,
+    ) -> pd.DataFrame:
+        return dates.dated_schedules(
+            self.amount,
+            self.interest_rate,
+            self.annuity,
+            None,
+            start_date,
+            frequency=frequency,
+            month_end=month_end,
+        ).drop(columns="Loan")
+
+    def schedule(self, float_type=np.float64, int_type=np.int64) -> schedule_module.Schedule:
+        return schedule_module.Schedule.from_loans(
+            self.amount,
+            self.interest_rate,
+            self.annuity,
+            self.repay_time_total,
+            float_type=float_type,
+            int_type=int_type,
+        )
+
+    def segmented(self) -> segments.SegmentedSchedule:
+        return segments.SegmentedSchedule(
+            self.amount, self.interest_rate, self.annuity, fixed_period=self.period)
+
     def outlook_plot(self):
         return credit.plot_credit_repay_hist(self.outlook())
 
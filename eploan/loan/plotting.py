@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+# figure json by (kind, data digest, point budget), least recently used first
+_figure_cache: OrderedDict[tuple, str] = OrderedDict()
+max_cached_figures: int = 128
+
+
+def clear_cache() -> None:
+    _figure_cache.clear()
+
+
+def downsample(
+    x: np.ndarray, ys: dict[str, np.ndarray], max_points: int, last: tuple[str, ...] = ()
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Reduce the series to at most max_points buckets. Each bucket starts at its
+    first x value and holds the mean of the series, or the last value for the
+    series named in last (e.g. balances).
+    """
+    x = np.asarray(x)
+    n = len(x)
+    if n <= max_points:
+        return x, {name: np.asarray(y, dtype=float) for name, y in ys.items()}
+
+    starts = np.unique(np.linspace(0, n, max_points, endpoint=False).astype(np.int64))
+    counts = np.diff(np.append(starts, n))
+    ends = starts + counts - 1
+
+    reduced = {}
+    for name, y in ys.items():
+        y = np.asarray(y, dtype=float)
+        if name in last:
+            reduced[name] = y[ends]
+        else:
+            reduced[name] = np.add.reduceat(y, starts) / counts
+    return x[starts], reduced
+
+
+def _column_bytes(values: pd.Series) -> bytes:
+    """the values as bytes, dates and periods by their integer representation"""
+    if isinstance(values.dtype, pd.PeriodDtype):
+        array = pd.PeriodIndex(values).asi8
+    else:
+        array = values.to_numpy()
+        if array.dtype.kind in "mM":
+            array = array.view("i8")
+        elif array.dtype.kind in "biuf":
+            array = array.astype(float)
+        else:
+            return "\0".join(map(str, array)).encode()
+    return np.ascontiguousarray(array).tobytes()
+
+
+def _digest(df: pd.DataFrame, columns: list[str]) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    for column in columns:
+        hasher.update(column.encode())
+        hasher.update(str(df[column].dtype).encode())
+        hasher.update(_column_bytes(df[column]))
+    return hasher.hexdigest()
+
+
+def _cached(key: tuple, build) -> str:
+    if key in _figure_cache:
+        _figure_cache.move_to_end(key)
+        return _figure_cache[key]
+
+    fig_json = build().to_json()
+    _figure_cache[key] = fig_json
+    while len(_figure_cache) > max_cached_figures:
+        _figure_cache.popitem(last=False)
+    return fig_json
+
+
+def _bars_and_line_figure(
+    x: np.ndarray,
+    bars: dict[str, np.ndarray],
+    line: dict[str, np.ndarray],
+    x_title: str,
+    bar_title: str,
+    line_title: str,
+    webgl_threshold: int,
+) -> go.Figure:
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    use_webgl = len(x) > webgl_threshold
+
+    for name, y in bars.items():
+        if use_webgl:
+            trace = go.Scattergl(x=x, y=y, name=name, mode="lines")
+        else:
+            trace = go.Bar(x=x, y=y, name=name)
+        trace.hovertemplate = f"{name}: %{{y:.0f}}"
+        fig.add_trace(trace)
+
+    for name, y in line.items():
+        scatter = go.Scattergl if use_webgl else go.Scatter
+        fig.add_trace(
+            scatter(x=x, y=y, name=name, hovertemplate=f"{name}: %{{y:.0f}}"),
+            secondary_y=True,
+        )
+
+    fig.update_layout(barmode="stack", hovermode="x", autosize=False)
+    fig.update_yaxes(title_text=bar_title, secondary_y=False)
+    fig.update_yaxes(title_text=line_title, secondary_y=True)
+    fig.update_xaxes(title_text=x_title)
+    return fig
+
+
+def credit_repay_figure_json(
+    res_df: pd.DataFrame, max_points: int = 2000, webgl_threshold: int = 1000
+) -> str:
+    """cached plotly json of an amortization schedule as returned by rest_dept"""
+    columns = ["Period", "Interest", "Repay", "Credit Post"]
+    key = ("credit_repay", _digest(res_df, columns), max_points, webgl_threshold)
+
+    def build() -> go.Figure:
+        x, ys = downsample(
+            res_df["Period"].to_numpy(),
+            {name: res_df[name].to_numpy() for name in columns[1:]},
+            max_points,
+            last=("Credit Post",),
+        )
+        return _bars_and_line_figure(
+            x,
+            bars={"Interest": ys["Interest"], "Repay": ys["Repay"]},
+            line={"Post Period Credit": ys["Credit Post"]},
+            x_title="Period",
+            bar_title="Annuity",
+            line_title="Rest Credit Amount",
+            webgl_threshold=webgl_threshold,
+        )
+
+    return _cached(key, build)
+
+
+def plot_credit_repay(
+    res_df: pd.DataFrame, max_points: int = 2000, webgl_threshold: int = 1000
+) -> go.Figure:
+    import plotly.io as pio
+
+    return pio.from_json(credit_repay_figure_json(res_df, max_points, webgl_threshold))
+
+
+def compound_interest_figure_json(
+    compound_df: pd.DataFrame, max_points: int = 2000, webgl_threshold: int = 1000
+) -> str:
+    """cached plotly json of a table as returned by compound_interest_detailed"""
+    columns = ["Period", "Equity", "Interest"]
+    key = ("compound", _digest(compound_df, columns), max_points, webgl_threshold)
+
+    def build() -> go.Figure:
+        import plotly.graph_objects as go
+
+        x, ys = downsample(
+            compound_df["Period"].to_numpy(),
+            {name: compound_df[name].to_numpy() for name in columns[1:]},
+            max_points,
+            last=("Equity", "Interest"),
+        )
+        if len(x) > webgl_threshold:
+            traces = [
+                go.Scattergl(x=x, y=y, name=name, mode="lines") for name, y in ys.items()
+            ]
+        else:
+            traces = [go.Bar(x=x, y=y, name=name) for name, y in ys.items()]
+        fig = go.Figure(traces)
+        fig.update_layout(barmode="relative")
+        fig.update_xaxes(title_text="Period")
+        return fig
+
+    return _cached(key, build)
+
+
+def plot_compound_interest(
+    compound_df: pd.DataFrame, max_points: int = 2000, webgl_threshold: int = 1000
+) -> go.Figure:
+    import plotly.io as pio
+
+    return pio.from_json(
+        compound_interest_figure_json(compound_df, max_points, webgl_threshold)
+    )
+
+
+def timeline_figure_json(
+    timeline_df: pd.DataFrame,
+    bars: tuple[str, ...] = ("Interest", "Repay"),
+    line: str = "Rest Dept",
+    x: str = "Year",
+    max_points: int = 2000,
+    webgl_threshold: int = 1000,
+) -> str:
+    """
+    Cached plotly json of an aggregated timeline, e.g. the yearly sums of a
+    portfolio. The x values are taken from the column x or from the index.
+    """
+    x_values = pd.Series(timeline_df[x] if x in timeline_df.columns else timeline_df.index)
+    df = timeline_df[list(bars) + [line]].reset_index(drop=True)
+    df.insert(0, x, x_values.reset_index(drop=True))
+    columns = [x, *bars, line]
+    key = ("timeline", _digest(df, columns), max_points, webgl_threshold)
+
+    def build() -> go.Figure:
+        x_plot = df[x]
+        if isinstance(x_plot.dtype, pd.PeriodDtype):
+            x_plot = pd.PeriodIndex(x_plot).to_timestamp()
+        x_down, ys = downsample(
+            np.asarray(x_plot),
+            {name: df[name].to_numpy() for name in columns[1:]},
+            max_points,
+            last=(line,),
+        )
+        return _bars_and_line_figure(
+            x_down,
+            bars={name: ys[name] for name in bars},
+            line={line: ys[line]},
+            x_title=x,
+            bar_title="Amount",
+            line_title=line,
+            webgl_threshold=webgl_threshold,
+        )
+
+    return _cached(key, build)
+
+
+def plot_timeline(
+    timeline_df: pd.DataFrame,
+    bars: tuple[str, ...] = ("Interest", "Repay"),
+    line: str = "Rest Dept",
+    x: str = "Year",
+    max_points: int = 2000,
+    webgl_threshold: int = 1000,
+) -> go.Figure:
+    import plotly.io as pio
+
+    return pio.from_json(
+        timeline_figure_json(timeline_df, bars, line, x, max_points, webgl_threshold)
+    )
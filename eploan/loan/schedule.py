@@ -0,0 +1,137 @@
+from typing import Iterable, Optional, Self
+
+import numpy as np
+import pandas as pd
+
+from . import batch
+
+
+value_columns: tuple[str, ...] = ("Credit Pre", "Interest", "Repay", "Credit Post")
+
+
+def schedule_dtype(float_type=np.float64, int_type=np.int64) -> np.dtype:
+    return np.dtype(
+        [("Loan", int_type), ("Period", int_type)]
+        + [(name, float_type) for name in value_columns]
+    )
+
+
+class Schedule:
+    """
+    Amortization schedule backed by a NumPy structured array with the columns
+    of credit.rest_dept and the loan number. Slices return views, boolean
+    masks and index arrays (as in loan and periods) copy the selected rows.
+    to_pandas shares the memory of the array. n_loans also counts the loans
+    without periods (e.g. a loan of 0), it defaults to the highest loan number + 1.
+    """
+
+    def __init__(self, data: np.ndarray, n_loans: Optional[int] = None):
+        if data.dtype.names is None or set(data.dtype.names) != {"Loan", "Period", *value_columns}:
+            raise ValueError("The data must be a structured array with the schedule columns")
+        self.data = data
+        if n_loans is None:
+            n_loans = int(data["Loan"].max()) + 1 if len(data) else 0
+        self.n_loans = n_loans
+
+    @staticmethod
+    def batch_columns(
+        schedules: batch.ScheduleArrays, first_loan: int = 0
+    ) -> dict[str, np.ndarray]:
+        """
+        The columns of the active periods of batch schedules, loan by loan.
+        The loans are numbered from first_loan on.
+        """
+        active = np.atleast_2d(schedules.active)
+        n_loans, max_period = active.shape
+        loans = np.arange(first_loan, first_loan + n_loans)
+        return {
+            "Loan": np.broadcast_to(loans[:, None], active.shape)[active],
+            "Period": np.broadcast_to(np.arange(1, max_period + 1), active.shape)[active],
+            "Credit Pre": np.atleast_2d(schedules.credit_pre)[active],
+            "Interest": np.atleast_2d(schedules.interest)[active],
+            "Repay": np.atleast_2d(schedules.repay)[active],
+            "Credit Post": np.atleast_2d(schedules.credit_post)[active],
+        }
+
+    @classmethod
+    def from_batch(
+        cls, schedules: batch.ScheduleArrays, float_type=np.float64, int_type=np.int64
+    ) -> Self:
+        """schedule of the active periods of batch schedules of one or many loans"""
+        columns = cls.batch_columns(schedules)
+        data = np.empty(len(columns["Loan"]), dtype=schedule_dtype(float_type, int_type))
+        for name, values in columns.items():
+            data[name] = values
+        return cls(data, np.atleast_2d(schedules.active).shape[0])
+
+    @classmethod
+    def from_loans(
+        cls, loan_amounts, interest_rates, annuities, periods, float_type=np.float64, int_type=np.int64
+    ) -> Self:
+        return cls.from_batch(
+            batch.amortize(loan_amounts, interest_rates, annuities, periods),
+            float_type,
+            int_type,
+        )
+
+    @classmethod
+    def stack(cls, schedules: Iterable[Self], renumber: bool = True) -> Self:
+        """
+        Concatenate schedules, with renumber the loans are numbered
+        consecutively over all schedules.
+        """
+        schedules = list(schedules)
+        if not schedules:
+            return cls(np.empty(0, dtype=schedule_dtype()))
+        dtype = schedule_dtype(
+            np.result_type(*[schedule.data.dtype["Credit Post"] for schedule in schedules]),
+            np.result_type(*[schedule.data.dtype["Loan"] for schedule in schedules]),
+        )
+        data = np.concatenate(
+            [schedule.data.astype(dtype, copy=False) for schedule in schedules]
+        )
+        n_loans = [schedule.n_loans for schedule in schedules]
+        if not renumber:
+            return cls(data, max(n_loans))
+        offsets = np.cumsum([0] + n_loans[:-1])
+        lengths = [len(schedule) for schedule in schedules]
+        data["Loan"] += np.repeat(offsets, lengths).astype(data["Loan"].dtype)
+        return cls(data, sum(n_loans))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, key) -> "Self | np.ndarray":
+        """a column by name or a schedule of the selected rows"""
+        if isinstance(key, str):
+            return self.data[key]
+        return Schedule(np.atleast_1d(self.data[key]), self.n_loans)
+
+    def loan(self, number: int) -> Self:
+        return self[self.data["Loan"] == number]
+
+    def periods(self, first: int, last: int) -> Self:
+        """rows with first <= Period <= last"""
+        period = self.data["Period"]
+        return self[(period >= first) & (period <= last)]
+
+    def rest_dept(self) -> np.ndarray:
+        """
+        credit post of the last period of each of the n_loans loans, 0 for
+        loans without rows
+        """
+        loans = self.data["Loan"]
+        rest = np.zeros(self.n_loans, dtype=self.data.dtype["Credit Post"])
+        if len(loans):
+            last = np.flatnonzero(np.append(loans[1:] != loans[:-1], True))
+            rest[loans[last]] = self.data["Credit Post"][last]
+        return rest
+
+    def to_pandas(self, include_loan: bool = False) -> pd.DataFrame:
+        """frame with the columns of credit.rest_dept viewing the same memory"""
+        names = self.data.dtype.names if include_loan else self.data.dtype.names[1:]
+        return pd.DataFrame({name: self.data[name] for name in names}, copy=False)
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
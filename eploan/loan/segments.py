@@ -0,0 +1,234 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Self
+
+import numpy as np
+import pandas as pd
+
+from . import batch
+
+
+@dataclass
+class Segment:
+    start: int  # first period of the segment
+    interest_rate: float
+    annuity: float
+    credit: float  # credit at the start of the segment
+    schedule: batch.ScheduleArrays
+
+    @property
+    def periods(self) -> int:
+        return int(self.schedule.periods[0])
+
+    @property
+    def end(self) -> int:
+        """last period of the segment"""
+        return self.start + self.periods - 1
+
+    @property
+    def rest_dept(self) -> float:
+        return float(self.schedule.rest_dept[0])
+
+    @property
+    def paid_off(self) -> bool:
+        """the loan ends with this segment"""
+        payoff = batch.loan_period(self.credit, self.annuity, self.interest_rate)[()]
+        return bool(np.isfinite(payoff) and np.round(payoff) <= self.periods)
+
+    def head(self, periods: int) -> "Segment":
+        """the first periods of the segment"""
+        schedule = self.schedule
+        return Segment(
+            self.start,
+            self.interest_rate,
+            self.annuity,
+            self.credit,
+            batch.ScheduleArrays(
+                credit_pre=schedule.credit_pre[:, :periods],
+                interest=schedule.interest[:, :periods],
+                repay=schedule.repay[:, :periods],
+                credit_post=schedule.credit_post[:, :periods],
+                active=schedule.active[:, :periods],
+                rest_dept=schedule.credit_post[:, periods - 1],
+            ),
+        )
+
+
+class SegmentedSchedule:
+    """
+    Amortization schedule whose interest rate and annuity can change from a
+    given period on, e.g. at the end of a fixed rate period. The credit at a
+    change point carries over from the periods before. The segments are kept
+    between edits, an edit only drops the segments from its period on, and
+    segments with the same start credit, rate, annuity and length are reused.
+    With a fixed_period the initial terms are also recorded as a change after
+    it, the point where the rate is refinanced.
+    """
+
+    cache_size = 64  # segments kept for reuse, least recently used are dropped
+
+    def __init__(
+        self,
+        amount: float,
+        interest_rate: float,
+        annuity: float,
+        fixed_period: Optional[int] = None,
+    ):
+        self.amount = amount
+        self.fixed_period = fixed_period
+        self._changes: dict[int, dict[str, float]] = {
+            1: {"interest_rate": interest_rate, "annuity": annuity}
+        }
+        if fixed_period is not None:
+            if fixed_period < 1:
+                raise ValueError("The fixed period must be at least 1")
+            self._changes[fixed_period + 1] = {"interest_rate": interest_rate}
+        self._segments: list[Segment] = []
+        self._complete = False
+        self._cache: OrderedDict[
+            tuple[float, float, float, int], batch.ScheduleArrays
+        ] = OrderedDict()
+        self.computed_periods = 0
+
+    def change(
+        self,
+        period: int,
+        interest_rate: Optional[float] = None,
+        annuity: Optional[float] = None,
+    ) -> Self:
+        """let the interest rate and/or the annuity change from period on"""
+        if period < 1:
+            raise ValueError("The period of a change must be at least 1")
+        if interest_rate is None and annuity is None:
+            raise ValueError("Specify an interest rate or an annuity")
+        if interest_rate is not None and interest_rate < 0:
+            raise ValueError("Negative Interest Rate are not possible for this calculation")
+        values = self._changes.setdefault(period, {})
+        if interest_rate is not None:
+            values["interest_rate"] = interest_rate
+        if annuity is not None:
+            values["annuity"] = annuity
+        self._invalidate(period)
+        return self
+
+    def remove_change(self, period: int) -> Self:
+        if period == 1:
+            raise ValueError("The initial terms cannot be removed")
+        del self._changes[period]
+        self._invalidate(period)
+        return self
+
+    @property
+    def changes(self) -> dict[int, dict[str, float]]:
+        return {period: dict(values) for period, values in sorted(self._changes.items())}
+
+    def _invalidate(self, period: int) -> None:
+        # the periods before the change keep their values, a segment running
+        # over the change point is cut there
+        kept = []
+        for segment in self._segments:
+            if segment.end < period:
+                kept.append(segment)
+            elif segment.start < period:
+                kept.append(segment.head(period - segment.start))
+        self._segments = kept
+        self._complete = False
+
+    def _terms(self) -> list[tuple[int, float, float]]:
+        """(start period, interest rate, annuity) with the values carried forward"""
+        terms = []
+        interest_rate = annuity = None
+        for period, values in sorted(self._changes.items()):
+            interest_rate = values.get("interest_rate", interest_rate)
+            annuity = values.get("annuity", annuity)
+            terms.append((period, interest_rate, annuity))
+        return terms
+
+    def _amortize(
+        self, credit: float, interest_rate: float, annuity: float, periods: int
+    ) -> batch.ScheduleArrays:
+        key = (credit, interest_rate, annuity, periods)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        schedule = batch.amortize(credit, interest_rate, annuity, periods)
+        self.computed_periods += periods
+        self._cache[key] = schedule
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return schedule
+
+    @property
+    def segments(self) -> list[Segment]:
+        if self._complete:
+            return self._segments
+        if self._segments and self._segments[-1].paid_off:
+            # paid off before the changes that are left
+            self._complete = True
+            return self._segments
+
+        terms = self._terms()
+        next_start = self._segments[-1].end + 1 if self._segments else 1
+        for idx, (term_start, interest_rate, annuity) in enumerate(terms):
+            last = idx == len(terms) - 1
+            if not last and terms[idx + 1][0] <= next_start:
+                continue
+            start = max(term_start, next_start)
+            credit = self._segments[-1].rest_dept if self._segments else self.amount
+            payoff = batch.loan_period(credit, annuity, interest_rate)[()]
+            if last and np.isnan(payoff):
+                raise ValueError(
+                    "The annuity must be greater than the interest rate times the credit"
+                )
+            periods = int(np.round(payoff)) if np.isfinite(payoff) else None
+            paid_off = periods is not None and (last or periods <= terms[idx + 1][0] - start)
+            if not paid_off:
+                periods = terms[idx + 1][0] - start
+            elif periods == 0:
+                break
+            schedule = self._amortize(credit, interest_rate, annuity, periods)
+            self._segments.append(Segment(start, interest_rate, annuity, credit, schedule))
+            if paid_off:
+                break
+
+        self._complete = True
+        return self._segments
+
+    @property
+    def repay_time_total(self) -> int:
+        segments = self.segments
+        return segments[-1].end if segments else 0
+
+    def rest_dept(self, period: int) -> float:
+        """credit after period"""
+        if period <= 0:
+            return self.amount
+        for segment in self.segments:
+            if period <= segment.end:
+                return float(segment.schedule.credit_post[0, period - segment.start])
+        return self.segments[-1].rest_dept if self.segments else self.amount
+
+    def outlook(self) -> pd.DataFrame:
+        """the schedule like credit.rest_dept with hist and the terms of every period"""
+        segments = self.segments
+
+        def join(name: str) -> np.ndarray:
+            return np.concatenate(
+                [getattr(segment.schedule, name)[0] for segment in segments]
+            )
+
+        return pd.DataFrame(
+            {
+                "Period": np.arange(1, self.repay_time_total + 1),
+                "Credit Pre": join("credit_pre"),
+                "Interest": join("interest"),
+                "Repay": join("repay"),
+                "Credit Post": join("credit_post"),
+                "Interest Rate": np.concatenate(
+                    [np.full(segment.periods, segment.interest_rate) for segment in segments]
+                ),
+                "Annuity": np.concatenate(
+                    [np.full(segment.periods, segment.annuity) for segment in segments]
+                ),
+            }
+        )
@@ -0,0 +1,95 @@
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from . import loan
+from . import immo
+
+
+def buy_vs_invest_arrays(
+    price,
+    modernisation,
+    proprietary_capital,
+    loan_amount,
+    interest_rate,
+    annuity,
+    repay_periods,
+    net_annually,
+    horizon: int,
+    invest_rate: float,
+    appreciation: float = 0.0,
+) -> dict[str, np.ndarray]:
+    """
+    Wealth of buying the property and of investing the equity instead, for
+    every horizon 1..horizon (last axis) and every property (first axis).
+    The property wealth is its value minus the rest debt plus the cumulated
+    cash flow after annuity. The investor puts the equity into a savings plan
+    and pays in (or takes out) what the property costs (or yields) every year.
+    """
+    price, modernisation, proprietary_capital, net_annually = (
+        np.atleast_1d(np.asarray(values, dtype=float))[:, None]
+        for values in (price, modernisation, proprietary_capital, net_annually)
+    )
+    repay_periods = np.minimum(np.asarray(repay_periods, dtype=np.int64), horizon)
+    schedules = loan.batch.amortize(
+        loan_amount, interest_rate, annuity, repay_periods, max_period=horizon
+    )
+    rest = np.where(schedules.active, schedules.credit_post, schedules.rest_dept[..., None])
+    cash_flow = net_annually - schedules.annuity
+
+    years = np.arange(1, horizon + 1)
+    value = (price + modernisation) * (1 + appreciation) ** years
+    property_wealth = value - rest + np.cumsum(cash_flow, axis=-1)
+
+    invest_wealth, _ = loan.compound_growth(
+        proprietary_capital[:, 0], np.full(horizon, invest_rate), installments=-cash_flow
+    )
+    return {
+        "property_wealth": property_wealth,
+        "invest_wealth": invest_wealth,
+        "advantage": property_wealth - invest_wealth,
+    }
+
+
+def buy_vs_invest(
+    properties: Iterable[immo.Immo],
+    horizon: int,
+    invest_rate: float,
+    appreciation: float = 0.0,
+) -> pd.DataFrame:
+    """long table of buy_vs_invest_arrays, one row per property and horizon"""
+    properties = list(properties)
+    result = buy_vs_invest_arrays(
+        price=[prop.base_cost.price for prop in properties],
+        modernisation=[prop.base_cost.modernisation for prop in properties],
+        proprietary_capital=[prop.base_cost.proprietary_capital for prop in properties],
+        loan_amount=[prop.mortgage.amount for prop in properties],
+        interest_rate=[prop.mortgage.interest_rate for prop in properties],
+        annuity=[prop.mortgage.annuity for prop in properties],
+        repay_periods=[prop.mortgage.period for prop in properties],
+        net_annually=[prop.cash_flow.net_annually for prop in properties],
+        horizon=horizon,
+        invest_rate=invest_rate,
+        appreciation=appreciation,
+    )
+    index = pd.MultiIndex.from_product(
+        [range(len(properties)), range(1, horizon + 1)], names=["Property", "Horizon"]
+    )
+    return pd.DataFrame(
+        {
+            "Property Wealth": result["property_wealth"].ravel(),
+            "Invest Wealth": result["invest_wealth"].ravel(),
+            "Advantage": result["advantage"].ravel(),
+        },
+        index=index,
+    )
+
+
+def break_even_horizon(advantage: np.ndarray) -> np.ndarray:
+    """first horizon from which buying stays ahead of investing, 0 if never"""
+    ahead = np.asarray(advantage) > 0
+    # buying stays ahead if it is ahead from here to the end
+    stays_ahead = np.flip(np.logical_and.accumulate(np.flip(ahead, axis=-1), axis=-1), axis=-1)
+    first = np.argmax(stays_ahead, axis=-1) + 1
+    return np.where(stays_ahead.any(axis=-1), first, 0)
@@ -0,0 +1,166 @@
+from typing import Iterable, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import calculators
+from . import loan
+from . import immo
+
+
+Objective = Literal[
+    "ten_year_roe", "ten_year_irr", "ten_year_net_capital_gain", "return_on_equity"
+]
+
+
+def ten_year_irr(kpis: dict[str, np.ndarray], proprietary_capital, iterations: int = 60) -> np.ndarray:
+    """
+    Internal rate of return of the equity over the period of the ten year
+    capital gain: the equity is paid in, the yearly cash flow after annuity is
+    received and the property net of rest debt is sold at the end.
+    Solved by bisection for all elements at once.
+    """
+    proprietary_capital = np.asarray(proprietary_capital, dtype=float)
+    cash_flow = kpis["annual_cash_flow"]
+    period = kpis["gain_period"]
+    terminal = kpis["ten_year_net_capital_gain"] + proprietary_capital - period * cash_flow
+    shape = np.broadcast_shapes(cash_flow.shape, proprietary_capital.shape, terminal.shape)
+
+    def npv(rate: np.ndarray) -> np.ndarray:
+        discount = (1 + rate) ** -period
+        with np.errstate(divide="ignore", invalid="ignore"):
+            annuity_factor = np.where(rate == 0, period, (1 - discount) / rate)
+        return -proprietary_capital + cash_flow * annuity_factor + terminal * discount
+
+    low = np.full(shape, -0.99)
+    high = np.full(shape, 10.0)
+    valid = (npv(low) > 0) & (npv(high) < 0) & (proprietary_capital > 0)
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        positive = npv(mid) > 0
+        low = np.where(positive, mid, low)
+        high = np.where(positive, high, mid)
+    return np.where(valid, (low + high) / 2, np.nan)
+
+
+def _evaluate_grid(
+    base_cost: immo.BaseCost,
+    cash_flow: immo.CashFlow,
+    interest_rate: float,
+    by: Literal["repayment_rate", "period"],
+    equity_shares: np.ndarray,
+    values: np.ndarray,
+    objective: Objective,
+    min_monthly_cash_flow: Optional[float],
+    max_annuity: Optional[float],
+) -> tuple[np.ndarray, dict, dict]:
+    """objective on the grid equity_shares x values, -inf where infeasible"""
+    shares = equity_shares[:, None]
+    amounts = immo.costs.base_cost_arrays(
+        base_cost.price,
+        base_cost.modernisation,
+        base_cost.property_buy_tax_rate,
+        base_cost.agent_rate,
+        base_cost.notary_rate,
+        base_cost.land_registry_rate,
+        shares,
+        1 - shares,
+    )
+    financing = loan.batch.financing(
+        amounts["loan"],
+        interest_rate,
+        repayment_rates=values[None, :] if by == "repayment_rate" else np.nan,
+        periods=values[None, :] if by == "period" else np.nan,
+    )
+    kpis = immo.batch.kpis(
+        amounts,
+        cash_flow.net_cold_rent,
+        cash_flow.operating_expenses,
+        cash_flow.operating_income,
+        interest_rate,
+        financing["annuity"],
+        financing["period"],
+    )
+    if objective == "ten_year_irr":
+        target = ten_year_irr(kpis, amounts["proprietary_capital"])
+    else:
+        target = kpis[objective]
+
+    feasible = np.isfinite(target) & np.isfinite(financing["repay_time_total"])
+    if min_monthly_cash_flow is not None:
+        feasible &= kpis["annual_cash_flow"] / 12 >= min_monthly_cash_flow
+    if max_annuity is not None:
+        feasible &= financing["annuity"] <= max_annuity
+    return np.where(feasible, target, -np.inf), financing, kpis
+
+
+def optimize_financing(
+    prop_data: dict,
+    interest_rate: float,
+    by: Literal["repayment_rate", "period"] = "repayment_rate",
+    equity_shares: Iterable[float] = np.linspace(0.05, 0.95, 19),
+    values: Optional[Iterable[float]] = None,
+    objective: Objective = "ten_year_roe",
+    min_monthly_cash_flow: Optional[float] = 0.0,
+    max_annuity: Optional[float] = None,
+    refine_steps: int = 3,
+) -> dict:
+    """
+    Search the equity share and the repayment rate (or the period) that
+    maximize the objective under the cash flow and annuity constraints.
+    The whole coarse grid is evaluated at once and then refined around the
+    best point. Returns None values if no point is feasible.
+    """
+    _, base_cost, cash_flow = calculators.parse_property(prop_data)
+    if values is None:
+        values = np.linspace(0.01, 0.1, 19) if by == "repayment_rate" else np.arange(5, 41)
+    equity_shares = np.asarray(list(equity_shares), dtype=float)
+    values = np.asarray(list(values), dtype=float)
+
+    best = None
+    for step in range(refine_steps + 1):
+        target, financing, kpis = _evaluate_grid(
+            base_cost,
+            cash_flow,
+            interest_rate,
+            by,
+            equity_shares,
+            values,
+            objective,
+            min_monthly_cash_flow,
+            max_annuity,
+        )
+        i, j = np.unravel_index(np.argmax(target), target.shape)
+        if not np.isfinite(target[i, j]):
+            break
+        if best is None or target[i, j] >= best["objective"]:
+            best = {
+                "equity_share": equity_shares[i],
+                by: values[j],
+                "annuity": financing["annuity"][i, j],
+                "initial_repayment_rate": financing["repayment_rate"][i, j],
+                "repay_time_total": financing["repay_time_total"][i, j],
+                "monthly_cash_flow": kpis["annual_cash_flow"][i, j] / 12,
+                "objective": target[i, j],
+            }
+
+        # zoom into the neighbourhood of the best point
+        equity_shares = np.linspace(
+            equity_shares[max(i - 1, 0)], equity_shares[min(i + 1, len(equity_shares) - 1)], len(equity_shares)
+        )
+        values = np.linspace(values[max(j - 1, 0)], values[min(j + 1, len(values) - 1)], len(values))
+        if by == "period":
+            values = np.unique(np.round(values))
+
+    if best is None:
+        return {"equity_share": None, by: None, "objective": None}
+    return best
+
+
+def optimize_batch(
+    prop_datas: Iterable[dict], interest_rate: float, **kwargs
+) -> pd.DataFrame:
+    """optimize_financing for several properties, one row per property"""
+    return pd.DataFrame(
+        [optimize_financing(prop_data, interest_rate, **kwargs) for prop_data in prop_datas]
+    )
@@ -0,0 +1,189 @@
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from . import ingest
+
+# numeric listing columns the evaluation reads
+input_columns: list[str] = [
+    name
+    for fields in ingest.schema.values()
+    for name, (dtype, _) in fields.items()
+    if dtype == "float64"
+]
+output_columns: list[str] = [
+    "Loan",
+    "Annuity",
+    "Initial Repayment Rate",
+    "Repay Time Total",
+    "Gross Rental Yield",
+    "Net Rental Yield",
+    "Multiplication Factor",
+    "Return on Equity",
+    "10 Year Net Capital Gain",
+    "10 Year RoE",
+]
+
+# shared memory blocks a worker is attached to, by block name
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        # the creating process owns the block, the workers must not unlink it
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedColumns:
+    """float64 columns of equal length, each in its own shared memory block"""
+
+    def __init__(self, names: list[str], capacity: int):
+        self.capacity = capacity
+        self.blocks = {
+            name: shared_memory.SharedMemory(create=True, size=max(capacity, 1) * 8)
+            for name in names
+        }
+        self.arrays = {
+            name: np.ndarray(capacity, dtype=np.float64, buffer=block.buf)
+            for name, block in self.blocks.items()
+        }
+
+    @property
+    def spec(self) -> dict[str, str]:
+        """column name to block name, all a worker needs to attach"""
+        return {name: block.name for name, block in self.blocks.items()}
+
+    def close(self) -> None:
+        self.arrays = {}
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+
+def _views(spec: dict[str, str], capacity: int) -> dict[str, np.ndarray]:
+    # drop the attachments of buffers the pool has replaced
+    for block_name in set(_attached) - set(spec.values()):
+        _attached.pop(block_name).close()
+    views = {}
+    for name, block_name in spec.items():
+        if block_name not in _attached:
+            _attached[block_name] = _attach(block_name)
+        views[name] = np.ndarray(
+            capacity, dtype=np.float64, buffer=_attached[block_name].buf
+        )
+    return views
+
+
+def _evaluate_slice(
+    inputs: dict[str, str],
+    outputs: dict[str, str],
+    capacity: int,
+    start: int,
+    stop: int,
+    interest_rate: float,
+    financing: dict[str, Optional[float]],
+) -> None:
+    """evaluate the listings start:stop of the shared inputs into the shared outputs"""
+    views = _views({**inputs, **outputs}, capacity)
+    df = pd.DataFrame({name: views[name][start:stop] for name in inputs}, copy=False)
+    # the postal code only completes missing tax rates which normalize already did
+    df["postal_code"] = pd.Series(pd.NA, index=df.index, dtype="string")
+    result = ingest.evaluate_listings(df, interest_rate, **financing)
+    for name in outputs:
+        views[name][start:stop] = result[name].to_numpy(dtype=np.float64)
+
+
+class EvaluationPool:
+    """
+    Process pool for the columnar evaluation of normalized listings. The
+    listing columns and the result columns live in shared memory, a task only
+    carries the block names and its slice bounds. The buffers and the worker
+    processes are kept between runs and only grow when a run needs more rows.
+    """
+
+    def __init__(self, workers: Optional[int] = None, capacity: int = 0):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._inputs: Optional[SharedColumns] = None
+        self._outputs: Optional[SharedColumns] = None
+        if capacity:
+            self._reserve(capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._inputs.capacity if self._inputs is not None else 0
+
+    def _reserve(self, n: int) -> None:
+        if n <= self.capacity:
+            return
+        self._release()
+        self._inputs = SharedColumns(input_columns, n)
+        self._outputs = SharedColumns(output_columns, n)
+
+    def _release(self) -> None:
+        for columns in (self._inputs, self._outputs):
+            if columns is not None:
+                columns.close()
+        self._inputs = self._outputs = None
+
+    def evaluate(
+        self,
+        df: pd.DataFrame,
+        interest_rate: float,
+        annuity: Optional[float] = None,
+        repayment_rate: Optional[float] = None,
+        period: Optional[float] = None,
+        chunk_size: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """parallel ingest.evaluate_listings of normalized listings"""
+        if sum(value is not None for value in (annuity, repayment_rate, period)) != 1:
+            raise ValueError("Specify exactly one of annuity, repayment_rate or period")
+        n = len(df)
+        if n == 0:
+            return pd.DataFrame(columns=output_columns, index=df.index, dtype=float)
+
+        self._reserve(n)
+        for name in input_columns:
+            self._inputs.arrays[name][:n] = df[name].to_numpy(dtype=np.float64)
+
+        if chunk_size is None:
+            chunk_size = max(math.ceil(n / (4 * self.workers)), 1024)
+        financing = {"annuity": annuity, "repayment_rate": repayment_rate, "period": period}
+        futures = [
+            self._executor.submit(
+                _evaluate_slice,
+                self._inputs.spec,
+                self._outputs.spec,
+                self.capacity,
+                start,
+                min(start + chunk_size, n),
+                interest_rate,
+                financing,
+            )
+            for start in range(0, n, chunk_size)
+        ]
+        for future in futures:
+            future.result()
+
+        return pd.DataFrame(
+            {name: self._outputs.arrays[name][:n].copy() for name in output_columns},
+            index=df.index,
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._release()
+
+    def __enter__(self) -> "EvaluationPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,118 @@
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import loan
+from . import immo
+
+
+def timeline(
+    loan_amounts,
+    interest_rates,
+    annuities,
+    periods,
+    start_years,
+    net_cash_flows=None,
+    cash_flow_start_years=None,
+    end_year: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Yearly sums of annuity, interest, repayment and rest debt of many loans
+    starting in different years. Each loan is amortized on its own period axis
+    and scatter-added into the shared calendar year axis. The annual net cash
+    flows are added from their start year on until the end of the timeline.
+    """
+    start_years = np.atleast_1d(np.asarray(start_years, dtype=np.int64))
+    schedules = loan.batch.amortize(loan_amounts, interest_rates, annuities, periods)
+    n_loans, max_period = schedules.active.shape
+    start_years = np.broadcast_to(start_years, (n_loans,))
+
+    if net_cash_flows is not None:
+        net_cash_flows = np.atleast_1d(np.asarray(net_cash_flows, dtype=float))
+        if cash_flow_start_years is None:
+            cash_flow_start_years = start_years
+        cash_flow_start_years = np.broadcast_to(
+            np.asarray(cash_flow_start_years, dtype=np.int64), net_cash_flows.shape
+        )
+
+    first_year = int(start_years.min()) if n_loans else 0
+    last_year = int((start_years + schedules.periods).max()) - 1 if n_loans else 0
+    if net_cash_flows is not None and len(net_cash_flows):
+        first_year = min(first_year, int(cash_flow_start_years.min()))
+        last_year = max(last_year, int(cash_flow_start_years.max()))
+    if end_year is not None:
+        last_year = end_year
+    n_years = max(last_year - first_year + 1, 0)
+
+    # calendar year index of every (loan, period) cell
+    year_idx = (start_years - first_year)[:, None] + np.arange(max_period)
+    mask = schedules.active & (year_idx < n_years)
+    idx = year_idx[mask]
+
+    def scatter_add(values: np.ndarray) -> np.ndarray:
+        return np.bincount(idx, weights=values[mask], minlength=n_years)[:n_years]
+
+    result = pd.DataFrame(
+        {
+            "Annuity": scatter_add(schedules.annuity),
+            "Interest": scatter_add(schedules.interest),
+            "Repay": scatter_add(schedules.repay),
+            "Rest Dept": scatter_add(schedules.credit_post),
+        },
+        index=pd.RangeIndex(first_year, first_year + n_years, name="Year"),
+    )
+
+    if net_cash_flows is not None:
+        # add each cash flow at its start year and carry it forward with cumsum
+        cash_flow_idx = cash_flow_start_years - first_year
+        in_range = cash_flow_idx < n_years
+        starts = np.bincount(
+            cash_flow_idx[in_range], weights=net_cash_flows[in_range], minlength=n_years
+        )[:n_years]
+        result["Net Cash Flow"] = np.cumsum(starts)
+        result["Cash Flow After Annuity"] = result["Net Cash Flow"] - result["Annuity"]
+
+    return result
+
+
+def mortgage_timeline(
+    mortgages: Iterable[loan.Mortgage],
+    start_years: Iterable[int],
+    cash_flows: Optional[Iterable[immo.CashFlow]] = None,
+    cash_flow_start_years: Optional[Iterable[int]] = None,
+    end_year: Optional[int] = None,
+) -> pd.DataFrame:
+    """timeline of the full schedules (repay time total) of the mortgages"""
+    mortgages = list(mortgages)
+    net_cash_flows = None
+    if cash_flows is not None:
+        net_cash_flows = [cash_flow.net_annually for cash_flow in cash_flows]
+        if cash_flow_start_years is not None:
+            cash_flow_start_years = list(cash_flow_start_years)
+
+    return timeline(
+        loan_amounts=[mortgage.amount for mortgage in mortgages],
+        interest_rates=[mortgage.interest_rate for mortgage in mortgages],
+        annuities=[mortgage.annuity for mortgage in mortgages],
+        periods=[mortgage.repay_time_total for mortgage in mortgages],
+        start_years=list(start_years),
+        net_cash_flows=net_cash_flows,
+        cash_flow_start_years=cash_flow_start_years,
+        end_year=end_year,
+    )
+
+
+def immo_timeline(
+    properties: Iterable[immo.Immo],
+    start_years: Iterable[int],
+    end_year: Optional[int] = None,
+) -> pd.DataFrame:
+    """timeline of the mortgages and cash flows of properties bought in start_years"""
+    properties = list(properties)
+    return mortgage_timeline(
+        [prop.mortgage for prop in properties],
+        start_years,
+        cash_flows=[prop.cash_flow for prop in properties],
+        end_year=end_year,
+    )
@@ -0,0 +1,216 @@
+from pathlib import Path
+from typing import Hashable, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from . import immo
+from . import ingest
+from . import loan
+
+# metrics of every section, named like the summaries of the single objects
+sections: dict[str, list[str]] = {
+    "Base Cost": [
+        "Price",
+        "Modernisation",
+        "Extra Cost",
+        "Land Registry",
+        "Notary",
+        "Property Buy Tax",
+        "Agent",
+        "Total",
+        "Proprietary Capital",
+        "Loan",
+    ],
+    "Cash Flow": [
+        "Net Cold Rent",
+        "Net Operating Cost",
+        "Operating Income",
+        "Operating Expenses",
+        "Annuity",
+        "Total",
+    ],
+    "Mortgage": [
+        "Interest Rate",
+        "Initial Repayment Rate",
+        "Annuity",
+        "Repay Time Total",
+    ],
+    "KPIs": [
+        "Gross Rental Yield",
+        "Net Rental Yield",
+        "Multiplication Factor",
+        "Return on Equity",
+        "10 Year Net Capital Gain",
+        "10 Year RoE",
+    ],
+}
+columns = pd.MultiIndex.from_tuples(
+    [(section, metric) for section, metrics in sections.items() for metric in metrics],
+    names=["Section", "Metric"],
+)
+
+
+def report_arrays(
+    base_cost: dict[str, np.ndarray],
+    net_cold_rent,
+    operating_expenses,
+    operating_income,
+    interest_rate,
+    annuity,
+    repayment_rate,
+    repay_time_total,
+    period,
+    loan_amount=None,
+    index: Optional[Sequence[Hashable]] = None,
+) -> pd.DataFrame:
+    """
+    Fill the report table of many properties from columnar inputs, base_cost
+    holds the amounts of costs.base_cost_arrays. The table is allocated once
+    and filled section by section, the monthly cash flow includes the annuity
+    like CashFlow.summary.
+    """
+    n = len(np.atleast_1d(base_cost["total"]))
+    net_cold_rent = np.asarray(net_cold_rent, dtype=float)
+    operating_expenses = np.asarray(operating_expenses, dtype=float)
+    operating_income = np.asarray(operating_income, dtype=float)
+    annuity = np.asarray(annuity, dtype=float)
+    net_operating_cost = operating_expenses - operating_income
+    kpis = immo.batch.eval_dict(
+        immo.batch.kpis(
+            base_cost,
+            net_cold_rent,
+            operating_expenses,
+            operating_income,
+            interest_rate,
+            annuity,
+            period,
+            loan_amount=loan_amount,
+        )
+    )
+
+    values = {
+        "Base Cost": [
+            base_cost["price"],
+            base_cost["modernisation"],
+            base_cost["extras"],
+            base_cost["land_registry"],
+            base_cost["notary"],
+            base_cost["property_buy_tax"],
+            base_cost["agent"],
+            base_cost["total"],
+            base_cost["proprietary_capital"],
+            base_cost["loan"] if loan_amount is None else loan_amount,
+        ],
+        "Cash Flow": [
+            net_cold_rent,
+            -net_operating_cost,
+            operating_income,
+            -operating_expenses,
+            np.round(-annuity / 12, 2),
+            np.round(net_cold_rent - net_operating_cost - annuity / 12, 2),
+        ],
+        "Mortgage": [interest_rate, repayment_rate, annuity, repay_time_total],
+        "KPIs": [kpis[metric] for metric in sections["KPIs"]],
+    }
+
+    table = np.empty((n, len(columns)))
+    col = 0
+    for section, metrics in sections.items():
+        for value in values[section]:
+            table[:, col] = value
+            col += 1
+    return pd.DataFrame(table, columns=columns, index=index)
+
+
+def immo_report(
+    properties: Iterable[immo.Immo], index: Optional[Sequence[Hashable]] = None
+) -> pd.DataFrame:
+    """report of Immo objects, one row per property"""
+    properties = list(properties)
+
+    def gather(getter) -> np.ndarray:
+        return np.fromiter(map(getter, properties), dtype=float, count=len(properties))
+
+    mortgage_amount = gather(lambda prop: prop.mortgage.amount)
+    annuity = gather(lambda prop: prop.mortgage.annuity)
+    interest_rate = gather(lambda prop: prop.mortgage.interest_rate)
+    return report_arrays(
+        immo.costs.base_cost_arrays(
+            gather(lambda prop: prop.base_cost.price),
+            gather(lambda prop: prop.base_cost.modernisation),
+            gather(lambda prop: prop.base_cost.property_buy_tax_rate),
+            gather(lambda prop: prop.base_cost.agent_rate),
+            gather(lambda prop: prop.base_cost.notary_rate),
+            gather(lambda prop: prop.base_cost.land_registry_rate),
+            gather(lambda prop: prop.base_cost.proprietary_capital_rate),
+            gather(lambda prop: prop.base_cost.loan_rate),
+        ),
+        net_cold_rent=gather(lambda prop: prop.cash_flow.net_cold_rent),
+        operating_expenses=gather(lambda prop: prop.cash_flow.operating_expenses),
+        operating_income=gather(lambda prop: prop.cash_flow.operating_income),
+        interest_rate=interest_rate,
+        annuity=annuity,
+        repayment_rate=gather(lambda prop: prop.mortgage.repayment_rate),
+        repay_time_total=np.round(
+            loan.batch.loan_period(mortgage_amount, annuity, interest_rate)
+        ),
+        period=gather(lambda prop: prop.mortgage.period),
+        loan_amount=mortgage_amount,
+        index=index,
+    )
+
+
+def listings_report(
+    df: pd.DataFrame,
+    interest_rate: float,
+    annuity: Optional[float] = None,
+    repayment_rate: Optional[float] = None,
+    period: Optional[float] = None,
+) -> pd.DataFrame:
+    """report of normalized listings (see ingest) with one financing"""
+    base_cost, mortgages = ingest.listing_financing(
+        df, interest_rate, annuity, repayment_rate, period
+    )
+    return report_arrays(
+        base_cost,
+        net_cold_rent=df["net_cold_rent"].to_numpy(),
+        operating_expenses=df["operating_expanses"].to_numpy(),
+        operating_income=df["operating_income"].to_numpy(),
+        interest_rate=interest_rate,
+        annuity=mortgages["annuity"],
+        repayment_rate=mortgages["repayment_rate"],
+        repay_time_total=mortgages["repay_time_total"],
+        period=mortgages["period"],
+        index=df.index,
+    )
+
+
+def write_report(report: pd.DataFrame, path: str | Path) -> None:
+    """
+    Write the report in one go, as parquet for a .parquet suffix (the sections
+    joined into the column names) and as csv with two header rows otherwise.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as error:
+            raise ImportError("Writing parquet files requires pyarrow") from error
+        flat = report.copy(deep=False)
+        flat.columns = [" | ".join(column) for column in report.columns]
+        flat.to_parquet(path)
+    else:
+        report.to_csv(path)
+
+
+def read_report(path: str | Path) -> pd.DataFrame:
+    path = Path(path)
+    if path.suffix == ".parquet":
+        report = pd.read_parquet(path)
+        report.columns = pd.MultiIndex.from_tuples(
+            [tuple(column.split(" | ")) for column in report.columns],
+            names=columns.names,
+        )
+        return report
+    return pd.read_csv(path, header=[0, 1], index_col=0)
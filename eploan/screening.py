@@ -0,0 +1,195 @@
+import heapq
+from typing import Callable, Iterable, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from . import immo
+from . import ingest
+
+
+cheap_kpis: tuple[str, ...] = (
+    "gross_rental_yield",
+    "net_rental_yield",
+    "return_on_equity",
+    "price_per_sqm",
+    "rent_per_sqm",
+    "multiplication_factor",
+)
+expensive_kpis: tuple[str, ...] = ("ten_year_net_capital_gain", "ten_year_roe")
+
+Predicate = Callable[[pd.DataFrame], "pd.Series | np.ndarray"]
+
+
+def closed_form_kpis(
+    listings: pd.DataFrame,
+    interest_rate: float,
+    annuity: Optional[float] = None,
+    repayment_rate: Optional[float] = None,
+    period: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    The kpis that need no amortization schedule, the mortgage parameters and
+    the base cost amounts of normalized listings (see ingest.normalize).
+    """
+    amounts, financing = ingest.listing_financing(
+        listings, interest_rate, annuity, repayment_rate, period
+    )
+    net_cold_rent = listings["net_cold_rent"].to_numpy()
+    net_annually = 12 * (
+        net_cold_rent
+        - listings["operating_expanses"].to_numpy()
+        + listings["operating_income"].to_numpy()
+    )
+    living_space = listings["living_space"].to_numpy()
+    total = amounts["total"]
+    proprietary_capital = amounts["proprietary_capital"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.DataFrame(
+            {
+                "price": amounts["price"],
+                "modernisation": amounts["modernisation"],
+                "total": total,
+                "proprietary_capital": proprietary_capital,
+                "loan": amounts["loan"],
+                "interest_rate": interest_rate,
+                "annuity": financing["annuity"],
+                "period": financing["period"],
+                "net_annually": net_annually,
+                "gross_rental_yield": net_cold_rent * 12 / total,
+                "net_rental_yield": (net_annually - financing["annuity"]) / total,
+                "return_on_equity": np.where(
+                    proprietary_capital == 0, 0, net_annually / proprietary_capital
+                ),
+                "price_per_sqm": amounts["price"] / living_space,
+                "rent_per_sqm": net_cold_rent / living_space,
+                "multiplication_factor": np.floor(total / net_annually),
+            },
+            index=listings.index,
+        )
+
+
+def upper_bounds(cheap: pd.DataFrame, rank_by: str) -> np.ndarray:
+    """
+    Upper bound of the ten year kpis from the closed form rest debt. The rest
+    debt of the schedule differs from the closed form only by the rounding to
+    cents in every period, which is bounded by half a cent compounded.
+    """
+    period = cheap["period"].to_numpy()
+    gain_period = np.where(period >= 10, 10, period)
+    rate = cheap["interest_rate"].to_numpy()
+    annuity = cheap["annuity"].to_numpy()
+    loan_amount = cheap["loan"].to_numpy()
+    growth = (1 + rate) ** gain_period
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rest = np.where(
+            rate == 0,
+            loan_amount - annuity * gain_period,
+            loan_amount * growth - annuity * (growth - 1) / rate,
+        )
+    rounding = 0.005 * gain_period * growth + 0.01
+    rest_lower = np.where(loan_amount == 0, 0, rest - rounding)
+
+    proprietary_capital = cheap["proprietary_capital"].to_numpy()
+    gain = (
+        cheap["price"].to_numpy()
+        + cheap["modernisation"].to_numpy()
+        - proprietary_capital
+        - rest_lower
+        + 0.01
+        + gain_period * (cheap["net_annually"].to_numpy() - annuity)
+    )
+    if rank_by == "ten_year_net_capital_gain":
+        bound = gain
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bound = np.where(proprietary_capital == 0, 0, gain / proprietary_capital)
+    return np.where(np.isfinite(bound), bound, -np.inf)
+
+
+def screen(
+    listings: pd.DataFrame,
+    k: int,
+    interest_rate: float,
+    annuity: Optional[float] = None,
+    repayment_rate: Optional[float] = None,
+    period: Optional[float] = None,
+    rank_by: Literal[
+        "gross_rental_yield",
+        "net_rental_yield",
+        "return_on_equity",
+        "ten_year_net_capital_gain",
+        "ten_year_roe",
+    ] = "ten_year_roe",
+    filters: Iterable[Predicate] = (),
+    batch_size: int = 1024,
+) -> pd.DataFrame:
+    """
+    Top k listings by rank_by. The filters are predicates on the closed form
+    kpis (see closed_form_kpis). For the ten year kpis the candidates are
+    evaluated in the order of their upper bound and the search stops once no
+    remaining bound can enter the top k. The number of fully evaluated listings
+    is stored in attrs["evaluated"].
+    """
+    cheap = closed_form_kpis(listings, interest_rate, annuity, repayment_rate, period)
+    mask = np.isfinite(cheap["annuity"].to_numpy())
+    for predicate in filters:
+        mask &= np.asarray(predicate(cheap), dtype=bool)
+    candidates = cheap[mask]
+
+    if rank_by not in expensive_kpis:
+        values = candidates[rank_by].to_numpy()
+        values = np.where(np.isfinite(values), values, -np.inf)
+        top = np.argsort(-values, kind="stable")[:k]
+        result = candidates.iloc[top]
+        result.attrs["evaluated"] = 0
+        return result
+
+    bounds = upper_bounds(candidates, rank_by)
+    order = np.argsort(-bounds, kind="stable")
+    heap: list[tuple[float, int]] = []
+    evaluated = 0
+    exact: dict[int, dict] = {}
+
+    for start in range(0, len(order), batch_size):
+        if len(heap) == k and bounds[order[start]] <= heap[0][0]:
+            break
+        positions = order[start : start + batch_size]
+        batch = candidates.iloc[positions]
+        kpis = immo.batch.kpis(
+            {
+                "price": batch["price"].to_numpy(),
+                "modernisation": batch["modernisation"].to_numpy(),
+                "total": batch["total"].to_numpy(),
+                "proprietary_capital": batch["proprietary_capital"].to_numpy(),
+                "loan": batch["loan"].to_numpy(),
+            },
+            batch["net_annually"].to_numpy() / 12,
+            0,
+            0,
+            interest_rate,
+            batch["annuity"].to_numpy(),
+            batch["period"].to_numpy(),
+        )
+        evaluated += len(positions)
+        for i, position in enumerate(positions):
+            value = kpis[rank_by][i]
+            if not np.isfinite(value):
+                continue
+            entry = (value, int(position))
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+            else:
+                continue
+            exact[int(position)] = {name: kpis[name][i] for name in expensive_kpis}
+
+    top = [position for _, position in sorted(heap, reverse=True)]
+    result = candidates.iloc[top].copy()
+    for name in expensive_kpis:
+        result[name] = [exact[position][name] for position in top]
+    result.attrs["evaluated"] = evaluated
+    return result
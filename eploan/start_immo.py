@@ -5,15 +5,11 @@ from . import calculators
 from . import immo
 
 
-def start_immo() -> immo.Immo:
-    repay_rate = 0.08
-    annuity = 1400 * 12
-    interest_rate = 0.0325
-    period = 25
-
-    data_dir = Path("data")
-    cur_file = data_dir / "house.json"
-
+def start_immo(
+    cur_file: str | Path = Path("data") / "house.json",
+    interest_rate: float = 0.0325,
+    period: float = 25,
+) -> immo.Immo:
     with open(cur_file) as json_file:
         prop_data = json.load(json_file)
 
@@ -1,12 +1,23 @@
+import re
+
 from setuptools import setup, find_packages
 
+with open("eploan/__init__.py") as init_file:
+    version = re.search(r'^__version__ = "(.+)"$', init_file.read(), re.MULTILINE).group(1)
+
 setup(
     name="eploan",
-    version="0.1.0",
+    version=version,
     packages=find_packages(),
     install_requires=[
         "numpy", "pandas", "plotly"
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+    },
+    entry_points={
+        "console_scripts": ["eploan=eploan.cli:main"],
+    },
     author="Emanuel Pegler",
     author_email="manuel.pegler@gmail.com",
     description="A description of your project",
@@ -0,0 +1,10 @@
+import pytest
+
+from eploan import calculators
+
+from .data import house_props
+
+
+@pytest.fixture
+def house():
+    return calculators.calc_property_by_period(house_props, 0.03, 25)
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eploan import backtest, loan
+
+
+@pytest.fixture
+def rates():
+    index = pd.date_range("1990-01-01", periods=12 * 40, freq="MS")
+    return pd.Series(np.linspace(0.08, 0.01, len(index)), index=index, name="Rate")
+
+
+def test_read_rate_series(tmp_path):
+    path = tmp_path / "rates.csv"
+    pd.DataFrame(
+        {"date": ["2000-01-15", "2000-03-15", "2000-02-15"], "rate": [5.0, 4.0, 4.5]}
+    ).to_csv(path, index=False)
+
+    result = backtest.read_rate_series(path)
+
+    assert list(result.index) == list(pd.date_range("2000-01-01", periods=3, freq="MS"))
+    assert np.allclose(result, [0.05, 0.045, 0.04])
+
+
+def test_constant_rate_without_refinancing_matches_credit():
+    rates = np.full(12 * 12, 0.03)
+    result = backtest.backtest_arrays(rates, 100000, 0.02, fixed_years=10, horizon_years=10)
+
+    annuity = loan.annuity_from_repayment_rate(100000, 0.03, 0.02)
+    assert result["interest"].shape == (12 * 2 + 1,)
+    assert np.allclose(result["rest_dept"], loan.rest_dept(100000, 0.03, 10, annuity))
+    assert np.isnan(result["paid_off"]).all()
+
+
+def test_refinancing_uses_the_rate_at_the_end_of_the_fixed_period(rates):
+    result = backtest.backtest(rates, 100000, 0.02, fixed_years=10, horizon_years=30)
+
+    assert len(result) == 12 * 10 + 1
+    first = result.iloc[0]
+    arrays = backtest.backtest_arrays(rates.to_numpy(), 100000, 0.02, 10, 30)
+    assert np.allclose(arrays["segment_rates"][0], rates.iloc[[0, 120, 240]])
+    # falling rates lower the interest of later starts
+    assert result["Interest"].is_monotonic_decreasing
+    assert first["Initial Annuity"] == 10000
+
+
+def test_paid_off_within_the_horizon(rates):
+    mortgage = loan.Mortgage(100000, 0.05, 15000, _period=5, _repayment_rate=0.10)
+    result = backtest.backtest_mortgage(mortgage, rates, horizon_years=20)
+
+    assert (result["Rest Dept"] == 0).all()
+    assert (result["Paid Off"] <= 10).all()
+
+
+def test_mortgage_repayment_rate_follows_the_annuity(rates):
+    mortgage = loan.Mortgage(300000, 0.03, 12000)
+    result = backtest.backtest_mortgage(mortgage, rates, fixed_years=10)
+
+    # 12000 on 300000 at 3% is a 1% repayment rate, not the default 1.5
+    initial = np.round(300000 * (rates.iloc[: len(result)].to_numpy() + 0.01))
+    assert np.allclose(result["Initial Annuity"], initial)
@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from eploan import cache, calculators
+
+from .data import house_props
+
+
+@pytest.fixture
+def result_cache(tmp_path):
+    with cache.ResultCache(tmp_path / "results.sqlite", max_entries=3) as result_cache:
+        yield result_cache
+
+
+def test_cached_result_matches_calculator(result_cache: cache.ResultCache):
+    first = result_cache.calc_property(house_props, 0.03, period=25)
+    second = result_cache.calc_property(house_props, 0.03, period=25)
+
+    expected = calculators.calc_property_by_period(house_props, 0.03, 25)
+    assert first == second
+    assert first["eval"] == pytest.approx(expected.eval_dict())
+    assert result_cache.stats()["hits"] == 1
+    assert result_cache.stats()["hit_rate"] == 0.5
+
+
+def test_key_is_canonical():
+    reordered = {key: house_props[key] for key in reversed(list(house_props))}
+    assert cache.cache_key(house_props, 0.03, period=25) == cache.cache_key(reordered, 0.03, period=25)
+    assert cache.cache_key(house_props, 0.03, period=25) != cache.cache_key(house_props, 0.03, period=20)
+
+
+def test_key_is_equal_for_int_and_float_numbers():
+    as_float = {
+        **house_props,
+        "base_cost": {**house_props["base_cost"], "price": float(house_props["base_cost"]["price"])},
+    }
+    assert isinstance(house_props["base_cost"]["price"], int)
+    assert cache.cache_key(house_props, 0.03, period=25) == cache.cache_key(as_float, 0.03, period=25.0)
+    assert cache.cache_key({"flag": True}, 0.03, period=25) != cache.cache_key({"flag": 1}, 0.03, period=25)
+
+
+def test_lru_eviction(result_cache: cache.ResultCache):
+    for period in (10, 15, 20):
+        result_cache.calc_property(house_props, 0.03, period=period)
+    # touch the oldest entry, so 15 is evicted next
+    result_cache.calc_property(house_props, 0.03, period=10)
+    result_cache.calc_property(house_props, 0.03, period=25)
+
+    assert result_cache.stats()["entries"] == 3
+    assert result_cache.get(cache.cache_key(house_props, 0.03, period=15)) is None
+    assert result_cache.get(cache.cache_key(house_props, 0.03, period=10)) is not None
+
+
+def test_lookups_do_not_write(result_cache: cache.ResultCache):
+    result_cache.calc_property(house_props, 0.03, period=25)
+    changes = result_cache.connection.total_changes
+    for _ in range(3):
+        result_cache.calc_property(house_props, 0.03, period=25)
+
+    assert result_cache.connection.total_changes == changes
+    assert result_cache.stats()["total_hits"] == 3
+
+
+def _evaluate(args):
+    result_cache, period = args
+    return result_cache.calc_property(house_props, 0.03, period=period)["eval"]
+
+
+def test_shared_between_processes(tmp_path):
+    result_cache = cache.ResultCache(tmp_path / "shared.sqlite")
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_evaluate, [(result_cache, period) for period in [20, 25] * 8]))
+
+    assert results[0] == results[2]
+    stats = result_cache.stats()
+    assert stats["entries"] == 2
+    assert stats["total_hits"] + stats["total_misses"] == 16
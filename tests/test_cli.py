@@ -0,0 +1,111 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from eploan import calculators, cli
+
+from .data import house_props
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    (tmp_path / "house.json").write_text(json.dumps(house_props))
+    (tmp_path / "more.jsonl").write_text(
+        "\n".join(json.dumps(props) for props in [house_props, house_props]) + "\n"
+    )
+    return tmp_path
+
+
+def test_iter_properties_reads_directories_and_jsonl(inputs):
+    names = [name for name, _, _ in cli.iter_properties([str(inputs)])]
+    assert names == [
+        str(inputs / "house.json"),
+        f"{inputs / 'more.jsonl'}:1",
+        f"{inputs / 'more.jsonl'}:2",
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_main_writes_jsonl(inputs, tmp_path, workers):
+    output = tmp_path / "out.jsonl"
+    code = cli.main(
+        [str(inputs), "--interest-rate", "0.03", "--period", "25",
+         "--workers", str(workers), "-o", str(output)]
+    )
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    expected = calculators.calc_property_by_period(house_props, 0.03, 25).eval_dict()
+    assert code == 0
+    assert len(rows) == 3
+    assert all(row["10 Year RoE"] == expected["10 Year RoE"] for row in rows)
+
+
+def test_main_csv_profile_and_errors(inputs, tmp_path, capsys):
+    (inputs / "broken.json").write_text(json.dumps({"details": {}}))
+    code = cli.main(
+        [str(inputs), "--interest-rate", "0.03", "--repayment-rate", "0.02",
+         "--format", "csv", "--profile"]
+    )
+
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert code == 1
+    assert lines[0].startswith("Name,Loan,Annuity")
+    assert len(lines) == 4
+    assert "broken.json: TypeError" in captured.err
+    assert "calc_property" in captured.err
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_unreadable_inputs_are_reported(inputs, tmp_path, capsys, workers):
+    (inputs / "more.jsonl").write_text(
+        json.dumps(house_props) + "\n{not json\n" + json.dumps(house_props) + "\n"
+    )
+    (inputs / "broken.json").write_text("{")
+    code = cli.main(
+        [str(inputs), "--interest-rate", "0.03", "--period", "25",
+         "--workers", str(workers), "--chunksize", "1"]
+    )
+
+    captured = capsys.readouterr()
+    assert code == 1
+    assert len(captured.out.splitlines()) == 3
+    assert "broken.json: JSONDecodeError" in captured.err
+    assert "more.jsonl:2: JSONDecodeError" in captured.err
+
+
+def test_parallel_results_stream():
+    pulled = []
+
+    def properties():
+        for idx in range(100):
+            pulled.append(idx)
+            yield f"p{idx}", house_props, None
+
+    args = cli.build_parser().parse_args(
+        ["x", "--interest-rate", "0.03", "--period", "25", "--workers", "2", "--chunksize", "3"]
+    )
+    with cli.ProcessPoolExecutor(max_workers=2) as executor:
+        results = cli._results(properties(), args, ("period", 25), executor)
+        first = next(results)
+        assert first[0] == "p0"
+        assert len(pulled) <= 2 * 3
+        names = [first[0]] + [result[0] for result in results]
+    assert names == [f"p{idx}" for idx in range(100)]
+
+
+def test_import_does_not_load_plotly():
+    code = "import sys, eploan, eploan.cli; print(any(m.startswith('plotly') for m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("option", ["--chunksize", "--workers"])
+def test_counts_must_be_positive(inputs, option, capsys):
+    with pytest.raises(SystemExit):
+        cli.main([str(inputs), "--interest-rate", "0.03", "--period", "20", option, "0"])
+    assert "not a positive integer" in capsys.readouterr().err
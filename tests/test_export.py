@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eploan import export, loan
+
+
+@pytest.fixture
+def mortgages() -> list[loan.Mortgage]:
+    return [
+        loan.Mortgage(100000 + 1000 * i, interest_rate=0.03, _annuity=10000)
+        for i in range(25)
+    ]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_export_mortgages_csv(tmp_path, mortgages, compression):
+    path = tmp_path / "schedules.csv"
+    calls = []
+    rows = export.export_mortgages(
+        path,
+        (mortgage for mortgage in mortgages),
+        compression=compression,
+        chunk_size=10,
+        progress=lambda done, total: calls.append(done),
+    )
+
+    df = pd.read_csv(path, compression=compression)
+    assert rows == len(df)
+    assert calls == [10, 20, 25]
+    assert list(df.columns) == list(export.columns)
+
+    outlook = mortgages[12].outlook()
+    loan_12 = df[df["Loan"] == 12]
+    assert len(loan_12) == len(outlook)
+    assert np.allclose(loan_12["Credit Post"], outlook["Credit Post"].to_numpy(dtype=float), atol=0.01)
+
+
+def test_export_schedules_arrays(tmp_path):
+    path = tmp_path / "schedules.csv"
+    rows = export.export_schedules(path, [100000, 50000], 0.05, 15000, [10, 3], chunk_size=1)
+    assert rows == 13
+
+
+def test_export_parquet(tmp_path, mortgages):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "schedules.parquet"
+    rows = export.export_mortgages(path, mortgages, file_format="parquet", compression="zstd", chunk_size=7)
+    assert len(pd.read_parquet(path)) == rows
+
+
+def test_unknown_format(tmp_path, mortgages):
+    with pytest.raises(ValueError):
+        export.export_mortgages(tmp_path / "x", mortgages, file_format="xlsx")
@@ -31,3 +31,34 @@ def test_calc_property_by_repayment_rate(interest_rate: float, repayment_rate: f
     assert immo.mortgage.interest_rate == interest_rate
     assert immo.mortgage.repayment_rate == repayment_rate
     
+
+
+def test_compare_financing_matches_single_calculations():
+    offers = [
+        {"name": "annuity", "interest_rate": 0.03, "annuity": 18000},
+        {"name": "repayment", "interest_rate": 0.035, "repayment_rate": 0.02},
+        {"name": "period", "interest_rate": 0.04, "period": 25},
+        {"name": "short", "interest_rate": 0.04, "period": 8},
+    ]
+    table = calculators.compare_financing(house_props, offers)
+
+    expected = [
+        calculators.calc_property_by_annuity(house_props, 0.03, 18000),
+        calculators.calc_property_by_repayment_rate(house_props, 0.035, 0.02),
+        calculators.calc_property_by_period(house_props, 0.04, 25),
+        calculators.calc_property_by_period(house_props, 0.04, 8),
+    ]
+    assert list(table.index) == ["annuity", "repayment", "period", "short"]
+    for name, immo in zip(table.index, expected):
+        row = table.loc[name]
+        for key, value in immo.eval_dict().items():
+            assert row[key] == pytest.approx(value, abs=0.011)
+        assert row["Annuity"] == pytest.approx(immo.mortgage.annuity)
+        assert row["Repay Time Total"] == immo.mortgage.repay_time_total
+
+
+def test_compare_financing_requires_one_spec():
+    with pytest.raises(ValueError):
+        calculators.compare_financing(
+            house_props, [{"interest_rate": 0.03, "annuity": 18000, "period": 20}]
+        )
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from functools import lru_cache
+
+import pytest
+
+from eploan import calculators, immo, loan
+
+from .data import house_props
+
+
+def test_freeze_keeps_kpis_and_roundtrips(house):
+    frozen = immo.freeze(house)
+
+    assert frozen.eval_dict() == house.eval_dict()
+    assert frozen.base_cost.loan == house.base_cost.loan
+    assert frozen.thaw().eval_dict() == house.eval_dict()
+    assert immo.freeze(frozen.thaw()) == frozen
+    with pytest.raises(FrozenInstanceError):
+        frozen.base_cost.price = 1
+
+
+def test_updates_return_new_objects(house):
+    frozen = immo.freeze(house)
+    updated = frozen.with_update("base_cost", "price", "total", 400000)
+
+    house.update("base_cost", "price", "total", 400000)
+    assert frozen.base_cost.price != 400000
+    assert updated.mortgage.amount == updated.base_cost.loan
+    assert updated.eval_dict() == house.eval_dict()
+
+    edits = [("base_cost", "loan", "rate", 0.7), ("mortgage", "annuity", "-", 20000)]
+    fresh = calculators.calc_property_by_period(house_props, 0.03, 25)
+    assert frozen.with_updates(edits).eval_dict() == fresh.update_many(edits)
+
+
+@pytest.mark.parametrize(
+    "frozen_cls, mutable, method, value, attribute",
+    [
+        (immo.FrozenBaseCost, immo.BaseCost(100000), "with_agent_rate", -1, "agent_rate"),
+        (immo.FrozenCashFlow, immo.CashFlow(1000, 200, 100), "with_net_cold_rent", 900, "net_cold_rent"),
+    ],
+)
+def test_with_methods_apply_setters(frozen_cls, mutable, method, value, attribute):
+    frozen = frozen_cls.freeze(mutable)
+    setter = method.replace("with_", "set_")
+
+    getattr(mutable, setter)(value)
+    assert getattr(getattr(frozen, method)(value), attribute) == getattr(mutable, attribute)
+
+
+def test_frozen_mortgage(house):
+    frozen = loan.FrozenMortgage.freeze(house.mortgage)
+
+    assert frozen.repay_time_total == house.mortgage.repay_time_total
+    assert frozen.rest_dept_by_period(10) == house.mortgage.rest_dept_by_period(10)
+    house.mortgage.update_repayment_rate(0.03)
+    assert frozen.with_repayment_rate(0.03).annuity == house.mortgage.annuity
+
+
+def test_memoization_and_threads(house):
+    calls = []
+
+    @lru_cache
+    def ten_year_roe(frozen: immo.FrozenImmo) -> float:
+        calls.append(frozen)
+        return frozen.ten_year_roe()
+
+    frozen = immo.freeze(house)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(ten_year_roe, [frozen] * 8 + [immo.freeze(house)] * 8))
+
+    assert all(result == house.ten_year_roe() for result in results)
+    assert len(set(calls)) == 1
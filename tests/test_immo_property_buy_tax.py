@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from eploan import calculators, immo
+from eploan.immo import property_buy_tax
+
+
+@pytest.mark.parametrize(
+    ("postal_code", "state"),
+    [
+        ("10115", "Berlin"),
+        ("01067", "Sachsen"),
+        ("80331", "Bayern"),
+        ("20095", "Hamburg"),
+        ("28195", "Bremen"),
+        ("27568", "Bremen"),
+        ("50667", "Nordrhein-Westfalen"),
+        ("70173", "Baden-Württemberg"),
+        ("99084", "Thüringen"),
+        (66111, "Saarland"),
+    ],
+)
+def test_state_from_postal_code(postal_code, state: str):
+    assert property_buy_tax.state_from_postal_code(postal_code) == state
+
+
+def test_rates_from_postal_codes_vectorized():
+    codes = np.array(["10115", "80331", "00500", "abc", "", "123456"])
+    rates = property_buy_tax.rates_from_postal_codes(codes)
+
+    assert rates[0] == property_buy_tax.BE
+    assert rates[1] == property_buy_tax.BY
+    assert np.isnan(rates[2:]).all()
+
+
+def test_rates_from_postal_codes_fallback():
+    rates = property_buy_tax.rates_from_postal_codes(
+        [None, 39104], fallback=property_buy_tax.median()
+    )
+    assert rates.tolist() == [property_buy_tax.median(), property_buy_tax.ST]
+
+
+def test_details_federal_state():
+    assert immo.Details(living_space=80, postal_code="60311").federal_state == "Hessen"
+    assert immo.Details(living_space=80).federal_state is None
+
+
+def test_calculator_uses_postal_code_rate():
+    prop_data = {
+        "details": {"living_space": 100, "postal_code": "80331"},
+        "base_cost": {"price": 300000},
+        "cash_flow": {
+            "net_cold_rent": 1000,
+            "operating_expanses": 250,
+            "operating_income": 200,
+        },
+    }
+    house = calculators.calc_property_by_period(prop_data, 0.03, 25)
+    assert house.base_cost.property_buy_tax_rate == property_buy_tax.BY
@@ -0,0 +1,75 @@
+import pytest
+
+from eploan import calculators, immo
+
+from .data import house_props
+
+
+def test_branch_does_not_touch_base(house):
+    kpis = house.eval_dict()
+    scenario = immo.Scenario(house).branch([("base_cost", "price", "total", 300000)])
+
+    assert scenario.eval_dict() != kpis
+    assert house.eval_dict() == kpis
+    assert house.base_cost.price == 375000
+
+
+def test_layered_branches_match_updates(house):
+    cheaper = immo.Scenario(house).branch([("base_cost", "price", "total", 300000)])
+    more_rent = cheaper.branch([("cash_flow", "net cold rent", "monthly", 1200)])
+
+    expected = calculators.calc_property_by_period(house_props, 0.03, 25)
+    expected.update("base_cost", "price", "total", 300000)
+    expected.update("cash_flow", "net cold rent", "monthly", 1200)
+
+    assert more_rent.eval_dict() == expected.eval_dict()
+    assert more_rent.overrides == {("cash_flow", "net cold rent", "monthly"): 1200}
+
+
+def test_later_override_wins(house):
+    scenario = (
+        immo.Scenario(house)
+        .with_update("base_cost", "loan", "rate", 0.5)
+        .with_update("base_cost", "loan", "rate", 0.6)
+    )
+    assert scenario.materialize().base_cost.loan_rate == 0.6
+    assert len(scenario.flatten().overrides) == 1
+
+
+def test_compare_scenarios(house):
+    base = immo.Scenario(house, name="base")
+    scenarios = [
+        base,
+        base.branch([("mortgage", "interest rate", "-", 0.04)], name="rate up"),
+        base.branch([("base_cost", "price", "total", 300000)], name="cheaper"),
+    ]
+    table = immo.compare_scenarios(scenarios)
+
+    assert list(table.index) == ["base", "rate up", "cheaper"]
+    assert (table.loc["base", [c for c in table.columns if c.endswith("Diff")]] == 0).all()
+    assert table.loc["cheaper", "Gross Rental Yield Diff"] > 0
+
+
+def test_unknown_override_raises(house):
+    with pytest.raises(ValueError):
+        immo.Scenario(house).branch([("base_cost", "garden", "total", 1)])
+
+
+def test_edits_keep_their_order(house):
+    edits = [
+        ("base_cost", "price", "total", 300000),
+        ("base_cost", "agent", "total", 10000),
+        ("base_cost", "price", "total", 350000),
+    ]
+    expected = calculators.calc_property_by_period(house_props, 0.03, 25)
+    for edit in edits:
+        expected.update(*edit)
+
+    layered = immo.Scenario(house)
+    for edit in edits:
+        layered = layered.with_update(*edit)
+    single = immo.Scenario(house).branch(edits)
+
+    for scenario in (layered, single, layered.flatten()):
+        assert scenario.edits() == edits
+        assert scenario.materialize().base_cost.agent_rate == expected.base_cost.agent_rate
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from eploan import calculators, immo
+from eploan.immo import sensitivity
+
+from .data import house_props
+
+
+@pytest.fixture
+def houses():
+    return [
+        calculators.calc_property_by_period(house_props, 0.03, 25),
+        calculators.calc_property_by_repayment_rate(house_props, 0.04, 0.02),
+    ]
+
+
+def _arguments(houses):
+    args = {
+        "price": [house.base_cost.price for house in houses],
+        "modernisation": [house.base_cost.modernisation for house in houses],
+        "notary_rate": [house.base_cost.notary_rate for house in houses],
+        "property_buy_tax_rate": [house.base_cost.property_buy_tax_rate for house in houses],
+        "land_registry_rate": [house.base_cost.land_registry_rate for house in houses],
+        "agent_rate": [house.base_cost.agent_rate for house in houses],
+        "proprietary_capital_rate": [
+            house.base_cost.proprietary_capital_rate for house in houses
+        ],
+        "net_cold_rent": [house.cash_flow.net_cold_rent for house in houses],
+        "operating_expenses": [house.cash_flow.operating_expenses for house in houses],
+        "operating_income": [house.cash_flow.operating_income for house in houses],
+        "interest_rate": [house.mortgage.interest_rate for house in houses],
+        "annuity": [house.mortgage.annuity for house in houses],
+    }
+    return {name: np.array(values, dtype=float) for name, values in args.items()}
+
+
+def test_values_match_immo(houses):
+    duals = sensitivity.kpi_duals(
+        **_arguments(houses), period=[house.mortgage.period for house in houses]
+    )
+    for idx, house in enumerate(houses):
+        assert duals["gross_rental_yield"].value[idx] == pytest.approx(house.gross_rental_yield)
+        assert duals["return_on_equity"].value[idx] == pytest.approx(house.return_on_equity)
+        assert duals["ten_year_net_capital_gain"].value[idx] == pytest.approx(
+            house.ten_year_net_capital_gain(), abs=1
+        )
+
+
+def test_no_proprietary_capital_like_immo(houses):
+    args = _arguments(houses)
+    args["proprietary_capital_rate"][:] = 0
+    duals = sensitivity.kpi_duals(**args, period=[house.mortgage.period for house in houses])
+
+    for kpi in ("return_on_equity", "ten_year_roe"):
+        assert (duals[kpi].value == 0).all()
+        assert (duals[kpi].grad == 0).all()
+    assert np.isfinite(duals["ten_year_net_capital_gain"].value).all()
+
+
+def test_gradients_match_finite_differences(houses):
+    args = _arguments(houses)
+    period = [house.mortgage.period for house in houses]
+    duals = sensitivity.kpi_duals(**args, period=period)
+
+    for idx, name in enumerate(sensitivity.inputs):
+        step = 1e-6 * max(np.abs(args[name]).max(), 1)
+        up = sensitivity.kpi_duals(**{**args, name: args[name] + step}, period=period)
+        down = sensitivity.kpi_duals(**{**args, name: args[name] - step}, period=period)
+        for kpi, dual in duals.items():
+            numeric = (up[kpi].value - down[kpi].value) / (2 * step)
+            assert np.allclose(dual.grad[:, idx], numeric, rtol=1e-4, atol=1e-6), (kpi, name)
+
+
+def test_immo_sensitivities_frame(houses):
+    result = immo.sensitivity.immo_sensitivities(houses)
+
+    assert result.shape == (2 * len(sensitivity.inputs), 5)
+    assert result.loc[(0, "net_cold_rent"), "gross_rental_yield"] == pytest.approx(
+        12 / houses[0].base_cost.total, rel=1e-3
+    )
+    # a higher annuity repays more, but costs the cash flow of ten years
+    assert result.loc[(1, "annuity"), "net_rental_yield"] < 0
@@ -0,0 +1,27 @@
+import numpy as np
+
+from eploan import immo
+
+
+def test_without_risk_matches_deterministic_kpis(house):
+    no_risk = immo.RiskAssumptions(0, 0, 0, 0)
+    result = immo.simulate(house, n_paths=10, assumptions=no_risk, seed=1)
+
+    expected_cash = house.cash_flow.net_annually - house.mortgage.annuity
+    assert np.allclose(result.yearly_net_cash_flow, expected_cash)
+    assert np.allclose(result.ten_year_roe, house.ten_year_roe(), atol=1e-6)
+    assert result.shortfall_probability == (1.0 if expected_cash < 0 else 0.0)
+
+
+def test_reproducible_and_independent_of_workers(house):
+    first = immo.simulate(house, n_paths=3000, seed=42, chunk_size=1000)
+    second = immo.simulate(house, n_paths=3000, seed=42, chunk_size=1000, workers=2)
+
+    assert np.array_equal(first.yearly_net_cash_flow, second.yearly_net_cash_flow)
+    assert first.yearly_net_cash_flow.shape == (3000, 10)
+
+
+def test_risk_lowers_the_return(house):
+    result = immo.simulate(house, n_paths=5000, seed=3)
+    assert result.ten_year_roe.mean() < house.ten_year_roe()
+    assert list(result.summary().columns) == ["Q5", "Q50", "Q95"]
@@ -0,0 +1,40 @@
+import pytest
+
+from eploan import calculators
+
+from .data import house_props
+
+
+edits = [
+    ("base_cost", "price", "total", 350000),
+    ("base_cost", "notary", "rate", 0.02),
+    ("mortgage", "initial repayment rate", "-", 0.03),
+    ("base_cost", "loan", "rate", 0.7),
+    ("cash_flow", "net cold rent", "monthly", 1200),
+    ("cost_effectiveness", "price/sqm", "-", 3600),
+]
+
+
+def test_update_many_matches_single_updates(house):
+    expected = calculators.calc_property_by_period(house_props, 0.03, 25)
+    for edit in edits:
+        expected.update(*edit)
+
+    kpis = house.update_many(edits)
+
+    assert house == expected
+    assert kpis == expected.eval_dict()
+
+
+def test_update_many_syncs_loan(house):
+    house.update_many([("base_cost", "loan", "rate", 0.5)])
+    assert house.mortgage.amount == house.base_cost.loan
+
+
+def test_update_many_rejects_unknown_edit_before_applying(house):
+    price = house.base_cost.price
+    with pytest.raises(ValueError):
+        house.update_many(
+            [("base_cost", "price", "total", 1), ("base_cost", "garden", "total", 1)]
+        )
+    assert house.base_cost.price == price
@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+from eploan import calculators, ingest
+
+from .data import house_props
+
+
+@pytest.fixture
+def listings_csv(tmp_path):
+    df = pd.DataFrame(
+        {
+            "plz": ["80331", "10115", "01067", "50667", "20095"],
+            "living_space": [100, 80, 60, 90, 0],
+            "price": [375000, 300000, 150000, 250000, 200000],
+            "net_cold_rent": [1030, 900, -10, 800, 700],
+            "operating_expanses": [250, 200, 100, 200, 150],
+            "operating_income": [200, 150, 80, 150, 100],
+            "loan_rate": [0.8, 0.9, 0.8, 1.2, 0.8],
+        }
+    )
+    path = tmp_path / "listings.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_read_listings_validates_and_fills(listings_csv):
+    chunks = list(ingest.read_listings(listings_csv, chunksize=2, columns={"plz": "postal_code"}))
+
+    df = pd.concat(chunks)
+    # negative rent, loan rate > 1 and no living space are dropped
+    assert list(df.index) == [0, 1]
+    assert df.loc[0, "property_buy_tax_rate"] == 0.035
+    assert df.loc[1, "proprietary_capital_rate"] == pytest.approx(0.1)
+    assert str(df["postal_code"].dtype) == "string"
+
+
+def test_read_listings_raise(listings_csv):
+    with pytest.raises(ingest.InvalidListingError, match="negative net cold rent"):
+        list(ingest.read_listings(listings_csv, columns={"plz": "postal_code"}, errors="raise"))
+
+
+def test_evaluate_matches_calculators():
+    df = ingest.frame_from_prop_data([house_props])
+    result = ingest.evaluate_listings(df, 0.03, period=25)
+
+    expected = calculators.calc_property_by_period(house_props, 0.03, 25)
+    for key, value in expected.eval_dict().items():
+        assert result.loc[0, key] == pytest.approx(value, abs=0.011)
+
+
+def test_evaluate_csv_chunks(listings_csv):
+    results = list(
+        ingest.evaluate_csv(listings_csv, 0.03, repayment_rate=0.02, chunksize=2, columns={"plz": "postal_code"})
+    )
+    assert sum(len(result) for result in results) == 2
+    assert "10 Year RoE" in results[0].columns
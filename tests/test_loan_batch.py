@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from eploan import loan
+
+
+@pytest.mark.parametrize(
+    ("loan_amount", "interest_rate", "period", "annuity"),
+    [
+        (100000, 0.05, 10, 15000),
+        (300000, 0.0325, 25, 17000),
+        (100000, 0.05, 0, 15000),
+        (0, 0.05, 10, 15000),
+        (100000, 0.0, 5, 10000),
+    ],
+)
+def test_rest_dept_matches_scalar(loan_amount, interest_rate, period, annuity):
+    expected = loan.rest_dept(loan_amount, interest_rate, period, annuity)
+    result = loan.batch.rest_dept(loan_amount, interest_rate, period, annuity)
+    assert np.isclose(result[0], expected, atol=0.01)
+
+
+def test_amortize_matches_rest_dept_history():
+    amounts = np.array([100000, 250000, 50000])
+    rates = np.array([0.05, 0.03, 0.02])
+    annuities = np.array([15000, 14000, 6000])
+    periods = np.array([10, 25, 3])
+
+    schedules = loan.batch.amortize(amounts, rates, annuities, periods)
+
+    assert schedules.credit_post.shape == (3, 25)
+    assert schedules.periods.tolist() == [10, 25, 3]
+    for i in range(3):
+        hist = loan.rest_dept(amounts[i], rates[i], periods[i], annuities[i], hist=True)
+        n = periods[i]
+        assert np.allclose(schedules.interest[i, :n], hist["Interest"].to_numpy(dtype=float))
+        assert np.allclose(schedules.credit_post[i, :n], hist["Credit Post"].to_numpy(dtype=float), atol=0.01)
+        assert (schedules.credit_post[i, n:] == 0).all()
+
+
+def test_amortize_negative_interest_rate():
+    with pytest.raises(ValueError):
+        loan.batch.amortize([100000, 100000], [0.05, -0.01], 10000, 10)
+
+
+def test_annuity_from_period_broadcasts():
+    amounts = np.array([[100000], [200000]])
+    rates = np.array([0.03, 0.05])
+    result = loan.batch.annuity_from_period(amounts, rates, 10)
+
+    assert result.shape == (2, 2)
+    assert result[0, 1] == loan.annuity_from_period(100000, 0.05, 10)
+    assert result[1, 0] == loan.annuity_from_period(200000, 0.03, 10)
+
+
+def test_annuity_from_period_invalid_is_nan():
+    result = loan.batch.annuity_from_period(100000, [0.05, 0.05, 0.0], [10, 0, 10])
+    assert np.isnan(result[1])
+    assert result[2] == 10000
+
+
+def test_loan_period_masks_invalid_combinations():
+    annuities = np.array([6000, 5000, 4000, 0])
+    result = loan.batch.loan_period(100000, annuities, 0.05)
+    valid = loan.batch.loan_period_valid(100000, annuities, 0.05)
+
+    assert valid.tolist() == [True, False, False, False]
+    assert np.isclose(result[0], loan.loan_period(100000, 6000, 0.05))
+    assert np.isnan(result[1:]).all()
+
+
+def test_repayment_rate_round_trip():
+    amounts = np.array([100000, 250000, 0])
+    annuities = loan.batch.annuity_from_repayment_rate(amounts, 0.03, 0.02)
+    rates = loan.batch.repayment_rate_from_annuity(amounts, 0.03, annuities)
+
+    assert annuities[0] == loan.annuity_from_repayment_rate(100000, 0.03, 0.02)
+    assert np.allclose(rates[:2], 0.02)
+    assert np.isnan(rates[2])
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from eploan import immo, loan
+from eploan.immo import costs
+from eploan.loan import cents
+
+
+@pytest.mark.parametrize(
+    ("amount", "expected"),
+    [(0.285, 29), (1.005, 101), (-2.5, -250), (0.004, 0), (0.005, 1), (-0.005, -1)],
+)
+def test_to_cents_rounds_half_up(amount: float, expected: int):
+    assert cents.to_cents(amount) == expected
+
+
+def test_mul_rate_rounds_half_away_from_zero():
+    # 12345 cents * 5% = 617.25 cents, 10 cents * 5% = 0.5 cents
+    assert cents.mul_rate([12345, 10, -10], cents.scale_rates(0.05)).tolist() == [617, 1, -1]
+
+
+def test_amortize_cents_is_exact():
+    result = cents.amortize(
+        cents.to_cents([100000]), cents.scale_rates([0.05]), cents.to_cents([15000]), [10]
+    )
+    interest = result["interest"][0]
+    assert interest[0] == 500000
+    assert (result["credit_pre"][0] - result["repay"][0] == result["credit_post"][0]).all()
+    assert result["rest_dept"][0] == result["credit_post"][0, -1]
+
+
+def test_backends_agree_within_cents():
+    amounts = np.array([100000, 250000.55, 80000])
+    rates = np.array([0.05, 0.0325, 0.021])
+    annuities = np.array([15000, 14000, 5000])
+
+    float_rest = loan.batch.rest_dept(amounts, rates, 10, annuities)
+    cents_rest = loan.batch.rest_dept(amounts, rates, 10, annuities, backend="cents")
+    assert np.allclose(float_rest, cents_rest, atol=0.1)
+
+
+def test_base_cost_backends_match_base_cost():
+    base_cost = immo.BaseCost(price=375000.5, modernisation=1000, property_buy_tax_rate=0.05)
+    for backend in ("float", "cents"):
+        amounts = costs.base_cost_arrays(
+            [base_cost.price], [base_cost.modernisation], 0.05, backend=backend
+        )
+        assert amounts["total"][0] == base_cost.total
+        assert amounts["loan"][0] == base_cost.loan
+        assert amounts["agent"][0] == base_cost.agent
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        loan.batch.amortize(100000, 0.05, 15000, 10, backend="decimal")
+
+
+def test_mul_rate_large_amounts():
+    assert cents.mul_rate([10**11, -(10**11)], cents.scale_rates([1.0])).tolist() == [10**11, -(10**11)]
+    assert cents.mul_rate([10**15 + 5], cents.scale_rates([0.5])).tolist() == [5 * 10**14 + 3]
+    with pytest.raises(OverflowError):
+        cents.mul_rate([2**62], cents.scale_rates([4.0]))
+
+
+def test_base_cost_default_tax_rate_matches_float_backend():
+    float_amounts = immo.costs.base_cost_arrays(300000)
+    cents_amounts = cents.base_cost(300000)
+    assert cents.from_cents(cents_amounts["property_buy_tax"]) == pytest.approx(
+        float_amounts["property_buy_tax"]
+    )
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from eploan import loan
+
+
+@pytest.mark.parametrize(
+    ("installment", "installment_type", "kwargs"),
+    [(0, "fixed", {}), (1200, "fixed", {}), (1200, "dynamic", {"factor": 0.02})],
+)
+def test_detailed_matches_compound_interest(installment, installment_type, kwargs):
+    df = loan.compound_interest_detailed(10000, 0.05, 15, installment, installment_type, **kwargs)
+
+    assert list(df["Period"]) == list(range(1, 16))
+    for period in (1, 7, 15):
+        total, equity = loan.compound_interest(10000, 0.05, period, installment, installment_type, **kwargs)
+        row = df.iloc[period - 1]
+        assert row["Total"] == pytest.approx(total, abs=0.01)
+        assert row["Equity"] == pytest.approx(equity)
+
+
+def test_variable_rates_use_every_year():
+    rates = [0.1, -0.2, 0.05]
+    total, equity = loan.compound_growth(1000, rates)
+    assert total[-1] == pytest.approx(1000 * 1.1 * 0.8 * 1.05)
+    assert equity[-1] == 1000
+
+
+def test_monthly_compounding_with_contributions():
+    table = loan.compound_interest_table(0, 0.06, installment=100, years=2, compounding=12)
+
+    monthly = 0.0
+    for _ in range(24):
+        monthly = (monthly + 100) * 1.005
+    assert len(table) == 2
+    assert table["Equity"].iloc[-1] == 2400
+    assert table["Total"].iloc[-1] == pytest.approx(monthly, abs=0.01)
+
+
+def test_batch_of_plans():
+    rates = np.array([[0.05] * 10, [0.02] * 10])
+    total, equity = loan.compound_growth([1000, 2000], rates, installments=[[100], [50]])
+
+    assert total.shape == (2, 10)
+    assert total[0, -1] == pytest.approx(loan.compound_interest(1000, 0.05, 10, 100)[0], abs=0.01)
+    assert total[1, -1] == pytest.approx(loan.compound_interest(2000, 0.02, 10, 50)[0], abs=0.01)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from eploan import loan
+from eploan.loan import dates
+
+
+@pytest.fixture
+def mortgage() -> loan.Mortgage:
+    return loan.Mortgage(100000, interest_rate=0.05, _annuity=15000)
+
+
+def test_annual_outlook_matches_periods(mortgage: loan.Mortgage):
+    result = mortgage.dated_outlook("2024-01-01")
+    outlook = mortgage.outlook()
+
+    # the outlook stops with a rest, the dated schedule adds the final partial payment
+    n = len(outlook)
+    assert len(result) == n + 1
+    assert str(result.index[0].date()) == "2024-12-31"
+    assert str(result.index[1].date()) == "2025-12-31"
+    assert np.allclose(result["Credit Post"].iloc[:n], outlook["Credit Post"].to_numpy(dtype=float), atol=0.01)
+    final = result.iloc[-1]
+    assert final["Credit Post"] == 0
+    assert final["Repay"] + final["Interest"] < mortgage.annuity
+
+
+def test_monthly_schedule_month_end(mortgage: loan.Mortgage):
+    result = mortgage.dated_outlook("2024-01-01", frequency="monthly")
+
+    assert len(result) == np.ceil(loan.loan_period(100000, 15000 / 12, 0.05 / 12))
+    assert str(result.index[1].date()) == "2024-02-29"
+    assert np.isclose(result["Interest"].iloc[0], 100000 * 0.05 / 12)
+
+
+@pytest.mark.parametrize("annuity", [14000, 14500])
+@pytest.mark.parametrize("frequency", ["monthly", "quarterly"])
+def test_schedule_stops_when_repaid(annuity, frequency):
+    result = loan.Mortgage(100000, 0.05, annuity).dated_outlook("2024-01-01", frequency=frequency)
+
+    assert result["Credit Post"].iloc[-1] == pytest.approx(0)
+    assert (result["Credit Post"] >= 0).all()
+    assert (result["Interest"] > 0).all()
+    payments = result["Repay"] + result["Interest"]
+    # no payment exceeds the regular installment
+    assert payments.max() == pytest.approx(payments.iloc[0])
+
+
+def test_partial_first_period(mortgage: loan.Mortgage):
+    result = mortgage.dated_outlook("2024-03-17", frequency="quarterly", month_end=False)
+
+    stub = result.iloc[0]
+    assert stub["Period"] == 0
+    assert str(result.index[0].date()) == "2024-03-31"
+    assert np.isclose(stub["Interest"], 100000 * 0.05 * 15 / 365)
+    assert str(result.index[1].date()) == "2024-07-01"
+
+
+def test_portfolio_schedule_and_fiscal_year():
+    schedule = dates.dated_schedules(
+        loan_amounts=[100000, 200000],
+        interest_rates=[0.05, 0.03],
+        annuities=[15000, 20000],
+        years=[9, 13],
+        start_dates=["2020-01-01", "2022-07-01"],
+        frequency="monthly",
+    )
+    assert schedule.index.is_monotonic_increasing
+    assert set(schedule["Loan"]) == {0, 1}
+
+    fiscal = dates.slice_fiscal_year(schedule, 2022, start_month=7)
+    assert fiscal.index.min() >= np.datetime64("2022-07-01")
+    assert fiscal.index.max() < np.datetime64("2023-07-01")
+    assert len(fiscal) == 24
+    assert (dates.fiscal_years(fiscal.index.values, start_month=7) == 2022).all()
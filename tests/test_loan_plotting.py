@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from eploan import loan
+from eploan.loan import plotting
+
+
+def test_downsample_reduces_to_budget():
+    x = np.arange(10_000)
+    y = np.ones(10_000)
+    balance = np.arange(10_000, 0, -1, dtype=float)
+
+    x_down, ys = plotting.downsample(x, {"y": y, "balance": balance}, 100, last=("balance",))
+
+    assert len(x_down) == 100
+    assert np.allclose(ys["y"], 1)
+    assert ys["balance"][-1] == balance[-1]
+
+
+def test_downsample_keeps_short_series():
+    x, ys = plotting.downsample(np.arange(5), {"y": np.arange(5)}, 100)
+    assert len(x) == 5
+    assert ys["y"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_credit_repay_figure_is_cached():
+    plotting.clear_cache()
+    res_df = loan.rest_dept(100000, 0.05, 10, 15000, hist=True)
+
+    first = plotting.credit_repay_figure_json(res_df)
+    second = plotting.credit_repay_figure_json(res_df.copy())
+
+    assert first is second
+    assert len(plotting.plot_credit_repay(res_df).data) == 3
+
+
+def test_large_timeline_uses_webgl():
+    n = 5000
+    timeline = pd.DataFrame(
+        {
+            "Interest": np.full(n, 10.0),
+            "Repay": np.full(n, 20.0),
+            "Rest Dept": np.linspace(1000, 0, n),
+        },
+        index=pd.Index(np.arange(n), name="Year"),
+    )
+    fig = plotting.plot_timeline(timeline, max_points=2000, webgl_threshold=1000)
+
+    assert all(trace.type == "scattergl" for trace in fig.data)
+    assert len(fig.data[0].x) <= 2000
+
+
+def test_timeline_with_dates():
+    plotting.clear_cache()
+    months = pd.date_range("2024-01-01", periods=24, freq="MS", name="Month")
+    timeline = pd.DataFrame(
+        {
+            "Interest": np.full(24, 10.0),
+            "Repay": np.full(24, 20.0),
+            "Rest Dept": np.linspace(1000, 0, 24),
+        },
+        index=months,
+    )
+
+    fig = plotting.plot_timeline(timeline, x="Month")
+    assert pd.Timestamp(fig.data[0].x[0]) == months[0]
+    shifted = timeline.set_axis(months + pd.DateOffset(years=1))
+    assert plotting.timeline_figure_json(shifted, x="Month") != plotting.timeline_figure_json(
+        timeline, x="Month"
+    )
+
+    periods = timeline.set_axis(months.to_period("M"))
+    fig = plotting.plot_timeline(periods, x="Month")
+    assert pd.Timestamp(fig.data[0].x[0]) == months[0]
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from eploan import loan
+
+
+@pytest.fixture
+def mortgage() -> loan.Mortgage:
+    return loan.Mortgage(100000, interest_rate=0.05, _annuity=15000)
+
+
+def test_schedule_matches_outlook(mortgage: loan.Mortgage):
+    schedule = mortgage.schedule()
+    outlook = mortgage.outlook()
+
+    df = schedule.to_pandas()
+    assert list(df.columns) == list(outlook.columns)
+    assert len(df) == len(outlook)
+    assert df["Period"].dtype == np.int64
+    assert np.allclose(df["Credit Post"], outlook["Credit Post"].to_numpy(dtype=float), atol=0.01)
+
+
+def test_to_pandas_is_zero_copy(mortgage: loan.Mortgage):
+    schedule = mortgage.schedule()
+    df = schedule.to_pandas()
+    assert np.shares_memory(df["Interest"].to_numpy(), schedule.data)
+
+
+def test_float32_schedule(mortgage: loan.Mortgage):
+    schedule = mortgage.schedule(float_type=np.float32, int_type=np.int32)
+    assert schedule.data.dtype["Interest"] == np.float32
+    assert schedule.nbytes < mortgage.schedule().nbytes
+
+
+def test_slice_and_stack():
+    first = loan.Schedule.from_loans([100000, 50000], 0.05, 15000, [10, 3])
+    second = loan.Schedule.from_loans(80000, 0.03, 10000, 9)
+
+    stacked = loan.Schedule.stack([first, second])
+    assert len(stacked) == 22
+    assert stacked.n_loans == 3
+    assert len(stacked.loan(2)) == 9
+    assert len(stacked.periods(1, 3)) == 9
+    assert np.allclose(
+        stacked.rest_dept(),
+        [loan.rest_dept(100000, 0.05, 10, 15000), loan.rest_dept(50000, 0.05, 3, 15000), loan.rest_dept(80000, 0.03, 9, 10000)],
+        atol=0.01,
+    )
+
+
+def test_trailing_zero_loan_is_counted():
+    first = loan.Schedule.from_loans([100000, 0], 0.05, 15000, 10)
+    second = loan.Schedule.from_loans(80000, 0.03, 10000, 9)
+    assert first.n_loans == 2
+
+    stacked = loan.Schedule.stack([first, second])
+    assert stacked.n_loans == 3
+    assert len(stacked.loan(1)) == 0
+    assert len(stacked.loan(2)) == 9
+    assert len(stacked.rest_dept()) == 3
+    assert stacked.rest_dept()[1] == 0
+
+
+def test_stack_mixed_dtypes(mortgage: loan.Mortgage):
+    small = mortgage.schedule(float_type=np.float32, int_type=np.int32)
+    stacked = loan.Schedule.stack([small, mortgage.schedule()])
+    assert stacked.data.dtype == loan.schedule.schedule_dtype()
+    assert np.allclose(stacked.loan(0)["Credit Post"], small["Credit Post"])
+    assert np.array_equal(stacked.loan(1)["Credit Post"], mortgage.schedule()["Credit Post"])
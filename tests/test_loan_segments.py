@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from eploan import loan
+
+
+@pytest.fixture
+def mortgage():
+    return loan.Mortgage(100000, interest_rate=0.05, _annuity=8000)
+
+
+def test_without_changes_matches_outlook(mortgage):
+    schedule = mortgage.segmented()
+    expected = mortgage.outlook()
+
+    result = schedule.outlook()
+    assert schedule.repay_time_total == mortgage.repay_time_total
+    for name in ["Credit Pre", "Interest", "Repay", "Credit Post"]:
+        assert np.allclose(result[name], expected[name].astype(float), atol=0.05)
+
+
+def test_rate_change_keeps_the_prefix(mortgage):
+    schedule = mortgage.segmented()
+    before = schedule.outlook()
+
+    schedule.change(11, interest_rate=0.03)
+    after = schedule.outlook()
+
+    prefix = after.iloc[:10]
+    assert np.array_equal(prefix["Credit Post"], before["Credit Post"].iloc[:10])
+    rest = loan.rest_dept(100000, 0.05, 10, 8000)
+    assert after["Credit Pre"].iloc[10] == pytest.approx(rest, abs=0.05)
+    assert schedule.rest_dept(15) == pytest.approx(
+        loan.rest_dept(rest, 0.03, 5, 8000), abs=0.05
+    )
+    assert (after["Interest Rate"].iloc[10:] == 0.03).all()
+    assert schedule.repay_time_total < len(before)
+
+
+def test_edits_recompute_only_the_suffix(mortgage):
+    schedule = mortgage.segmented()
+    schedule.change(11, interest_rate=0.03)
+    schedule.outlook()
+    computed = schedule.computed_periods
+
+    schedule.change(16, annuity=12000)
+    schedule.outlook()
+    assert schedule.computed_periods - computed == schedule.repay_time_total - 15
+    computed = schedule.computed_periods
+
+    # reverting and redoing an edit reuses the cached segments
+    schedule.remove_change(16)
+    reverted = schedule.outlook()
+    assert schedule.computed_periods - computed == len(reverted) - 15
+    computed = schedule.computed_periods
+
+    schedule.change(16, annuity=12000)
+    schedule.outlook()
+    assert schedule.computed_periods == computed
+    assert list(schedule.changes) == [1, 11, 16]
+
+
+def test_annuity_must_pay_off_the_loan(mortgage):
+    schedule = mortgage.segmented().change(5, annuity=100)
+    with pytest.raises(ValueError):
+        schedule.outlook()
+
+
+def test_segmented_records_the_fixed_period(mortgage):
+    schedule = mortgage.segmented()
+    assert schedule.fixed_period == mortgage.period
+    assert list(schedule.changes) == [1, mortgage.period + 1]
+
+
+def test_no_segments_after_payoff(mortgage):
+    schedule = mortgage.segmented()
+    schedule.outlook()
+    schedule.change(30, interest_rate=0.02).change(40, annuity=5000)
+
+    result = schedule.outlook()
+    assert schedule.repay_time_total == mortgage.repay_time_total
+    assert len(result) == mortgage.repay_time_total
+    assert all(segment.periods > 0 for segment in schedule.segments)
+
+
+def test_cache_is_bounded(mortgage):
+    schedule = mortgage.segmented()
+    schedule.cache_size = 4
+    for rate in np.linspace(0.01, 0.04, 10):
+        schedule.change(11, interest_rate=rate).outlook()
+    assert len(schedule._cache) == 4
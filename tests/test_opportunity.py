@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from eploan import calculators, loan, opportunity
+
+from .data import house_props
+
+
+def test_property_wealth_matches_ten_year_gain(house):
+    table = opportunity.buy_vs_invest([house], horizon=30, invest_rate=0.05)
+
+    wealth = table.loc[(0, 10), "Property Wealth"]
+    expected = house.ten_year_net_capital_gain() + house.base_cost.proprietary_capital
+    assert wealth == pytest.approx(expected, abs=0.02)
+    assert len(table) == 30
+
+
+def test_invest_wealth_without_cash_difference():
+    result = opportunity.buy_vs_invest_arrays(
+        price=100000,
+        modernisation=0,
+        proprietary_capital=100000,
+        loan_amount=0,
+        interest_rate=0.03,
+        annuity=0,
+        repay_periods=0,
+        net_annually=0,
+        horizon=5,
+        invest_rate=0.05,
+    )
+    assert result["property_wealth"][0].tolist() == [100000] * 5
+    assert result["invest_wealth"][0, -1] == pytest.approx(loan.compound_interest(100000, 0.05, 5)[0])
+
+
+def test_batch_and_break_even(house):
+    cheap = calculators.calc_property_by_period(
+        {**house_props, "base_cost": {**house_props["base_cost"], "price": 200000}}, 0.03, 25
+    )
+    table = opportunity.buy_vs_invest([house, cheap], horizon=40, invest_rate=0.04, appreciation=0.02)
+
+    assert len(table) == 80
+    assert table.loc[(1, 40), "Advantage"] > table.loc[(0, 40), "Advantage"]
+
+
+def test_break_even_horizon():
+    advantage = np.array([[-3, 1, -1, 2, 3], [-1, -1, -1, -1, -1], [1, 1, 1, 1, 1]])
+    assert opportunity.break_even_horizon(advantage).tolist() == [4, 0, 1]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from eploan import calculators, optimize
+
+from .data import house_props
+
+
+def test_ten_year_irr_of_a_bond():
+    kpis = {
+        "annual_cash_flow": np.array([10.0]),
+        "gain_period": np.array([10.0]),
+        # terminal value 100: gain = terminal - equity + period * cash flow
+        "ten_year_net_capital_gain": np.array([100.0]),
+    }
+    assert optimize.ten_year_irr(kpis, np.array([100.0]))[0] == pytest.approx(0.1)
+
+
+def test_optimum_beats_the_coarse_grid():
+    result = optimize.optimize_financing(house_props, 0.03)
+
+    assert 0.05 <= result["equity_share"] <= 0.95
+    assert result["monthly_cash_flow"] >= 0
+    for share in (0.2, 0.5, 0.8):
+        for repayment_rate in (0.01, 0.02, 0.05):
+            prop_data = {
+                **house_props,
+                "base_cost": {
+                    **house_props["base_cost"],
+                    "proprietary_capital_rate": share,
+                    "loan_rate": 1 - share,
+                },
+            }
+            cur_immo = calculators.calc_property_by_repayment_rate(prop_data, 0.03, repayment_rate)
+            if cur_immo.cash_flow.net_annually - cur_immo.mortgage.annuity >= 0:
+                assert cur_immo.ten_year_roe() <= result["objective"] + 1e-9
+
+
+def test_constraints_are_respected():
+    result = optimize.optimize_financing(
+        house_props, 0.03, by="period", max_annuity=15000, objective="ten_year_irr"
+    )
+    assert result["annuity"] <= 15000
+    assert result["period"] == int(result["period"])
+
+
+def test_infeasible_problem():
+    result = optimize.optimize_financing(house_props, 0.03, max_annuity=1)
+    assert result["equity_share"] is None
+
+
+def test_optimize_batch():
+    table = optimize.optimize_batch([house_props, house_props], 0.03, refine_steps=1)
+    assert len(table) == 2
+    assert table["objective"].iloc[0] == table["objective"].iloc[1]
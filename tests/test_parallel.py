@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eploan import ingest, parallel
+
+from .data import house_props
+
+
+@pytest.fixture
+def listings():
+    df = ingest.frame_from_prop_data([house_props] * 50)
+    df["price"] = np.linspace(200000, 500000, len(df))
+    return df
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with parallel.EvaluationPool(workers=2) as cur_pool:
+        yield cur_pool
+
+
+def test_matches_serial_evaluation(pool, listings):
+    result = pool.evaluate(listings, 0.03, period=25, chunk_size=7)
+    expected = ingest.evaluate_listings(listings, 0.03, period=25)
+
+    pd.testing.assert_frame_equal(result, expected[parallel.output_columns])
+
+
+def test_pool_is_reused_and_grows(pool, listings):
+    pool.evaluate(listings.iloc[:10], 0.03, repayment_rate=0.02)
+    capacity = pool.capacity
+    first = pool.evaluate(listings, 0.04, repayment_rate=0.02, chunk_size=16)
+
+    assert pool.capacity >= len(listings) >= capacity
+    second = pool.evaluate(listings.iloc[:5], 0.04, repayment_rate=0.02)
+    assert pool.capacity == first.shape[0]
+    pd.testing.assert_frame_equal(second, first.iloc[:5])
+
+
+def test_financing_must_be_unique(pool, listings):
+    with pytest.raises(ValueError):
+        pool.evaluate(listings, 0.03, annuity=10000, period=25)
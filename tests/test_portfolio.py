@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from eploan import immo, loan, portfolio
+
+
+@pytest.fixture
+def mortgages():
+    return [
+        loan.Mortgage(100000, interest_rate=0.05, _annuity=15000),
+        loan.Mortgage(200000, interest_rate=0.03, _annuity=20000),
+    ]
+
+
+def test_timeline_aligns_start_years(mortgages):
+    result = portfolio.mortgage_timeline(mortgages, start_years=[2020, 2023])
+
+    first = mortgages[0].outlook()
+    second = mortgages[1].outlook()
+
+    assert result.index[0] == 2020
+    assert result.index[-1] == 2022 + len(second)
+    assert np.isclose(result.loc[2020, "Interest"], first["Interest"].iloc[0])
+    assert np.isclose(
+        result.loc[2023, "Interest"],
+        first["Interest"].iloc[3] + second["Interest"].iloc[0],
+    )
+    assert np.isclose(
+        result["Interest"].sum(), first["Interest"].sum() + second["Interest"].sum()
+    )
+
+
+def test_timeline_cash_flows(mortgages):
+    cash_flows = [
+        immo.CashFlow(net_cold_rent=1000, operating_expenses=200, operating_income=100),
+        immo.CashFlow(net_cold_rent=2000, operating_expenses=300, operating_income=100),
+    ]
+    result = portfolio.mortgage_timeline(
+        mortgages, [2020, 2023], cash_flows=cash_flows, end_year=2030
+    )
+
+    assert result.index[-1] == 2030
+    assert result.loc[2021, "Net Cash Flow"] == cash_flows[0].net_annually
+    assert result.loc[2030, "Net Cash Flow"] == (
+        cash_flows[0].net_annually + cash_flows[1].net_annually
+    )
+
+
+def test_timeline_many_loans():
+    n = 5000
+    rng = np.random.default_rng(0)
+    result = portfolio.timeline(
+        loan_amounts=rng.uniform(1e5, 5e5, n),
+        interest_rates=rng.uniform(0.01, 0.05, n),
+        annuities=rng.uniform(0.06, 0.1, n) * 5e5,
+        periods=rng.integers(5, 30, n),
+        start_years=rng.integers(1995, 2025, n),
+    )
+    assert result.index.is_monotonic_increasing
+    assert (result["Annuity"] > 0).all()
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eploan import calculators, ingest, report
+
+from .data import house_props
+
+
+@pytest.fixture
+def houses():
+    return [
+        calculators.calc_property_by_period(house_props, 0.03, 25),
+        calculators.calc_property_by_repayment_rate(house_props, 0.04, 0.02),
+    ]
+
+
+def test_immo_report_matches_summaries(houses):
+    result = report.immo_report(houses, index=["a", "b"])
+
+    assert list(result.columns) == list(report.columns)
+    for name, house in zip(result.index, houses):
+        row = result.loc[name]
+        assert np.allclose(row["Base Cost"], house.base_cost.summary()["Total"])
+        assert np.allclose(
+            row["Cash Flow"], house.cash_flow.summary(house.mortgage.annuity)["Monthly"]
+        )
+        assert np.allclose(row["Mortgage"], list(house.mortgage.summary_dict().values()))
+        assert np.allclose(row["KPIs"], list(house.eval_dict().values()))
+
+
+def test_listings_report_matches_immo_report(houses):
+    df = ingest.frame_from_prop_data([house_props])
+    result = report.listings_report(df, 0.03, period=25)
+
+    expected = report.immo_report(houses[:1])
+    pd.testing.assert_frame_equal(result, expected, atol=0.011)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".csv.gz", ".parquet"])
+def test_write_and_read_report(tmp_path, houses, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    path = tmp_path / f"report{suffix}"
+    result = report.immo_report(houses)
+
+    report.write_report(result, path)
+    pd.testing.assert_frame_equal(report.read_report(path), result, check_names=False)
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eploan import immo, ingest, screening
+
+
+@pytest.fixture
+def listings() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    n = 3000
+    living_space = rng.uniform(40, 150, n)
+    return ingest.normalize(
+        pd.DataFrame(
+            {
+                "living_space": living_space,
+                "price": living_space * rng.uniform(2000, 6000, n),
+                "net_cold_rent": living_space * rng.uniform(8, 16, n),
+                "operating_expanses": rng.uniform(100, 300, n),
+                "operating_income": rng.uniform(50, 250, n),
+            }
+        )
+    )
+
+
+def brute_force(listings: pd.DataFrame, rank_by: str) -> np.ndarray:
+    cheap = screening.closed_form_kpis(listings, 0.035, repayment_rate=0.02)
+    kpis = immo.batch.kpis(
+        {name: cheap[name].to_numpy() for name in ("price", "modernisation", "total", "proprietary_capital", "loan")},
+        cheap["net_annually"].to_numpy() / 12,
+        0,
+        0,
+        0.035,
+        cheap["annuity"].to_numpy(),
+        cheap["period"].to_numpy(),
+    )
+    return kpis[rank_by]
+
+
+@pytest.mark.parametrize("rank_by", ["ten_year_roe", "ten_year_net_capital_gain"])
+def test_screen_matches_brute_force(listings: pd.DataFrame, rank_by: str):
+    result = screening.screen(listings, k=20, interest_rate=0.035, repayment_rate=0.02, rank_by=rank_by)
+
+    values = brute_force(listings, rank_by)
+    expected = np.sort(values[np.isfinite(values)])[::-1][:20]
+    assert np.allclose(result[rank_by].to_numpy(), expected)
+    assert result.attrs["evaluated"] < len(listings)
+
+
+def test_screen_with_filters_and_cheap_rank(listings: pd.DataFrame):
+    result = screening.screen(
+        listings,
+        k=10,
+        interest_rate=0.035,
+        repayment_rate=0.02,
+        rank_by="gross_rental_yield",
+        filters=[lambda kpis: kpis["price_per_sqm"] < 3000],
+    )
+    assert len(result) == 10
+    assert (result["price_per_sqm"] < 3000).all()
+    assert result["gross_rental_yield"].is_monotonic_decreasing
+    assert result.attrs["evaluated"] == 0